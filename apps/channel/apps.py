@@ -1,5 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class ChannelConfig(AppConfig):
-    name = "channel"
+    name = "apps.channel"
+
+    def ready(self):
+        from apps.channel import name_index
+        from apps.channel.models import Channel
+
+        post_save.connect(name_index.channel_saved, sender=Channel)
+        post_delete.connect(name_index.channel_deleted, sender=Channel)
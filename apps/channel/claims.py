@@ -0,0 +1,159 @@
+"""
+# 구독 채널 claim
+* access token에 구독 중인 채널 id 집합(`sub_ch`)과 버전(`ch_ver`)을 넣어,
+  공지/일정 조회 시 권한 확인을 DB 조회 없이 처리함
+* 채널 id 집합은 정렬 후 차이값을 varint로 인코딩한 뒤 base64url로 담음
+* 구독 상태가 바뀌면 유저의 버전을 바꾸고, 버전이 다른 토큰은 DB로 확인함
+  * 버전은 `User.channel_claims_version`에 저장하고 공유 캐시에 올려 둠 (apps/user/versions.py)
+"""
+import base64
+
+from django.conf import settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.user import versions
+
+SUBSCRIBED_CLAIM = "sub_ch"
+VERSION_CLAIM = "ch_ver"
+
+
+def encode_ids(ids):
+    """
+    # 정수 id 집합을 정렬된 차이값의 varint 바이트열로 인코딩
+    """
+    buffer = bytearray()
+    previous = 0
+    for value in sorted(set(ids)):
+        delta = value - previous
+        previous = value
+        while delta >= 0x80:
+            buffer.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        buffer.append(delta)
+    return base64.urlsafe_b64encode(bytes(buffer)).rstrip(b"=").decode()
+
+
+def decode_ids(encoded):
+    """
+    # `encode_ids`로 인코딩한 문자열을 id 집합으로 디코딩
+    """
+    data = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+    ids = []
+    current = delta = shift = 0
+    for byte in data:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += delta
+        ids.append(current)
+        delta = shift = 0
+    return frozenset(ids)
+
+
+def get_version(user_id):
+    return versions.get_version(versions.CHANNEL_CLAIMS_VERSION, user_id)
+
+
+def bump_version(*user_ids):
+    """
+    # 유저들의 구독 claim을 무효화
+    * 구독, 구독 취소, 구독 수락 등 구독 상태가 바뀔 때 호출
+    """
+    versions.bump_versions(versions.CHANNEL_CLAIMS_VERSION, user_ids)
+
+
+def with_channel_claims(access, user_id):
+    """
+    # 인코딩된 access token에 구독 채널 claim을 넣어 다시 인코딩
+    * `CHANNEL_CLAIMS_ENABLED`가 꺼져 있으면 그대로 반환
+    * 구독 채널이 `CHANNEL_CLAIMS_MAX_IDS`개보다 많으면 claim을 넣지 않고 DB로 확인하게 함
+    """
+    if not settings.CHANNEL_CLAIMS_ENABLED:
+        return access
+
+    from apps.channel.models import UserChannel
+
+    version = get_version(user_id)
+    channel_ids = list(
+        UserChannel.objects.filter(user_id=user_id).values_list("channel_id", flat=True)
+    )
+    if len(channel_ids) > settings.CHANNEL_CLAIMS_MAX_IDS:
+        return access
+
+    token = AccessToken(access, verify=False)
+    token[SUBSCRIBED_CLAIM] = encode_ids(channel_ids)
+    token[VERSION_CLAIM] = version
+    return str(token)
+
+
+def subscribed_channel_ids(request):
+    """
+    # 토큰의 구독 채널 id 집합
+    * claim이 없거나 버전이 바뀌었으면 `None`
+    * 한 요청 안에서는 결과를 재사용함
+    """
+    if not hasattr(request, "_subscribed_channel_ids"):
+        token = request.auth
+        channel_ids = None
+        if (
+            token is not None
+            and SUBSCRIBED_CLAIM in token
+            and token.get(VERSION_CLAIM) == get_version(request.user.id)
+        ):
+            channel_ids = decode_ids(token[SUBSCRIBED_CLAIM])
+        request._subscribed_channel_ids = channel_ids
+    return request._subscribed_channel_ids
+
+
+def is_subscriber(request, channel):
+    """
+    # 요청한 유저가 채널을 구독 중인지 확인
+    * 토큰의 claim이 최신이면 DB 조회 없이 답하고, 아니면 DB로 확인함
+    """
+    if not request.user.is_authenticated:
+        return False
+
+    channel_ids = subscribed_channel_ids(request)
+    if channel_ids is not None:
+        return channel.id in channel_ids
+
+    return channel.subscribers.filter(id=request.user.id).exists()
+
+
+def can_read(request, channel):
+    """
+    # 채널의 공지/일정을 볼 수 있는지 확인
+    * 공개 채널이거나, 매니저이거나, 구독 중이면 볼 수 있음
+    """
+    return (
+        not channel.is_private
+        or channel.managers_id == request.user.id
+        or is_subscriber(request, channel)
+    )
+
+
+def readable(request, prefix="channel__"):
+    """
+    # `can_read`를 쿼리 조건(`Q`)으로 만든 것
+    * 여러 채널의 공지/일정을 한 번에 읽을 때 권한 확인을 같은 쿼리 안에서 처리함
+    * 토큰의 claim이 최신이면 구독 채널 id를 그대로, 아니면 subquery로 넣음
+    """
+    from django.db.models import Q
+
+    from apps.channel.models import UserChannel
+
+    condition = Q(**{f"{prefix}is_private": False})
+    if not request.user.is_authenticated:
+        return condition
+
+    channel_ids = subscribed_channel_ids(request)
+    if channel_ids is None:
+        channel_ids = UserChannel.objects.filter(user_id=request.user.id).values(
+            "channel_id"
+        )
+    return (
+        condition
+        | Q(**{f"{prefix}managers_id": request.user.id})
+        | Q(**{f"{prefix}id__in": channel_ids})
+    )
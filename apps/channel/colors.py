@@ -0,0 +1,24 @@
+"""
+# 유저가 채널마다 지정한 색 목록(`users/me/colors/`)과 ETag
+* ETag는 색 목록(`(채널 id, 색)` row)의 hash라서, 어느 worker가 답하든 캐시가 비워지든
+  같은 목록이면 같은 ETag, 구독이나 색이 바뀌면 다른 ETag가 됨
+* 목록을 읽는 쿼리 하나로 ETag를 확인하고, 바뀌지 않았으면 본문 없이 304로 답함
+"""
+import hashlib
+
+from apps.channel.models import UserChannel
+
+
+def user_colors(user_id):
+    return list(
+        UserChannel.objects.filter(user_id=user_id)
+        .order_by("channel_id")
+        .values_list("channel_id", "color")
+    )
+
+
+def colors_etag(rows):
+    digest = hashlib.md5(
+        ";".join(f"{channel_id}:{color}" for channel_id, color in rows).encode()
+    )
+    return f'"{digest.hexdigest()}"'
@@ -0,0 +1,72 @@
+"""
+# 채널 구독자 명단 CSV
+* 구독자 수와 상관없이 메모리를 일정하게 쓰도록, `CHUNK_SIZE`명씩 읽어 한 줄씩 내보냄
+* 한 번에 전체 결과를 읽지 않도록 `UserChannel`의 id 순서로 `id > 마지막 id` 조건을 걸어 나눠 읽음
+  * MySQL(mysqlclient)은 `iterator()`를 써도 결과 전체를 클라이언트 메모리에 받아 둠
+* 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM으로 시작
+"""
+import csv
+
+from django.utils import timezone
+
+from apps.channel.models import UserChannel
+
+CHUNK_SIZE = 2000
+
+SUBSCRIBER_COLUMNS = (
+    ("id", "user_id"),
+    ("username", "user__username"),
+    ("email", "user__email"),
+    ("first_name", "user__first_name"),
+    ("last_name", "user__last_name"),
+    ("subscribed_at", "created_at"),
+)
+
+# 스프레드시트가 수식으로 해석하는 값의 첫 글자
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class Echo:
+    """
+    # 쓴 내용을 그대로 돌려주는 file 객체, `csv.writer`의 한 줄을 문자열로 받기 위해 사용
+    """
+
+    def write(self, value):
+        return value
+
+
+def cell(value):
+    if value is None:
+        return ""
+    if hasattr(value, "tzinfo"):
+        return timezone.localtime(value).isoformat()
+    value = str(value)
+    if value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def subscribers(channel, chunk_size=CHUNK_SIZE):
+    """
+    # 채널 구독자 row를 `chunk_size`개씩 나눠 읽는 generator
+    """
+    queryset = UserChannel.objects.filter(channel=channel).order_by("id")
+    lookups = ["id"] + [lookup for _, lookup in SUBSCRIBER_COLUMNS]
+    last_id = 0
+    while True:
+        rows = list(queryset.filter(id__gt=last_id).values_list(*lookups)[:chunk_size])
+        for row in rows:
+            yield row[1:]
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1][0]
+
+
+def subscriber_csv_lines(channel, chunk_size=CHUNK_SIZE):
+    """
+    # `StreamingHttpResponse`에 넘길 CSV 줄
+    """
+    writer = csv.writer(Echo())
+    yield "\ufeff" + writer.writerow([name for name, _ in SUBSCRIBER_COLUMNS])
+    for row in subscribers(channel, chunk_size):
+        yield writer.writerow([cell(value) for value in row])
@@ -0,0 +1,24 @@
+# Generated by Django 3.1.14 on 2026-10-19 13:20
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0009_userchannel_color'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='awaiterchannel',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='awaiterchannel',
+            index=models.Index(fields=['channel', 'created_at', 'user'], name='awaiter_channel_created_idx'),
+        ),
+    ]
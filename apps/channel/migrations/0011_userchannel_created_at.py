@@ -0,0 +1,24 @@
+# Generated by Django 3.1.14 on 2026-10-19 13:22
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0010_awaiterchannel_created_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userchannel',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='userchannel',
+            index=models.Index(fields=['user', 'created_at', 'channel'], name='user_channel_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.14 on 2026-10-19 13:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0011_userchannel_created_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userchannel',
+            index=models.Index(fields=['channel', 'created_at', 'user'], name='channel_user_created_idx'),
+        ),
+    ]
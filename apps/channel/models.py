@@ -79,6 +79,7 @@ class UserChannel(models.Model):
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     color = models.CharField(max_length=10, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         constraints = [
@@ -86,11 +87,24 @@ class UserChannel(models.Model):
                 fields=("channel", "user"), name="subscribe_should_be_unique"
             )
         ]
+        indexes = [
+            # 유저별 구독 채널 목록을 구독 순서로 페이지네이션
+            models.Index(
+                fields=["user", "created_at", "channel"],
+                name="user_channel_created_idx",
+            ),
+            # 채널별 구독자 목록을 구독 순서로 페이지네이션
+            models.Index(
+                fields=["channel", "created_at", "user"],
+                name="channel_user_created_idx",
+            ),
+        ]
 
 
 class AwaiterChannel(models.Model):
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         constraints = [
@@ -98,3 +112,10 @@ class AwaiterChannel(models.Model):
                 fields=("channel", "user"), name="subscription_waiting_should_be_unique"
             )
         ]
+        indexes = [
+            # 채널별 대기자 목록을 구독 신청 순서로 페이지네이션
+            models.Index(
+                fields=["channel", "created_at", "user"],
+                name="awaiter_channel_created_idx",
+            )
+        ]
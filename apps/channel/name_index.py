@@ -0,0 +1,266 @@
+"""
+# 공개 채널 이름 자동완성 index
+* 공개(비공개, 개인 채널이 아닌) 채널 이름을 정렬된 배열로 프로세스 메모리에 두고 bisect로 앞부분 검색
+  * DB를 조회하지 않고 마이크로초 단위로 답함
+* 이름 전체와 띄어쓰기로 나눈 각 단어의 앞부분으로 찾을 수 있음 (`와플` → `서울대 와플스튜디오`)
+* 한글은 자모로 분해해서 비교하므로 입력 중인 글자로도 찾을 수 있음 (`와ㅍ`, `왚` → `와플스튜디오`)
+  * 입력기는 다음 글자의 첫소리를 앞 글자의 받침으로 먼저 붙이므로, 마지막 받침은 다음 글자의 첫소리로도 찾음
+  * 마지막 받침, 모음이 겹받침, 겹모음이 되는 경우도 찾음 (`달` → `닭`, `오` → `와`)
+* `Channel` 저장, 삭제 signal로 바뀐 채널만 고치고(transaction commit 후),
+  `CHANNEL_NAME_INDEX_REFRESH`초마다 DB에서 다시 만듦
+  * 다른 프로세스에서 바뀐 채널, `QuerySet.update()`처럼 signal이 없는 변경도 다시 만들 때 반영됨
+  * 처음 한 번만 요청 안에서 만들고, 이후에는 background thread 하나가 다시 만드는 동안 이전 index로 답함
+  * 다시 만드는 동안 signal로 고친 채널은 새 index에도 다시 반영함
+"""
+import logging
+import threading
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger("apps.channel_names")
+
+FINALS = "ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+COMPOUND_FINALS = {
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+COMPOUND_VOWELS = {"ㅗ": "ㅘㅙㅚ", "ㅜ": "ㅝㅞㅟ", "ㅡ": "ㅢ"}
+
+
+def normalize(text):
+    return unicodedata.normalize("NFKD", text.casefold())
+
+
+def final(jamo):
+    """
+    # 호환 자모 자음을 받침 자모로 바꿈, NFKD로는 첫소리 자모가 됨
+    """
+    return chr(0x11A8 + FINALS.index(jamo))
+
+
+def composing_endings():
+    """
+    # 입력 중인 마지막 자모 → 다음 글자를 입력하면 바뀔 수 있는 자모들
+    * 받침 → 다음 글자의 첫소리, 겹받침 → 앞 받침과 다음 글자의 첫소리
+    * 받침 → 그 받침으로 시작하는 겹받침, 모음 → 그 모음으로 시작하는 겹모음
+    """
+    endings = {}
+    for jamo in FINALS:
+        if jamo in COMPOUND_FINALS:
+            first, second = COMPOUND_FINALS[jamo]
+            endings[final(jamo)] = [final(first) + normalize(second)]
+        else:
+            endings[final(jamo)] = [normalize(jamo)] + [
+                final(compound)
+                for compound, (first, _) in COMPOUND_FINALS.items()
+                if first == jamo
+            ]
+    for vowel, compounds in COMPOUND_VOWELS.items():
+        endings[normalize(vowel)] = [normalize(compound) for compound in compounds]
+    return endings
+
+
+def name_keys(name):
+    """
+    # 이름을 찾을 수 있는 key들: 이름 전체, 띄어쓰기로 나눈 두 번째 단어부터 각각
+    """
+    words = name.split()
+    return {normalize(name.strip())} | {normalize(word) for word in words[1:]}
+
+
+class ChannelNameIndex:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # index를 다시 만드는 thread는 하나만 돌게 함
+        self.rebuild_lock = threading.Lock()
+        self.keys = []
+        self.ids = array("q")
+        self.names = {}
+        self.built_at = None
+        # 다시 만드는 동안 고친 채널, `{채널 id: 이름}`
+        self.changes = None
+
+    def build(self, rows):
+        """
+        # `(채널 id, 이름)` row로 index를 새로 만듦
+        """
+        names = {}
+        entries = []
+        for channel_id, name in rows:
+            names[channel_id] = name
+            entries.extend((key, channel_id) for key in name_keys(name))
+        entries.sort()
+
+        with self.lock:
+            self.keys = [key for key, _ in entries]
+            self.ids = array("q", (channel_id for _, channel_id in entries))
+            self.names = names
+            self.built_at = time.monotonic()
+            for channel_id, name in (self.changes or {}).items():
+                self._update(channel_id, name)
+
+    def rows(self):
+        from apps.channel.models import Channel
+
+        return (
+            Channel._base_manager.filter(is_personal=False, is_private=False)
+            .values_list("id", "name")
+            .iterator()
+        )
+
+    def refresh(self):
+        """
+        # DB에서 index를 다시 만듦
+        * 읽는 동안 signal로 고친 채널은 읽은 row에 빠져 있을 수 있으므로 모아 두었다가 다시 반영함
+        """
+        with self.lock:
+            self.changes = {}
+        try:
+            self.build(self.rows())
+        finally:
+            with self.lock:
+                self.changes = None
+
+    def ensure_fresh(self):
+        """
+        # index가 없으면 만들고, 오래되었으면 background thread에서 다시 만듦
+        * 동시에 들어온 요청들이 같이 만들지 않도록 `rebuild_lock`을 잡은 하나만 만듦
+        * 다시 만드는 동안에는 기다리지 않고 이전 index로 답함
+        """
+        if self.built_at is None:
+            with self.rebuild_lock:
+                if self.built_at is None:
+                    self.refresh()
+            return
+        if time.monotonic() - self.built_at <= settings.CHANNEL_NAME_INDEX_REFRESH:
+            return
+        if not self.rebuild_lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(target=self._rebuild, daemon=True).start()
+        except Exception:
+            self.rebuild_lock.release()
+            raise
+
+    def _rebuild(self):
+        try:
+            self.refresh()
+        except Exception:
+            # 실패하면 이전 index로 계속 답하고, 다음 요청에서 다시 시도함
+            logger.exception("failed to rebuild the channel name index")
+        finally:
+            connections.close_all()
+            self.rebuild_lock.release()
+
+    def search(self, prefix, limit=10):
+        """
+        # 이름이나 단어가 `prefix`로 시작하는 채널의 `(id, 이름)`, key 순서로 최대 `limit`개
+        * 마지막 자모를 입력 중인 자모로 보고 `COMPOSING_ENDINGS`로 바꾼 prefix들도 찾음
+        """
+        # 끝의 띄어쓰기는 단어가 끝났다는 뜻이므로 남겨 둠
+        prefix = normalize(prefix.lstrip())
+        prefixes = [prefix] + [
+            prefix[:-1] + ending for ending in COMPOSING_ENDINGS.get(prefix[-1:], ())
+        ]
+        results = []
+        seen = set()
+        with self.lock:
+            # prefix들의 범위는 겹치지 않으므로, 위치 순으로 합치면 key 순서가 됨
+            matches = sorted(
+                index for prefix in prefixes for index in self._matches(prefix, limit)
+            )
+            for index in matches:
+                if len(results) == limit:
+                    break
+                channel_id = self.ids[index]
+                if channel_id not in seen:
+                    seen.add(channel_id)
+                    results.append((channel_id, self.names[channel_id]))
+        return results
+
+    def _matches(self, prefix, limit):
+        """
+        # key가 `prefix`로 시작하는 위치들, 채널 `limit`개를 찾을 때까지
+        """
+        matches = []
+        seen = set()
+        index = bisect_left(self.keys, prefix)
+        while index < len(self.keys) and len(seen) < limit:
+            if not self.keys[index].startswith(prefix):
+                break
+            matches.append(index)
+            seen.add(self.ids[index])
+            index += 1
+        return matches
+
+    def update(self, channel_id, name=None):
+        """
+        # 채널 하나를 고침, `name`이 `None`이면 index에서 뺌
+        * 아직 index를 만들지 않았으면 처음 검색할 때 DB에서 읽으므로 그대로 둠
+        * 다시 만드는 중이면 새 index에도 반영되도록 `changes`에 남김
+        """
+        with self.lock:
+            if self.changes is not None:
+                self.changes[channel_id] = name
+            if self.built_at is None:
+                return
+            self._update(channel_id, name)
+
+    def _update(self, channel_id, name):
+        self._remove(channel_id)
+        if name is None:
+            return
+        self.names[channel_id] = name
+        for key in name_keys(name):
+            index = bisect_left(self.keys, key)
+            while (
+                index < len(self.keys)
+                and self.keys[index] == key
+                and self.ids[index] < channel_id
+            ):
+                index += 1
+            self.keys.insert(index, key)
+            self.ids.insert(index, channel_id)
+
+    def _remove(self, channel_id):
+        name = self.names.pop(channel_id, None)
+        if name is None:
+            return
+        for key in name_keys(name):
+            index = bisect_left(self.keys, key)
+            while index < len(self.keys) and self.keys[index] == key:
+                if self.ids[index] == channel_id:
+                    del self.keys[index]
+                    del self.ids[index]
+                    break
+                index += 1
+
+
+COMPOSING_ENDINGS = composing_endings()
+channel_names = ChannelNameIndex()
+
+
+def channel_saved(sender, instance, **kwargs):
+    channel_id, name = instance.id, None
+    if not instance.is_personal and not instance.is_private:
+        name = instance.name
+    transaction.on_commit(lambda: channel_names.update(channel_id, name))
+
+
+def channel_deleted(sender, instance, **kwargs):
+    channel_id = instance.id
+    transaction.on_commit(lambda: channel_names.update(channel_id))
@@ -12,6 +12,11 @@ class ManagerCanModify(BasePermission):
             "add_manager",
             "allow",
             "disallow",
+            "bulk_allow",
+            "bulk_disallow",
+            "awaiters",
+            "subscribers",
+            "subscribers_csv",
         ):
             return obj.managers.id == request.user.id
         return True
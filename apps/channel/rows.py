@@ -0,0 +1,139 @@
+from django.db.models import CharField, Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.channel.models import AwaiterChannel, Channel, UserChannel
+from apps.core.rows import RowSerializer
+from apps.user.rows import user_columns
+
+
+def request_user_color(prefix=""):
+    def color(context):
+        request = context.get("request")
+        if request is None or not request.user.is_authenticated:
+            return Value(None, output_field=CharField())
+        return Subquery(
+            UserChannel.objects.filter(
+                channel=OuterRef(f"{prefix}id"), user=request.user
+            ).values("color")[:1]
+        )
+
+    return color
+
+
+def count_per_channel(model, channel_ref):
+    """
+    # 채널별 `model` row 수 subquery, row가 없으면 0
+    """
+    return Coalesce(
+        Subquery(
+            model.objects.filter(channel=OuterRef(channel_ref))
+            .values("channel")
+            .annotate(count=Count("id"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def channel_columns(prefix="", color=None, subscribers_count=None):
+    """
+    # `ChannelSerializer`와 같은 응답을 만드는 컬럼
+    * `color`: 기본값은 요청한 유저가 지정한 색
+    * `subscribers_count`: 기본값은 구독자 수를 세는 subquery
+    """
+    if subscribers_count is None:
+        subscribers_count = count_per_channel(UserChannel, f"{prefix}id")
+
+    return {
+        "id": f"{prefix}id",
+        "name": f"{prefix}name",
+        "image": f"{prefix}image__image",
+        "color": color or request_user_color(prefix),
+        "description": f"{prefix}description",
+        "is_private": f"{prefix}is_private",
+        "is_official": f"{prefix}is_official",
+        "is_personal": f"{prefix}is_personal",
+        "created_at": f"{prefix}created_at",
+        "updated_at": f"{prefix}updated_at",
+        "subscribers_count": subscribers_count,
+        "managers": user_columns(f"{prefix}managers__"),
+    }
+
+
+def channel_summary_columns(prefix="", color=None, subscribers_count=None):
+    """
+    # `ChannelSummarySerializer`와 같은 응답을 만드는 컬럼, 매니저는 id만 보냄
+    """
+    columns = channel_columns(prefix, color, subscribers_count)
+    for name in ("created_at", "updated_at", "managers"):
+        del columns[name]
+    columns["managers_id"] = f"{prefix}managers"
+    return columns
+
+
+def subscription_rows(model, time_name, compact=False, color=None):
+    """
+    # 유저의 구독(`UserChannel`), 구독 신청(`AwaiterChannel`) row로 만드는 채널 목록
+    * 채널 정보 뒤에 구독(신청) 시각을 `time_name`으로 붙임
+    """
+    columns_of = channel_summary_columns if compact else channel_columns
+    columns = columns_of("channel__", color=color)
+    columns[time_name] = "created_at"
+    return RowSerializer(model, columns)
+
+
+def managing_rows(compact=False):
+    """
+    # 유저가 관리하는 채널 목록, `ChannelAwaiterSerializer`처럼 대기자 수를 붙임
+    """
+    awaiters_count = count_per_channel(AwaiterChannel, "id")
+    if compact:
+        columns = channel_summary_columns()
+        columns["awaiters_count"] = awaiters_count
+        return RowSerializer(Channel, columns)
+
+    columns = channel_columns()
+    managers = columns.pop("managers")
+    columns["awaiters_count"] = awaiters_count
+    columns["managers"] = managers
+    return RowSerializer(Channel, columns)
+
+
+# `Channel.objects`가 annotate한 구독자 수를 그대로 사용
+channel_rows = RowSerializer(
+    Channel, channel_columns(subscribers_count="subscribers_count")
+)
+
+
+def member_rows(model, time_name):
+    """
+    # 채널의 구독자(`UserChannel`), 구독 신청자(`AwaiterChannel`) 목록
+    * 유저 정보 뒤에 구독(신청) 시각을 `time_name`으로 붙임
+    * `private_channel_id`처럼 유저마다 더 찾아야 하는 값은 보내지 않음
+    """
+    return RowSerializer(
+        model,
+        {
+            "id": "user_id",
+            "username": "user__username",
+            "email": "user__email",
+            "first_name": "user__first_name",
+            "last_name": "user__last_name",
+            time_name: "created_at",
+        },
+    )
+
+
+awaiter_rows = member_rows(AwaiterChannel, "requested_at")
+subscriber_rows = member_rows(UserChannel, "subscribed_at")
+
+# 유저 목록 화면의 구독 중인 채널, 구독 신청한 채널, 관리 중인 채널 (`view=compact`이면 요약)
+subscribing_channel_rows = {
+    compact: subscription_rows(UserChannel, "subscribed_at", compact, color="color")
+    for compact in (False, True)
+}
+awaiting_channel_rows = {
+    compact: subscription_rows(AwaiterChannel, "requested_at", compact)
+    for compact in (False, True)
+}
+managing_channel_rows = {compact: managing_rows(compact) for compact in (False, True)}
@@ -1,6 +1,7 @@
 from django.forms import ValidationError
 from rest_framework import serializers
 from apps.channel.models import Channel, Image, UserChannel
+from apps.core.mixins import ExpandableFieldsMixin
 from apps.core.utils import THEME_COLOR, random_color
 
 # TODO: S3 연결 후 이미지 처리하기
@@ -49,6 +50,9 @@ class ChannelSerializer(serializers.ModelSerializer):
         return path
 
     def get_color(self, channel):
+        # 여러 채널을 한 번에 보낼 때는 미리 읽어 둔 {채널 id: 색}을 context로 받음
+        if "colors" in self.context:
+            return self.context["colors"].get(channel.id)
         if "request" not in self.context:
             return None
         request = self.context["request"]
@@ -77,6 +81,38 @@ class ChannelSerializer(serializers.ModelSerializer):
         return data
 
 
+class ChannelSummarySerializer(ChannelSerializer):
+    """
+    # 여러 채널을 한 번에 보낼 때 쓰는 요약
+    * 채널마다 쿼리가 나가지 않도록 `Channel.objects`의 annotate, select_related 결과와
+      context의 `colors`만 사용함
+    * 매니저는 id만 보냄
+    """
+
+    managers_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Channel
+        fields = (
+            "id",
+            "name",
+            "image",
+            "color",
+            "description",
+            "is_private",
+            "is_official",
+            "is_personal",
+            "subscribers_count",
+            "managers_id",
+        )
+
+    def get_image(self, channel):
+        return channel.image.image.url if channel.image_id else None
+
+    def get_subscribers_count(self, channel):
+        return channel.subscribers_count
+
+
 class ChannelAwaiterSerializer(serializers.ModelSerializer):
     subscribers_count = serializers.SerializerMethodField(read_only=True)
     # managers_id = serializers.ListField(
@@ -128,13 +164,9 @@ class ChannelAwaiterSerializer(serializers.ModelSerializer):
         if request is None:
             return random_color()
         try:
-            color_data = UserChannelColorSerializer(
-                UserChannel.objects.get(channel=channel, user=request.user),
-                context={"request": request},
-            )
+            return UserChannel.objects.get(channel=channel, user=request.user).color
         except UserChannel.DoesNotExist:
             return random_color()
-        return color_data.data["color"]
 
     def get_subscribers_count(self, channel):
         subscribers_count = channel.subscribers.count()
@@ -152,20 +184,19 @@ class ChannelAwaiterSerializer(serializers.ModelSerializer):
         return data
 
 
-class UserChannelColorSerializer(serializers.ModelSerializer):
+class UserChannelColorSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
+    """
+    # 유저가 채널에 지정한 색
+    * 기본 응답은 `{"channel": 채널 id, "user": 유저 id, "color": 색}`
+    * `?expand=channel,user`로 채널, 유저 전체 정보를 함께 받을 수 있음
+    """
 
-    channel = serializers.SerializerMethodField()
-    user = serializers.SerializerMethodField()
+    expandable_fields = {"channel": ChannelSerializer, "user": UserSerializer}
 
     class Meta:
         model = UserChannel
         fields = ("channel", "user", "color")
-
-    def get_channel(self, obj):
-        return ChannelSerializer(obj.channel, context=self.context).data
-
-    def get_user(self, obj):
-        return UserSerializer(obj.user, context=self.context).data
+        read_only_fields = ("channel", "user")
 
     def validate(self, data):
         if "color" not in data or data["color"] is None:
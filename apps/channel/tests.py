@@ -1,8 +1,27 @@
-from django.test import TestCase
-from rest_framework.test import APIClient
-
-from apps.channel.models import Channel, UserChannel
+import threading
+import unittest
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from apps.channel.claims import (
+    bump_version,
+    decode_ids,
+    encode_ids,
+    is_subscriber,
+    subscribed_channel_ids,
+)
+from apps.channel.exports import subscriber_csv_lines
+from apps.channel.models import AwaiterChannel, Channel, UserChannel
+from apps.channel.name_index import ChannelNameIndex, channel_names
 from apps.core.utils import THEME_COLOR, random_color
+from apps.event.models import Event
+from apps.notice.models import Notice
+from apps.user.authentication import StatelessJWTAuthentication
 from apps.user.models import User
 
 
@@ -196,6 +215,113 @@ class ChannelPermissionTest(TestCase):
         self.client.post(f"/api/v1/channels/{self.private_channel.id}/subscribe/")
         self.assertEqual(self.private_channel.awaiters.count(), 1)
 
+    def test_awaiters_list_is_manager_only(self):
+        self.client.force_authenticate(user=self.c)
+        self.client.post(f"/api/v1/channels/{self.private_channel.id}/subscribe/")
+        url = f"/api/v1/channels/{self.private_channel.id}/awaiters/"
+
+        self.client.force_authenticate(user=self.b)
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertEqual(self.client.get(url, {"q": "test"}).status_code, 403)
+
+        self.client.force_authenticate(user=None)
+        self.assertIn(self.client.get(url).status_code, (401, 403))
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["id"] for row in response.json()["results"]], [self.c.id])
+
+    def test_subscribers_list_and_csv(self):
+        subscribers = [
+            User.objects.create_user(
+                username=f"subscriber{i}",
+                email=f"subscriber{i}@email.com",
+                password="pw",
+                first_name="=이름" if i == 0 else "이름",
+            )
+            for i in range(5)
+        ]
+        for user in subscribers:
+            UserChannel.objects.create(channel=self.public_channel, user=user)
+        url = f"/api/v1/channels/{self.public_channel.id}/subscribers/"
+
+        self.client.force_authenticate(user=self.b)
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertEqual(self.client.get(f"{url}csv/").status_code, 403)
+
+        self.client.force_authenticate(user=self.user)
+        first = self.client.get(url, {"page_size": 3}).json()
+        second = self.client.get(first["next"]).json()
+        self.assertEqual(
+            [row["id"] for row in first["results"] + second["results"]],
+            [user.id for user in subscribers],
+        )
+        self.assertIn("subscribed_at", first["results"][0])
+
+        response = self.client.get(f"{url}csv/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment", response["Content-Disposition"])
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        self.assertEqual(
+            lines[0], "id,username,email,first_name,last_name,subscribed_at"
+        )
+        self.assertEqual(len(lines), 6)
+        self.assertTrue(lines[1].startswith(f"{subscribers[0].id},subscriber0,"))
+        self.assertIn(",'=이름,", lines[1])
+
+    def test_subscribers_csv_reads_in_chunks(self):
+        for i in range(5):
+            user = User.objects.create_user(
+                username=f"subscriber{i}", email=f"subscriber{i}@email.com"
+            )
+            UserChannel.objects.create(channel=self.public_channel, user=user)
+
+        # 2명씩 3번, 마지막 묶음이 덜 차면 더 읽지 않음
+        with self.assertNumQueries(3):
+            lines = list(subscriber_csv_lines(self.public_channel, chunk_size=2))
+        self.assertEqual(len(lines), 6)
+
+    def test_awaiters_list_paginated_and_searchable(self):
+        awaiters = [
+            User.objects.create_user(
+                username=f"awaiter{i}", email=f"awaiter{i}@email.com", password="pw"
+            )
+            for i in range(12)
+        ]
+        for user in awaiters:
+            AwaiterChannel.objects.create(channel=self.private_channel, user=user)
+        # 신청 시각이 같으면 user id 순
+        AwaiterChannel.objects.filter(user__in=awaiters[6:]).update(
+            created_at=AwaiterChannel.objects.get(user=awaiters[0]).created_at
+        )
+        url = f"/api/v1/channels/{self.private_channel.id}/awaiters/"
+
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(3):
+            first = self.client.get(url, {"page_size": 5}).json()
+        self.assertEqual(
+            set(first["results"][0]),
+            {"id", "username", "email", "first_name", "last_name", "requested_at"},
+        )
+        second = self.client.get(first["next"]).json()
+        third = self.client.get(second["next"]).json()
+        self.assertIsNone(third["next"])
+        ids = [row["id"] for page in (first, second, third) for row in page["results"]]
+        self.assertEqual(
+            ids,
+            [awaiters[0].id]
+            + [u.id for u in awaiters[6:]]
+            + [u.id for u in awaiters[1:6]],
+        )
+
+        search = self.client.get(url, {"q": "AWAITER1"}).json()
+        self.assertEqual(
+            sorted(row["username"] for row in search["results"]),
+            ["awaiter1", "awaiter10", "awaiter11"],
+        )
+
     def test_public_subscribe(self):
         self.client.force_authenticate(user=self.b)
 
@@ -205,6 +331,8 @@ class ChannelPermissionTest(TestCase):
         self.assertEqual(subscribe.status_code, 204)
 
         self.assertEqual(self.public_channel.subscribers.count(), 1)
+        user_channel = UserChannel.objects.get(channel=self.public_channel, user=self.b)
+        self.assertIn(user_channel.color, THEME_COLOR.values())
 
     def test_public_subscribe_twice_will_fail(self):
         self.client.force_authenticate(user=self.b)
@@ -314,6 +442,51 @@ class ChannelPermissionTest(TestCase):
         )
         self.assertEqual(redisallow.status_code, 400)
 
+    def test_bulk_allow_and_disallow_awaiters(self):
+        for user in (self.b, self.c):
+            self.client.force_authenticate(user=user)
+            self.client.post(f"/api/v1/channels/{self.private_channel.id}/subscribe/")
+        url = f"/api/v1/channels/{self.private_channel.id}/awaiters/allow/"
+
+        forbidden = self.client.post(url, {"users": "all"}, format="json")
+        self.assertEqual(forbidden.status_code, 403)
+
+        self.client.force_authenticate(user=self.user)
+        wrong = self.client.post(url, {"users": ["b"]}, format="json")
+        self.assertEqual(wrong.status_code, 400)
+
+        allow = self.client.post(url, {"users": [self.b.id, 0]}, format="json")
+        self.assertEqual(allow.status_code, 200)
+        self.assertEqual(
+            allow.json()["results"], {str(self.b.id): "allowed", "0": "not_awaiting"}
+        )
+        self.assertIn(
+            UserChannel.objects.get(channel=self.private_channel, user=self.b).color,
+            THEME_COLOR.values(),
+        )
+
+        disallow = self.client.delete(
+            url, {"users": [self.b.id, self.c.id]}, format="json"
+        )
+        self.assertEqual(
+            disallow.json()["results"],
+            {str(self.b.id): "subscribed", str(self.c.id): "rejected"},
+        )
+        self.assertEqual(self.private_channel.awaiters.count(), 0)
+
+        self.client.force_authenticate(user=self.c)
+        self.client.post(f"/api/v1/channels/{self.private_channel.id}/subscribe/")
+        self.client.force_authenticate(user=self.user)
+        # 채널, 매니저 prefetch, savepoint 2개, 대기자, 구독자, INSERT, DELETE, 구독 claim 버전
+        with self.assertNumQueries(9):
+            allow = self.client.post(url, {"users": "all"}, format="json")
+        self.assertEqual(allow.json()["results"], {str(self.c.id): "allowed"})
+        self.assertEqual(
+            set(self.private_channel.subscribers.values_list("id", flat=True)),
+            {self.b.id, self.c.id},
+        )
+        self.assertEqual(self.private_channel.awaiters.count(), 0)
+
     def test_delete_last_manager_fail(self):
         self.client.force_authenticate(user=self.user)
         update = self.client.patch(
@@ -328,6 +501,62 @@ class ChannelPermissionTest(TestCase):
         self.assertEqual(recommend.status_code, 200)
 
 
+@unittest.skipIf(
+    connection.vendor == "sqlite",
+    "SQLite 테스트 DB(공유 메모리)는 여러 연결이 동시에 쓰면 기다리지 않고 table lock 오류를 냄",
+)
+class ChannelSubscribeRaceTest(TransactionTestCase):
+    """
+    # 같은 유저가 동시에 여러 번 구독, 구독 취소를 요청할 때 한 번만 반영되는지 확인
+    * 여러 스레드가 각자의 DB 연결로 요청하므로 CI의 MySQL에서 실행
+    """
+
+    def setUp(self):
+        self.manager = User.objects.create_user(
+            username="manager", email="manager@email.com", password="password"
+        )
+        self.user = User.objects.create_user(
+            username="testuser", email="email@email.com", password="password"
+        )
+        self.channel = Channel.objects.create(
+            name="wafflestudio", description="와플스튜디오", managers=self.manager
+        )
+
+    def request_concurrently(self, method, count=8):
+        barrier = threading.Barrier(count)
+        statuses = []
+
+        def call():
+            client = APIClient()
+            client.force_authenticate(user=self.user)
+            barrier.wait()
+            try:
+                response = getattr(client, method)(
+                    f"/api/v1/channels/{self.channel.id}/subscribe/"
+                )
+                statuses.append(response.status_code)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return sorted(statuses)
+
+    def test_subscribe_and_unsubscribe_concurrently(self):
+        self.assertEqual(self.request_concurrently("post"), [204] + [400] * 7)
+        self.assertEqual(
+            UserChannel.objects.filter(channel=self.channel, user=self.user).count(), 1
+        )
+
+        self.assertEqual(self.request_concurrently("delete"), [204] + [400] * 7)
+        self.assertFalse(
+            UserChannel.objects.filter(channel=self.channel, user=self.user).exists()
+        )
+
+
 class ChannelSearchTest(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
@@ -432,6 +661,147 @@ class ChannelSearchTest(TestCase):
         self.assertEqual(not_search.status_code, 200)
 
 
+class ChannelAutocompleteTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="email@email.com",
+            password="password",
+        )
+        self.waffle = Channel.objects.create(name="와플스튜디오", description="")
+        self.snu = Channel.objects.create(name="서울대 Waffle 동아리", description="")
+        Channel.objects.create(name="와플 비공개", description="", is_private=True)
+        self.user.refresh_from_db()
+        channel_names.refresh()
+
+    def autocomplete(self, keyword, count=""):
+        response = self.client.get(
+            f"/api/v1/channels/autocomplete/?q={keyword}&count={count}"
+        )
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.json()]
+
+    def test_autocomplete(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.autocomplete("와플"), [self.waffle.id])
+        # 이름 중간 단어, 대소문자 무시
+        self.assertEqual(self.autocomplete("waff"), [self.snu.id])
+        # 입력 중인 한글
+        self.assertEqual(self.autocomplete("와ㅍ"), [self.waffle.id])
+        self.assertEqual(self.autocomplete("서울대 w"), [self.snu.id])
+        self.assertEqual(self.autocomplete("스튜디오"), [])
+        # 개인 채널, 비공개 채널은 제외
+        self.assertEqual(self.autocomplete(self.user.username), [])
+
+        response = self.client.get("/api/v1/channels/autocomplete/?q= ")
+        self.assertEqual(response.status_code, 400)
+
+    def test_autocomplete_while_composing(self):
+        # 입력기가 `와플스튜디오`를 입력하는 동안 보여 주는 글자들
+        for keyword in (
+            "ㅇ",
+            "오",
+            "와",
+            "왚",
+            "와프",
+            "와플",
+            "와픐",
+            "와플스",
+            "와플슽",
+            "와플스튜",
+            "와플스튣",
+            "와플스튜디",
+            "와플스튜딩",
+            "와플스튜디오",
+        ):
+            self.assertEqual(self.autocomplete(keyword), [self.waffle.id], keyword)
+
+        index = ChannelNameIndex()
+        index.build([(1, "닭갈비"), (2, "달리기"), (3, "다리"), (4, "왜")])
+        self.assertEqual(index.search("달"), [(3, "다리"), (2, "달리기"), (1, "닭갈비")])
+        self.assertEqual(index.search("닭"), [(1, "닭갈비")])
+        self.assertEqual(index.search("달", 2), [(3, "다리"), (2, "달리기")])
+        self.assertEqual(index.search("오"), [(4, "왜")])
+        self.assertEqual(index.search("왚"), [])
+
+    def test_index_update(self):
+        index = ChannelNameIndex()
+        index.build([(1, "Waffle Studio"), (2, "waffle")])
+        self.assertEqual(index.search("waffle"), [(2, "waffle"), (1, "Waffle Studio")])
+        self.assertEqual(index.search("waffle", 1), [(2, "waffle")])
+
+        index.update(1, "와플 Studio")
+        self.assertEqual(index.search("waffle"), [(2, "waffle")])
+        self.assertEqual(index.search("stu"), [(1, "와플 Studio")])
+
+        index.update(3, "waffle 3")
+        self.assertEqual(index.search("waffle"), [(2, "waffle"), (3, "waffle 3")])
+        self.assertEqual(index.search("waffle "), [(3, "waffle 3")])
+
+        index.update(2)
+        self.assertEqual(index.search("waffle"), [(3, "waffle 3")])
+        self.assertEqual(index.keys, sorted(index.keys))
+
+    @override_settings(CHANNEL_NAME_INDEX_REFRESH=-1)
+    def test_stale_index_rebuilds_once_in_background(self):
+        index = ChannelNameIndex()
+        index.build([(1, "waffle")])
+        reading, release = threading.Event(), threading.Event()
+
+        def rows():
+            reading.set()
+            self.assertTrue(release.wait(5))
+            return [(1, "waffle"), (2, "waffle 2")]
+
+        with patch.object(index, "rows", side_effect=rows) as read:
+            for _ in range(3):
+                index.ensure_fresh()
+            self.assertTrue(reading.wait(5))
+            # 다시 만드는 동안 이전 index로 답하고, 다른 요청은 다시 만들지 않음
+            threads = [threading.Thread(target=index.ensure_fresh) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(index.search("waffle"), [(1, "waffle")])
+            index.update(3, "waffle 3")
+            index.update(1)
+            self.assertEqual(index.search("waffle"), [(3, "waffle 3")])
+
+            release.set()
+            with index.rebuild_lock:
+                pass
+        self.assertEqual(read.call_count, 1)
+        # 다시 읽은 row에 없던 변경도 반영됨
+        self.assertEqual(index.search("waffle"), [(2, "waffle 2"), (3, "waffle 3")])
+        self.assertIsNone(index.changes)
+
+
+class ChannelAutocompleteSignalTest(TransactionTestCase):
+    def setUp(self):
+        channel_names.refresh()
+
+    def test_signals(self):
+        channel = Channel.objects.create(name="와플스튜디오", description="")
+        self.assertEqual(channel_names.search("와플"), [(channel.id, "와플스튜디오")])
+
+        channel.name = "Waffle Studio"
+        channel.save()
+        self.assertEqual(channel_names.search("와플"), [])
+        self.assertEqual(channel_names.search("stud"), [(channel.id, "Waffle Studio")])
+
+        channel.is_private = True
+        channel.save()
+        self.assertEqual(channel_names.search("waffle"), [])
+
+        channel.is_private = False
+        channel.save()
+        channel_id = channel.id
+        channel.delete()
+        self.assertEqual(channel_names.search("waffle"), [])
+        self.assertNotIn(channel_id, channel_names.names)
+
+
 class ChannelColorTest(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
@@ -485,6 +855,33 @@ class ChannelColorTest(TestCase):
         data = color_update.json()
         self.assertEqual(data["color"], THEME_COLOR["SKYBLUE"])
 
+    def test_color_response_is_compact_unless_expanded(self):
+        self.client.force_authenticate(user=self.user)
+        # 채널, 채널 매니저 prefetch, 구독
+        with self.assertNumQueries(3):
+            response = self.client.get(f"/api/v1/channels/{self.channel1.id}/color/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {"channel", "user", "color"})
+        self.assertEqual(response.json()["channel"], self.channel1.id)
+        self.assertEqual(response.json()["user"], self.user.id)
+
+        response = self.client.patch(
+            f"/api/v1/channels/{self.channel1.id}/color/?expand=channel,user",
+            {"color": THEME_COLOR["SKYBLUE"]},
+            format="json",
+        )
+        data = response.json()
+        self.assertEqual(data["channel"]["id"], self.channel1.id)
+        self.assertEqual(data["channel"]["color"], THEME_COLOR["SKYBLUE"])
+        self.assertEqual(data["user"]["username"], self.user.username)
+        self.assertEqual(data["color"], THEME_COLOR["SKYBLUE"])
+
+        response = self.client.get(
+            f"/api/v1/channels/{self.channel1.id}/color/?expand=channel"
+        )
+        self.assertEqual(response.json()["channel"]["id"], self.channel1.id)
+        self.assertEqual(response.json()["user"], self.user.id)
+
     def test_get_color_non_subscriber(self):
         self.client.force_authenticate(user=self.user2)
         color_data = self.client.get(f"/api/v1/channels/{self.channel1.id}/color/")
@@ -515,3 +912,221 @@ class ChannelColorTest(TestCase):
         )
 
         self.assertEqual(color_update.status_code, 400)
+
+
+class ChannelClaimsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="email@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+
+        self.b = User.objects.create_user(
+            username="testuser2",
+            email="email2@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+
+        self.private_channel = Channel.objects.create(
+            name="wafflestudio18-5",
+            description="와플스튜디오 18.5기 활동 채널입니다.",
+            is_private=True,
+            managers=self.user,
+        )
+        self.private_channel.subscribers.add(self.user, self.b)
+
+        self.client = APIClient()
+
+    def login(self, user):
+        login = self.client.post(
+            "/api/v1/users/login/",
+            {"username": user.username, "password": "password"},
+            format="json",
+        )
+        return login.data["access"]
+
+    def request(self, access):
+        return Request(
+            APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {access}"),
+            authenticators=[StatelessJWTAuthentication()],
+        )
+
+    def test_encode_and_decode_ids(self):
+        for ids in ([], [1], [3, 1, 2], [1, 127, 128, 300, 70000, 2**31]):
+            self.assertEqual(decode_ids(encode_ids(ids)), frozenset(ids))
+
+    def test_is_subscriber_without_query(self):
+        request = self.request(self.login(self.b))
+        request.user
+
+        with self.assertNumQueries(0):
+            self.assertTrue(is_subscriber(request, self.private_channel))
+
+    def test_claims_survive_cache_eviction(self):
+        access = self.login(self.b)
+        cache.clear()
+
+        # 버전은 DB에 있으므로 캐시가 비워져도 같은 버전을 다시 읽고, claim을 그대로 씀
+        request = self.request(access)
+        request.user
+        with self.assertNumQueries(1):
+            self.assertTrue(is_subscriber(request, self.private_channel))
+
+        bump_version(self.b.id)
+        cache.clear()
+        request = self.request(access)
+        request.user
+        with self.assertNumQueries(2):
+            self.assertTrue(is_subscriber(request, self.private_channel))
+
+    def test_stale_claims_fall_back_to_database(self):
+        access = self.login(self.b)
+
+        self.client.force_authenticate(user=self.b)
+        unsubscribe = self.client.delete(
+            f"/api/v1/channels/{self.private_channel.id}/subscribe/"
+        )
+        self.assertEqual(unsubscribe.status_code, 204)
+        self.client.force_authenticate(user=None)
+
+        request = self.request(access)
+        request.user
+        # 바뀐 버전을 DB에서 한 번 읽고, 구독 여부는 DB로 확인
+        with self.assertNumQueries(2):
+            self.assertFalse(is_subscriber(request, self.private_channel))
+
+        notices = self.client.get(
+            f"/api/v1/channels/{self.private_channel.id}/notices/",
+            HTTP_AUTHORIZATION=f"Bearer {access}",
+        )
+        self.assertEqual(notices.status_code, 403)
+
+    @override_settings(CHANNEL_CLAIMS_MAX_IDS=1)
+    def test_too_many_channels_are_not_embedded(self):
+        Channel.objects.create(
+            name="another", description="another", managers=self.user
+        ).subscribers.add(self.b)
+
+        request = self.request(self.login(self.b))
+        request.user
+        self.assertIsNone(subscribed_channel_ids(request))
+        self.assertTrue(is_subscriber(request, self.private_channel))
+
+
+class ChannelHomeTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="email@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+
+        self.manager = User.objects.create_user(
+            username="manager",
+            email="manager@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+
+        self.channels = [
+            Channel.objects.create(
+                name=f"channel{i}",
+                description="채널입니다.",
+                managers=self.manager,
+            )
+            for i in range(3)
+        ]
+        for channel in self.channels:
+            UserChannel.objects.create(
+                user=self.user, channel=channel, color=THEME_COLOR["ORANGE"]
+            )
+            for i in range(4):
+                Notice.objects.create(
+                    title=f"notice{i}",
+                    contents="공지사항입니다.",
+                    channel=channel,
+                    writer=self.manager,
+                )
+            Event.objects.create(
+                title="event",
+                channel=channel,
+                writer=self.manager,
+                has_time=False,
+                start_date="2022-03-10",
+                due_date="2022-03-11",
+            )
+
+        self.private_channel = Channel.objects.create(
+            name="private",
+            description="비공개 채널입니다.",
+            is_private=True,
+            managers=self.manager,
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_home(self):
+        with self.assertNumQueries(5):
+            response = self.client.get(
+                "/api/v1/channels/home/?month=2022-03&notices=2", format="json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            [channel["name"] for channel in data["channels"]],
+            ["channel0", "channel1", "channel2"],
+        )
+        self.assertEqual(data["channels"][0]["color"], THEME_COLOR["ORANGE"])
+        self.assertEqual(data["channels"][0]["subscribers_count"], 1)
+        self.assertEqual(data["channels"][0]["managers_id"], self.manager.id)
+        self.assertEqual(len(data["notices"]), 6)
+        self.assertEqual(data["notices"][0]["title"], "notice3")
+        self.assertEqual(len(data["events"]), 3)
+        self.assertEqual(data["events"][0]["channel_name"], "channel0")
+
+        response = self.client.get(
+            "/api/v1/channels/home/?month=2022-05", format="json"
+        )
+        self.assertEqual(len(response.json()["events"]), 0)
+
+    def test_home_query_count_does_not_depend_on_channels(self):
+        for i in range(5):
+            channel = Channel.objects.create(
+                name=f"more{i}", description="채널입니다.", managers=self.manager
+            )
+            UserChannel.objects.create(user=self.user, channel=channel, color="#000000")
+
+        with self.assertNumQueries(5):
+            response = self.client.get("/api/v1/channels/home/", format="json")
+        self.assertEqual(len(response.json()["channels"]), 8)
+
+    def test_home_with_channel_ids(self):
+        ids = f"{self.channels[1].id},{self.private_channel.id}"
+        response = self.client.get(f"/api/v1/channels/home/?channels={ids}")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            [channel["id"] for channel in data["channels"]], [self.channels[1].id]
+        )
+        self.assertEqual(len(data["notices"]), 3)
+
+        response = self.client.get("/api/v1/channels/home/?channels=a")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/api/v1/channels/home/?month=march")
+        self.assertEqual(response.status_code, 400)
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get("/api/v1/channels/home/")
+        self.assertEqual(response.status_code, 401)
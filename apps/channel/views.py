@@ -1,22 +1,50 @@
 from dataclasses import dataclass
 from multiprocessing import context
 from django.db.models import Q
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status, serializers
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotAuthenticated
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from apps.channel.claims import bump_version, is_subscriber, readable
 from apps.channel.exceptions import NoSubscriberInPrivateChannel
+from apps.channel.exports import subscriber_csv_lines
 
-from apps.channel.models import Channel, Image, UserChannel
+from apps.channel.models import AwaiterChannel, Channel, Image, UserChannel
+from apps.channel.name_index import channel_names
 from apps.channel.permission import ManagerCanModify
-from apps.channel.serializers import ChannelSerializer, UserChannelColorSerializer
+from apps.channel.rows import awaiter_rows, channel_rows, subscriber_rows
+from apps.channel.serializers import (
+    ChannelSerializer,
+    ChannelSummarySerializer,
+    UserChannelColorSerializer,
+)
+from apps.core.paginator import CreatedAtCursorPagination
 from apps.core.utils import THEME_COLOR, random_color
+from apps.event.models import Event
+from apps.event.serializers import EventChannelNameSerializer
+from apps.notice.models import Notice
+from apps.notice.serializers import NoticeChannelNameSerializer
+from apps.notice.views import MAX_RECENT_NOTICES, RECENT_NOTICES
 from apps.user.models import User
-from apps.user.serializers import UserSerializer
 import re
 
 
+AUTOCOMPLETE_COUNT = 10
+MAX_AUTOCOMPLETE_COUNT = 20
+
+
+class MemberCursorPagination(CreatedAtCursorPagination):
+    """
+    # 구독자, 대기자 목록 페이지네이터
+    * 구독(신청) 시각 순, 같은 시각이면 user id 순
+    """
+
+    ordering = ("created_at", "user_id")
+
+
 class ChannelViewSet(viewsets.ModelViewSet):
     queryset = Channel.objects.all()
     serializer_class = ChannelSerializer
@@ -68,13 +96,14 @@ class ChannelViewSet(viewsets.ModelViewSet):
                 serializer.is_valid(raise_exception=True)
                 serializer.save()
 
-                manager_obj = User.objects.get(
-                    username=data["managers_id"]
+                manager_obj = (
+                    User.objects.get(username=data["managers_id"])
                     if data["managers_id"]
-                    else user.username
+                    else User.objects.get(id=user.id)
                 )
                 channel.managers = manager_obj
                 channel.subscribers.add(manager_obj)
+                bump_version(manager_obj.id)
                 channel.save()
 
                 color_serializer = UserChannelColorSerializer(
@@ -109,9 +138,11 @@ class ChannelViewSet(viewsets.ModelViewSet):
         * pagination 적용됨.
         """
         qs = Channel.objects.filter(is_personal=False)
-        page = self.paginate_queryset(qs)
+        page = self.paginate_queryset(
+            channel_rows.values(qs, context={"request": request})
+        )
 
-        data = self.get_serializer(page, many=True, context={"request": request}).data
+        data = channel_rows.to_representation(page)
         return self.get_paginated_response(data)
 
     def partial_update(self, request, pk=None):
@@ -147,6 +178,7 @@ class ChannelViewSet(viewsets.ModelViewSet):
                 manager = User.objects.get(username=data["managers_id"])
                 channel.managers = manager
                 channel.subscribers.add(manager)
+                bump_version(manager.id)
 
         serializer = self.get_serializer(channel, data=data, partial=True)
         serializer.is_valid(raise_exception=True)
@@ -181,7 +213,9 @@ class ChannelViewSet(viewsets.ModelViewSet):
             )
 
         self.check_object_permissions(self.request, channel)
+        subscriber_ids = list(channel.subscribers.values_list("id", flat=True))
         channel.delete()
+        bump_version(*subscriber_ids)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def retrieve(self, request, pk=None):
@@ -191,10 +225,7 @@ class ChannelViewSet(viewsets.ModelViewSet):
         * private channel은 `400`
         """
         channel = self.get_object()
-        if (
-            channel.is_private
-            and not channel.subscribers.filter(id=request.user.id).exists()
-        ):
+        if channel.is_private and not is_subscriber(request, channel):
             return Response(
                 {"error": "private channel은 열람할 수 없습니다."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -208,32 +239,33 @@ class ChannelViewSet(viewsets.ModelViewSet):
         # 구독
         * {channel_pk}에는 구독하려는 channel의 id를 넣으면 됨
         * 이미 구독중이라면 400
-        * 비공개 채널이라면 대기자 명단에 올라감
+        * 비공개 채널이라면 대기자 명단에 올라감, 이미 대기 중이면 그대로 204
+        * 공개 채널 구독은 색을 정해 INSERT 한 번으로 처리하고, 동시에 여러 번 요청해도
+          (subscribe_should_be_unique) 구독은 하나만 생기며 나머지 요청은 400
         """
+        user = request.user
         channel = self.get_object()
 
-        if channel.subscribers.filter(id=request.user.id).exists():
-            return Response(
-                {"error": "이미 구독 중입니다."}, status=status.HTTP_400_BAD_REQUEST
-            )
-
         if channel.is_private:
-            channel.awaiters.add(request.user)
-
-        else:
-            channel.subscribers.add(request.user)
+            if channel.subscribers.filter(id=user.id).exists():
+                return Response(
+                    {"error": "이미 구독 중입니다."}, status=status.HTTP_400_BAD_REQUEST
+                )
+            AwaiterChannel.objects.bulk_create(
+                [AwaiterChannel(channel=channel, user=user)], ignore_conflicts=True
+            )
+            return Response(status=status.HTTP_204_NO_CONTENT)
 
-            color_serializer = UserChannelColorSerializer(
-                UserChannel.objects.get(channel=channel, user=request.user),
-                data={
-                    "channel": channel,
-                    "user": request.user,
-                    "color": random_color(),
-                },
-                context={"request": request},
+        try:
+            with transaction.atomic():
+                UserChannel.objects.create(
+                    channel=channel, user=user, color=random_color()
+                )
+        except IntegrityError:
+            return Response(
+                {"error": "이미 구독 중입니다."}, status=status.HTTP_400_BAD_REQUEST
             )
-            color_serializer.is_valid(raise_exception=True)
-            color_serializer.save()
+        bump_version(user.id)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -242,38 +274,79 @@ class ChannelViewSet(viewsets.ModelViewSet):
         """
         # 구독 취소
         * {channel_pk}에는 구독 취소하려는 channel의 id를 넣으면 됨
+        * 구독 중이거나 대기 중이면 DELETE 한 번으로 취소
         * 구독 중이지 않다면 400
         """
         user = request.user
         channel = self.get_object()
 
-        if (
-            not channel.subscribers.filter(id=user.id).exists()
-            and not channel.awaiters.filter(id=user.id).exists()
-        ):
+        deleted, _ = UserChannel.objects.filter(channel=channel, user=user).delete()
+        if deleted:
+            bump_version(user.id)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        deleted, _ = AwaiterChannel.objects.filter(channel=channel, user=user).delete()
+        if not deleted:
             return Response(
                 {"error": "구독 중이 아닙니다."}, status=status.HTTP_400_BAD_REQUEST
             )
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
-        if channel.awaiters.filter(id=user.id).exists():
-            channel.awaiters.remove(request.user)
+    @action(detail=True, methods=["get"], pagination_class=MemberCursorPagination)
+    def subscribers(self, request, pk):
+        """
+        # 구독자 명단
+        * {id}에는 channel의 id를 넣으면 됨
+        * 채널 매니저만 가능
+        * 먼저 구독한 순서, 각 구독자는 `id`, `username`, `email`, `first_name`, `last_name`, `subscribed_at`(구독 시각)
+        * params의 'q'로 username 앞부분 검색
+        * cursor pagination 적용됨, `page_size`로 한 페이지 크기를 바꿀 수 있음
+        """
+        channel = self.get_object()
+        qs = UserChannel.objects.filter(channel=channel)
+        keyword = request.query_params.get("q")
+        if keyword:
+            qs = qs.filter(user__username__istartswith=keyword)
 
-        else:
-            channel.subscribers.remove(request.user)
+        page = self.paginate_queryset(subscriber_rows.values(qs))
+        return self.get_paginated_response(subscriber_rows.to_representation(page))
 
-        return Response(status=status.HTTP_204_NO_CONTENT)
+    @action(detail=True, methods=["get"], url_path="subscribers/csv")
+    def subscribers_csv(self, request, pk):
+        """
+        # 구독자 명단 CSV 다운로드
+        * {id}에는 channel의 id를 넣으면 됨
+        * 채널 매니저만 가능
+        * 열은 `id`, `username`, `email`, `first_name`, `last_name`, `subscribed_at`
+        * 구독자가 많아도 메모리를 일정하게 쓰도록 나눠 읽으면서 내려보냄
+        """
+        channel = self.get_object()
+        response = StreamingHttpResponse(
+            subscriber_csv_lines(channel), content_type="text/csv; charset=utf-8"
+        )
+        filename = f"channel-{channel.id}-subscribers.csv"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
 
-    @action(detail=True, methods=["get"])
+    @action(detail=True, methods=["get"], pagination_class=MemberCursorPagination)
     def awaiters(self, request, pk):
         """
         # 대기자 명단
         * {id}에는 channel의 id를 넣으면 됨
-        * 해당 (비공개)채널에 구독을 신청한 대기자들의 목록
+        * 해당 (비공개)채널에 구독을 신청한 대기자들의 목록, 먼저 신청한 순서
+        * 채널 매니저만 가능
+        * 각 대기자는 `id`, `username`, `email`, `first_name`, `last_name`, `requested_at`(신청 시각)
+        * params의 'q'로 username 앞부분 검색
+        * cursor pagination 적용됨, `page_size`로 한 페이지 크기를 바꿀 수 있음
         """
         channel = self.get_object()
-        awaiters = channel.awaiters
-        serializer = UserSerializer(awaiters, partial=True, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        qs = AwaiterChannel.objects.filter(channel=channel)
+        keyword = request.query_params.get("q")
+        if keyword:
+            qs = qs.filter(user__username__istartswith=keyword)
+
+        page = self.paginate_queryset(awaiter_rows.values(qs))
+        return self.get_paginated_response(awaiter_rows.to_representation(page))
 
     @action(
         detail=True, methods=["post"], url_path="awaiters/allow/(?P<user_pk>[^/.]+)"
@@ -303,6 +376,7 @@ class ChannelViewSet(viewsets.ModelViewSet):
         else:
             channel.subscribers.add(user)
             channel.awaiters.remove(user)
+            bump_version(user.id)
 
             color_serializer = UserChannelColorSerializer(
                 UserChannel.objects.get(channel=channel, user=user),
@@ -341,6 +415,92 @@ class ChannelViewSet(viewsets.ModelViewSet):
             channel.awaiters.remove(user)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    def requested_awaiters(self, request, channel):
+        """
+        # 요청 body의 `users`(user id 목록 또는 `"all"`)로 고른 대기자
+        * `(요청한 user id 집합 또는 None, 그중 대기 중인 user id 집합)`
+        * 여러 요청이 같은 대기자를 동시에 처리하지 않도록 대기 row를 잠금
+        """
+        users = request.data.get("users")
+        awaiters = AwaiterChannel.objects.select_for_update().filter(channel=channel)
+        if users == "all":
+            return None, set(awaiters.values_list("user_id", flat=True))
+        if (
+            not isinstance(users, list)
+            or not users
+            or not all(type(user_id) is int for user_id in users)
+        ):
+            raise serializers.ValidationError(
+                {"users": "user id 목록이나 'all'을 입력해야 합니다."}
+            )
+        requested = set(users)
+        awaiters = awaiters.filter(user_id__in=requested)
+        return requested, set(awaiters.values_list("user_id", flat=True))
+
+    def awaiter_results(self, channel, requested, awaiting, done):
+        """
+        # 유저별 처리 결과
+        * `done`: 수락 또는 거절됨, `subscribed`: 이미 구독 중, `not_awaiting`: 구독 신청한 적이 없음
+        """
+        subscribed = set(
+            UserChannel.objects.filter(
+                channel=channel,
+                user_id__in=awaiting if requested is None else requested,
+            ).values_list("user_id", flat=True)
+        )
+        results = {user_id: "not_awaiting" for user_id in requested or ()}
+        results.update({user_id: done for user_id in awaiting})
+        results.update({user_id: "subscribed" for user_id in subscribed})
+        return results
+
+    @action(detail=True, methods=["post"], url_path="awaiters/allow")
+    def bulk_allow(self, request, pk):
+        """
+        # 매니저가 여러 대기자의 구독을 한 번에 수락하는 API
+        * {id}에는 channel의 id를 넣으면 됨
+        * body: `{"users": [user id, ...]}` 또는 `{"users": "all"}`(모든 대기자)
+        * 채널 매니저만 가능
+        * 한 transaction에서 구독(`UserChannel`)을 bulk_create, 대기(`AwaiterChannel`)를 한 번에 삭제
+        * 응답: `{"results": {user id: "allowed" | "subscribed" | "not_awaiting"}}`
+          * 이미 구독 중이거나 구독 신청한 적이 없는 유저는 건너뜀
+        """
+        channel = self.get_object()
+        with transaction.atomic():
+            requested, awaiting = self.requested_awaiters(request, channel)
+            results = self.awaiter_results(channel, requested, awaiting, "allowed")
+            allowed = [user_id for user_id in awaiting if results[user_id] == "allowed"]
+            UserChannel.objects.bulk_create(
+                [
+                    UserChannel(channel=channel, user_id=user_id, color=random_color())
+                    for user_id in allowed
+                ],
+                ignore_conflicts=True,
+            )
+            AwaiterChannel.objects.filter(
+                channel=channel, user_id__in=awaiting
+            ).delete()
+        bump_version(*allowed)
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    @bulk_allow.mapping.delete
+    def bulk_disallow(self, request, pk):
+        """
+        # 매니저가 여러 대기자의 구독을 한 번에 거절하는 API
+        * {id}에는 channel의 id를 넣으면 됨
+        * body: `{"users": [user id, ...]}` 또는 `{"users": "all"}`(모든 대기자)
+        * 채널 매니저만 가능
+        * 대기(`AwaiterChannel`)를 한 번에 삭제
+        * 응답: `{"results": {user id: "rejected" | "subscribed" | "not_awaiting"}}`
+        """
+        channel = self.get_object()
+        with transaction.atomic():
+            requested, awaiting = self.requested_awaiters(request, channel)
+            results = self.awaiter_results(channel, requested, awaiting, "rejected")
+            AwaiterChannel.objects.filter(
+                channel=channel, user_id__in=awaiting
+            ).delete()
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
     @action(detail=False, methods=["get"])
     def recommend(self, request):
         """
@@ -388,6 +548,102 @@ class ChannelViewSet(viewsets.ModelViewSet):
         data = self.get_serializer(page, context={"request": request}, many=True).data
         return self.get_paginated_response(data)
 
+    @action(detail=False, methods=["get"])
+    def autocomplete(self, request):
+        """
+        # 채널 이름 자동완성 API
+        * params의 'q'로 검색어를 받음, 공개 채널 중 이름이나 이름의 단어가 검색어로 시작하는 채널
+        * 한글은 입력 중인 글자로도 찾을 수 있음 (`와ㅍ`, `왚` → `와플스튜디오`)
+        * params의 'count'로 개수를 받음, 기본 10개 최대 20개
+        * DB 대신 프로세스 메모리의 index에서 찾으므로, 새로 바뀐 채널은 최대 몇 분 늦게 반영될 수 있음
+        * 응답: `[{"id": 채널 id, "name": 채널 이름}, ...]`
+        """
+        keyword = request.query_params.get("q", "")
+        if not keyword.strip():
+            return Response(
+                {"error": "검색어를 입력해주세요"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            count = int(request.query_params.get("count", AUTOCOMPLETE_COUNT))
+        except ValueError:
+            count = AUTOCOMPLETE_COUNT
+        count = min(max(count, 1), MAX_AUTOCOMPLETE_COUNT)
+
+        channel_names.ensure_fresh()
+        return Response(
+            [
+                {"id": channel_id, "name": name}
+                for channel_id, name in channel_names.search(keyword, count)
+            ]
+        )
+
+    @action(detail=False, methods=["get"])
+    def home(self, request):
+        """
+        # 홈 화면에 필요한 데이터를 한 번에 가져오는 API
+        * params의 'channels'로 채널 id 목록을 `1,2,3` 형식으로 받음, `me`(기본값)면 구독 중인 채널들
+        * params의 'month'로 yyyy-mm 형식의 달을 받음, 없으면 이번 달
+        * params의 'notices'로 채널마다 가져올 최근 공지사항 개수를 받음 (기본 3, 최대 10)
+        * `channels`: 채널 요약과 유저가 지정한 색, `notices`: 채널별 최근 공지사항, `events`: 그 달의 일정
+        * 볼 수 없는 채널은 빠짐
+        * 채널 수와 관계없이 쿼리 수가 일정함
+        """
+        channels = request.query_params.get("channels", "me")
+        try:
+            if channels == "me":
+                if not request.user.is_authenticated:
+                    raise NotAuthenticated()
+                channel_ids = UserChannel.objects.filter(user=request.user).values(
+                    "channel_id"
+                )
+            else:
+                channel_ids = [int(channel_id) for channel_id in channels.split(",")]
+            count = int(request.query_params.get("notices", RECENT_NOTICES))
+            events = Event.objects.in_month(request.query_params.get("month"))
+        except ValueError:
+            return Response(
+                {"error": "Wrong channels, month or notices."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        channels = list(
+            Channel.objects.filter(id__in=channel_ids)
+            .filter(readable(request, prefix=""))
+            .order_by("id")
+        )
+        channel_ids = [channel.id for channel in channels]
+
+        colors = {}
+        if request.user.is_authenticated:
+            colors = dict(
+                UserChannel.objects.filter(
+                    user=request.user, channel_id__in=channel_ids
+                ).values_list("channel_id", "color")
+            )
+        notices = Notice.objects.recent(
+            channel_ids, max(1, min(count, MAX_RECENT_NOTICES))
+        )
+        events = (
+            events.select_related("channel")
+            .filter(channel_id__in=channel_ids)
+            .order_by("start_date", "id")
+        )
+
+        context = {"request": request, "colors": colors}
+        return Response(
+            {
+                "channels": ChannelSummarySerializer(
+                    channels, many=True, context=context
+                ).data,
+                "notices": NoticeChannelNameSerializer(
+                    notices, many=True, context=context
+                ).data,
+                "events": EventChannelNameSerializer(
+                    events, many=True, context=context
+                ).data,
+            }
+        )
+
     @action(detail=True, methods=["patch"])
     def color(self, request, pk):
         """
@@ -397,15 +653,18 @@ class ChannelViewSet(viewsets.ModelViewSet):
         * 그 채널을 구독한 상태가 아니면 400
         * 색상은 # 뒤에 6자리 hex code를 입력한 7자리 string으로 입력
         * 각 채널에 지정한 색은 그 유저에게만 귀속됨, 타 유저에게는 영향을 미치지 않음
+        * 응답은 `{"channel": 채널 id, "user": 유저 id, "color": 색}`, `?expand=channel,user`로 채널, 유저 정보를 펼칠 수 있음
         """
         channel = self.get_object()
-        if not channel.subscribers.filter(id=request.user.id).exists():
+        try:
+            user_channel = UserChannel.objects.get(channel=channel, user=request.user)
+        except UserChannel.DoesNotExist:
             return Response(
                 {"error": "구독 중이 아닙니다."}, status=status.HTTP_400_BAD_REQUEST
             )
 
         color_serializer = UserChannelColorSerializer(
-            UserChannel.objects.get(channel=channel, user=request.user),
+            user_channel,
             data=request.data,
             partial=True,
             context={"request": request},
@@ -421,12 +680,14 @@ class ChannelViewSet(viewsets.ModelViewSet):
         # 채널 색상 GET API
         * {id}에는 channel의 id를 넣으면 됨
         * 구독자가 아닌 경우 테마 색상 중 랜덤으로 하나를 반환
+        * 응답은 `{"channel": 채널 id, "user": 유저 id, "color": 색}`, `?expand=channel,user`로 채널, 유저 정보를 펼칠 수 있음
         """
         channel = self.get_object()
-        if not channel.subscribers.filter(id=request.user.id).exists():
+        try:
+            user_channel = UserChannel.objects.get(channel=channel, user=request.user)
+        except UserChannel.DoesNotExist:
             return Response({"color": random_color()})
         serializer = UserChannelColorSerializer(
-            UserChannel.objects.get(channel=channel, user=request.user),
-            context={"request": request},
+            user_channel, context={"request": request}
         )
         return Response(serializer.data)
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.core.signals import request_finished, request_started
+
+
+class CoreConfig(AppConfig):
+    name = "apps.core"
+
+    def ready(self):
+        from apps.core import db
+
+        request_started.connect(db.check_connections)
+        request_finished.connect(db.mark_connections_idle)
@@ -9,8 +9,12 @@ https://docs.djangoproject.com/en/3.1/howto/deployment/asgi/
 
 import os
 
+import dotenv
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps.settings")
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+dotenv.read_dotenv(os.path.join(BASE_DIR, ".env"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings.prod")
 
 application = get_asgi_application()
@@ -0,0 +1,122 @@
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.functional import SimpleLazyObject
+from rest_framework.permissions import SAFE_METHODS
+
+
+def check_connections(**kwargs):
+    """
+    # 요청 시작 시 재사용할 DB 연결 확인
+    * `DB_HEALTH_CHECK_INTERVAL`초 이상 쉰 연결만 ping으로 확인하고, 끊긴 연결은 닫음
+    * 닫힌 연결은 첫 쿼리 때 다시 연결되므로, DB가 유휴 연결을 끊어도 요청이 실패하지 않음
+    """
+    now = time.monotonic()
+    for conn in connections.all():
+        if conn.connection is None or conn.in_atomic_block:
+            continue
+        idle_since = getattr(conn, "idle_since", None)
+        if idle_since is None or now - idle_since < settings.DB_HEALTH_CHECK_INTERVAL:
+            continue
+        if not conn.is_usable():
+            conn.close()
+
+
+def mark_connections_idle(**kwargs):
+    now = time.monotonic()
+    for conn in connections.all():
+        if conn.connection is not None:
+            conn.idle_since = now
+
+
+_routing = ContextVar("replica_routing", default=None)
+
+PIN_KEY = "replica-pin:{}"
+
+
+class _RoutingState:
+    def __init__(self, request):
+        self.request = request
+        self.use_primary = request.method not in SAFE_METHODS
+        self.pin_checked = self.use_primary
+
+    def user_id(self):
+        # 인증 전에 request.user를 건드리면 세션 조회로 다시 라우터를 타게 되므로,
+        # DRF가 인증 후 넣어 준 유저만 사용
+        user = self.request.__dict__.get("user")
+        if user is None or isinstance(user, SimpleLazyObject):
+            return None
+        return user.id
+
+    def is_pinned(self):
+        # 한 요청 안에서는 처음 확인한 결과를 계속 사용
+        if not self.pin_checked:
+            user_id = self.user_id()
+            if user_id is None:
+                return False
+            self.use_primary = cache.get(PIN_KEY.format(user_id)) is not None
+            self.pin_checked = True
+        return self.use_primary
+
+
+class PrimaryReplicaRouter:
+    """
+    # primary/replica DB 라우터
+    * 요청 밖(관리 명령 등)이나 쓰기 요청, 트랜잭션 안의 읽기는 primary로 보냄
+    * GET 등 안전한 요청의 읽기는 replica 중 하나로 보냄
+    * 쓰기 요청을 보낸 유저는 `REPLICA_PIN_SECONDS` 동안 primary에서 읽음
+      * 다음 요청이 다른 worker로 가도 보이도록 pin은 공유 캐시(`REDIS_URL`)에 둠
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        state = _routing.get()
+        if (
+            not replicas
+            or state is None
+            or connections["default"].in_atomic_block
+            or state.is_pinned()
+        ):
+            return "default"
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica는 primary와 같은 데이터를 가지므로 DB가 달라도 관계를 허용함
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+class ReplicaRoutingMiddleware:
+    """
+    # 요청 정보를 라우터에 넘기고, 쓰기 요청을 보낸 유저를 primary에 고정
+    * replica가 설정되지 않았으면 미들웨어 체인에서 빠짐
+    """
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = _RoutingState(request)
+        token = _routing.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+
+        if request.method not in SAFE_METHODS:
+            user_id = state.user_id()
+            if user_id is not None:
+                cache.set(PIN_KEY.format(user_id), 1, settings.REPLICA_PIN_SECONDS)
+        return response
@@ -6,3 +6,30 @@ class SerializerChoiceMixin:
             return self.serializer_classes[self.action]
         else:
             return self.serializer_classes["default"]
+
+
+class ExpandableFieldsMixin:
+    """
+    # `?expand=`로 펼칠 수 있는 관계 필드
+    * `expandable_fields`: 필드 이름 → 중첩해서 보낼 serializer 클래스
+    * 기본 응답에는 연결된 객체의 id만 담고, `?expand=channel,user`처럼 요청한 필드만 중첩 serializer로 보냄
+    * context에 `expand`가 있으면 query parameter 대신 사용
+    * 펼칠 수 없는 이름은 무시
+    """
+
+    expandable_fields = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        expand = self.get_expand()
+        for name, serializer_class in self.expandable_fields.items():
+            if name in expand:
+                fields[name] = serializer_class(read_only=True)
+        return fields
+
+    def get_expand(self):
+        if "expand" in self.context:
+            return set(self.context["expand"])
+        request = self.context.get("request")
+        query_params = getattr(request, "query_params", {})
+        return {name.strip() for name in query_params.get("expand", "").split(",")}
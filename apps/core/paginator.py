@@ -1,4 +1,11 @@
-from rest_framework.pagination import CursorPagination
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, _reverse_ordering
+
+from apps.core.rows import resolve_field
 
 
 class IDCursorPagination(CursorPagination):
@@ -12,12 +19,108 @@ class IDCursorPagination(CursorPagination):
     ordering = "-id"
 
 
-class IssuedDateCursorPagination(CursorPagination):
+class CreatedAtCursorPagination(CursorPagination):
     """
-    # ID 기반 페이지네이터
-    * page size는 10,
-    * order by issued_date desc,
+    # 작성 시각 기반 페이지네이터
+    * page size는 10, query parameter `page_size`로 최대 100까지 바꿀 수 있음
+    * order by created_at desc, id desc
+    * cursor에 마지막 row의 (created_at, id)를 담아 `WHERE (created_at, id) < cursor`로 다음 페이지를 읽음
+      * DRF의 `CursorPagination`과 달리 offset을 쓰지 않으므로 created_at이 같은 row가 많아도,
+        아무리 뒤의 페이지여도 한 페이지를 읽는 비용이 같음
+      * `(channel, created_at, id)` index와 함께 사용
+    * `.values()`로 만든 dict row도 페이지로 나눌 수 있음 (ordering 필드가 포함되어야 함)
+    * ordering에 `"channel__id"`처럼 연결된 모델의 필드를 쓸 수 있음
     """
 
     page_size = 10
-    ordering = "-issued_date"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.fields = [field.lstrip("-") for field in self.ordering]
+        self.model = queryset.model
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            reverse, position = False, None
+        else:
+            reverse, position = self.cursor.reverse, self.cursor.position
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after(position, reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following = len(results) > self.page_size
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_following
+        else:
+            self.has_next, self.has_previous = has_following, position is not None
+        if not self.page:
+            self.has_next = self.has_previous = False
+
+        return self.page
+
+    def after(self, position, reverse):
+        """
+        # ordering 순서로 `position` 뒤에 오는 row를 고르는 조건
+        * `(a, b) < (x, y)`를 `a < x OR (a = x AND b < y)`로 풀어서 씀
+        """
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return condition
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        cursor = Cursor(offset=0, reverse=False, position=self.position(self.page[-1]))
+        return self.encode_cursor(cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        cursor = Cursor(offset=0, reverse=True, position=self.position(self.page[0]))
+        return self.encode_cursor(cursor)
+
+    def position(self, item):
+        if isinstance(item, dict):
+            return [item[field] for field in self.fields]
+        return [getattr(item, field) for field in self.fields]
+
+    def decode_cursor(self, request):
+        cursor = super().decode_cursor(request)
+        if cursor is None:
+            return None
+
+        try:
+            values = json.loads(cursor.position)
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError
+            position = [
+                resolve_field(self.model, field).to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=cursor.reverse, position=position)
+
+    def encode_cursor(self, cursor):
+        position = json.dumps([str(value) for value in cursor.position])
+        return super().encode_cursor(cursor._replace(position=position))
@@ -0,0 +1,223 @@
+"""
+# 요청 단위 프로파일링
+* `PROFILING_SAMPLE_RATE` 비율의 요청에 대해 전체 시간, SQL 수/시간, serializer 시간, 응답 크기를 기록
+* DRF의 view/action 이름(`ChannelViewSet.search` 등)별로 최근 `PROFILING_MAX_SAMPLES`개를 모아 p50/p95/p99를 계산
+* 집계는 worker 프로세스마다 따로 하며, staff만 `profiling/`(JSON), `profiling/metrics/`(Prometheus)로 볼 수 있음
+"""
+import random
+import threading
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+
+_current = ContextVar("profile", default=None)
+
+QUANTILES = (0.5, 0.95, 0.99)
+METRICS = (
+    ("wall_time", "snuday_request_duration_seconds", "요청 처리 시간"),
+    ("sql_time", "snuday_request_sql_duration_seconds", "요청당 SQL 시간"),
+    ("sql_count", "snuday_request_sql_queries", "요청당 SQL 수"),
+    (
+        "serializer_time",
+        "snuday_request_serializer_duration_seconds",
+        "요청당 serializer 시간",
+    ),
+    ("response_size", "snuday_response_size_bytes", "응답 크기"),
+)
+
+
+def view_name(view_func, method):
+    """
+    # view 함수에서 `ViewSet.action` 형식의 이름을 만듦
+    """
+    cls = getattr(view_func, "cls", None)
+    if cls is None:
+        return getattr(view_func, "__name__", "unknown")
+    actions = getattr(view_func, "actions", None) or {}
+    return f"{cls.__name__}.{actions.get(method.lower(), method.lower())}"
+
+
+class Profile:
+    def __init__(self):
+        self.endpoint = None
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+
+    def record_query(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += perf_counter() - started
+            self.sql_count += 1
+
+
+class ProfileStore:
+    def __init__(self, max_samples):
+        self.max_samples = max_samples
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def add(self, endpoint, sample):
+        with self.lock:
+            if endpoint not in self.samples:
+                self.samples[endpoint] = deque(maxlen=self.max_samples)
+            self.samples[endpoint].append(sample)
+
+    def clear(self):
+        with self.lock:
+            self.samples.clear()
+
+    def summary(self):
+        with self.lock:
+            samples = {endpoint: list(rows) for endpoint, rows in self.samples.items()}
+
+        summary = {}
+        for endpoint, rows in samples.items():
+            summary[endpoint] = {"count": len(rows)}
+            for key, _, _ in METRICS:
+                values = sorted(row[key] for row in rows)
+                summary[endpoint][key] = {
+                    "sum": sum(values),
+                    **{
+                        f"p{int(q * 100)}": values[
+                            min(len(values) - 1, int(len(values) * q))
+                        ]
+                        for q in QUANTILES
+                    },
+                }
+        return summary
+
+
+store = ProfileStore(settings.PROFILING_MAX_SAMPLES)
+
+
+@contextmanager
+def serializing():
+    """
+    # 블록을 실행하는 시간을 현재 프로파일의 serializer 시간에 더함
+    * 중첩된 경우 가장 바깥 것만 잼
+    """
+    profile = _current.get()
+    if profile is None or profile.serializer_depth:
+        yield
+        return
+
+    profile.serializer_depth += 1
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        profile.serializer_time += perf_counter() - started
+        profile.serializer_depth -= 1
+
+
+def install_serializer_timer():
+    """
+    # serializer의 `.data` 계산 시간을 현재 프로파일에 더하도록 함
+    """
+    fget = BaseSerializer.data.fget
+    if getattr(fget, "profiled", False):
+        return
+
+    def data(self):
+        with serializing():
+            return fget(self)
+
+    data.profiled = True
+    BaseSerializer.data = property(data)
+
+
+class ProfilingMiddleware:
+    """
+    # 요청을 표본 추출해 프로파일을 기록하는 미들웨어
+    * `PROFILING_SAMPLE_RATE`가 0이면 미들웨어 체인에서 빠짐
+    """
+
+    def __init__(self, get_response):
+        if settings.PROFILING_SAMPLE_RATE <= 0:
+            raise MiddlewareNotUsed
+        install_serializer_timer()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= settings.PROFILING_SAMPLE_RATE:
+            return self.get_response(request)
+
+        profile = Profile()
+        token = _current.set(profile)
+        started = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(profile.record_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        wall_time = perf_counter() - started
+
+        if profile.endpoint is not None:
+            store.add(
+                profile.endpoint,
+                {
+                    "wall_time": wall_time,
+                    "sql_count": profile.sql_count,
+                    "sql_time": profile.sql_time,
+                    "serializer_time": profile.serializer_time,
+                    "response_size": 0 if response.streaming else len(response.content),
+                },
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = _current.get()
+        if profile is not None:
+            profile.endpoint = view_name(view_func, request.method)
+
+
+def prometheus_text(summary):
+    lines = []
+    for key, name, description in METRICS:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} summary")
+        for endpoint, row in sorted(summary.items()):
+            label = f'endpoint="{endpoint}"'
+            for q in QUANTILES:
+                value = row[key][f"p{int(q * 100)}"]
+                lines.append(f'{name}{{{label},quantile="{q}"}} {value}')
+            lines.append(f"{name}_sum{{{label}}} {row[key]['sum']}")
+            lines.append(f"{name}_count{{{label}}} {row['count']}")
+    return "\n".join(lines) + "\n"
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def profiling_summary(request):
+    """
+    # endpoint별 프로파일 요약 (staff 전용)
+    * 이 worker가 기록한 최근 표본에 대한 p50/p95/p99
+    """
+    return Response(store.summary())
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def profiling_metrics(request):
+    """
+    # endpoint별 프로파일 요약을 Prometheus text 형식으로 반환 (staff 전용)
+    """
+    return HttpResponse(
+        prometheus_text(store.summary()), content_type="text/plain; version=0.0.4"
+    )
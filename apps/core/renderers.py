@@ -0,0 +1,59 @@
+"""
+# orjson 기반 JSON renderer, parser
+* DRF의 `JSONRenderer`, `JSONParser`와 같은 결과를 내면서 직렬화, 파싱을 orjson으로 처리함
+* orjson이 설치되지 않았거나 orjson이 다룰 수 없는 경우(들여쓰기 요청, 64비트를 넘는 정수,
+  UTF-8이 아닌 요청 등)에는 DRF의 구현으로 처리함
+* `datetime`, `date`, `time`은 DRF의 `JSONEncoder`로 넘겨 기존과 같은 형식(UTC는 `Z`)을 유지하고,
+  `Decimal`, lazy string(번역된 에러 메시지) 등 orjson이 모르는 타입도 `JSONEncoder`가 처리함
+"""
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# DRF와 같이 JavaScript 문자열 안에서 줄바꿈으로 해석되는 문자는 escape함
+LINE_SEPARATORS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if orjson is None or self.get_indent(
+            accepted_media_type, renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=JSONEncoder().default, option=OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for character, escaped in LINE_SEPARATORS:
+            if character in ret:
+                ret = ret.replace(character, escaped)
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
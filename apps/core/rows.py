@@ -0,0 +1,147 @@
+"""
+# 읽기 전용 목록을 위한 row 직렬화
+* `.values()`로 읽은 dict row를 응답 dict로 바꾸는 함수를 모델, 필드 정의로부터 미리 만들어 둠
+* DRF `ModelSerializer`처럼 모델 인스턴스와 serializer 필드 객체를 row마다 만들지 않음
+* 응답 형식은 기존 serializer와 같게 맞추고, 각 앱의 `rows.py`에 정의, 테스트로 결과를 비교함
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import DateField, DateTimeField, FileField, TimeField
+from django.db.models.expressions import BaseExpression
+from django.utils import timezone
+
+from apps.core.profiling import serializing
+
+
+def datetime_formatter():
+    """
+    # DRF `DateTimeField`와 같은 형식으로 바꾸는 함수 (현재 timezone 기준, UTC는 `Z`)
+    """
+    current = timezone.get_current_timezone()
+
+    def format_datetime(value):
+        value = value.astimezone(current).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return format_datetime
+
+
+def resolve_field(model, lookup):
+    """
+    # lookup이 가리키는 모델 필드, annotation이면 `None`
+    """
+    field = None
+    for name in lookup.split("__"):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if field.is_relation:
+            model = field.related_model
+    return field
+
+
+class RowSerializer:
+    """
+    # `columns`: 응답 필드 이름 → 값을 읽을 곳
+    * `"channel__name"` 같은 lookup 문자열: 모델 필드 종류에 따라 날짜, 시각, 파일 URL로 변환
+    * query expression(`Subquery` 등): 그 결과를 그대로 사용
+    * `context`를 받아 expression을 돌려주는 함수: 요청한 유저에 따라 달라지는 값
+    * dict: 중첩된 객체, 안의 값이 모두 `None`이면(연결된 객체가 없으면) `None`
+    """
+
+    def __init__(self, model, columns):
+        self.model = model
+        self.columns = columns
+        self.lookups = []
+        self.expressions = {}
+        self.dynamic = {}
+        self.template = self.compile(columns, prefix="")
+
+    def compile(self, columns, prefix):
+        template = []
+        for name, source in columns.items():
+            key = f"{prefix}{name}"
+            if isinstance(source, dict):
+                template.append((name, self.compile(source, prefix=f"{key}__"), None))
+            elif isinstance(source, str):
+                if source not in self.lookups:
+                    self.lookups.append(source)
+                template.append((name, source, self.converter(source)))
+            elif isinstance(source, BaseExpression):
+                alias = self.alias()
+                self.expressions[alias] = source
+                template.append((name, alias, None))
+            elif callable(source):
+                alias = self.alias()
+                self.dynamic[alias] = source
+                template.append((name, alias, None))
+            else:
+                raise TypeError(f"Unsupported column source for {key}: {source!r}")
+        return template
+
+    def alias(self):
+        return f"_column{len(self.expressions) + len(self.dynamic)}"
+
+    def converter(self, lookup):
+        field = resolve_field(self.model, lookup)
+        if isinstance(field, DateTimeField):
+            return DateTimeField
+        if isinstance(field, (DateField, TimeField)):
+            return _isoformat
+        if isinstance(field, FileField):
+            storage = field.storage
+            return lambda name: storage.url(name) if name else None
+        return None
+
+    def values(self, queryset, context=None):
+        """
+        # 필요한 컬럼만 읽는 `.values()` queryset
+        * 페이지네이션을 적용한 뒤 `to_representation`에 넘김
+        """
+        expressions = dict(self.expressions)
+        for alias, source in self.dynamic.items():
+            expressions[alias] = source(context or {})
+        # prefetch는 모델 인스턴스에만 적용할 수 있음
+        return queryset.prefetch_related(None).values(*self.lookups, **expressions)
+
+    def to_representation(self, rows):
+        format_datetime = datetime_formatter()
+        template = self.resolve(self.template, format_datetime)
+        with serializing():
+            return [self.build(template, row) for row in rows]
+
+    def __call__(self, queryset, context=None):
+        return self.to_representation(self.values(queryset, context))
+
+    @classmethod
+    def resolve(cls, template, format_datetime):
+        # 요청마다 현재 timezone이 다를 수 있어서 datetime 변환 함수는 여기서 정함
+        resolved = []
+        for name, source, convert in template:
+            if isinstance(source, list):
+                source = cls.resolve(source, format_datetime)
+            elif convert is DateTimeField:
+                convert = format_datetime
+            resolved.append((name, source, convert))
+        return resolved
+
+    @classmethod
+    def build(cls, template, row):
+        data = {}
+        for name, source, convert in template:
+            if isinstance(source, list):
+                value = cls.build(source, row)
+                if all(item is None for item in value.values()):
+                    value = None
+            else:
+                value = row[source]
+                if convert is not None and value is not None:
+                    value = convert(value)
+            data[name] = value
+        return data
+
+
+def _isoformat(value):
+    return value.isoformat()
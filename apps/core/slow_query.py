@@ -0,0 +1,180 @@
+"""
+# 느린 쿼리 로그
+* `SLOW_QUERY_THRESHOLD_MS`보다 오래 걸린 쿼리를 요청한 view, 호출한 코드 위치, `EXPLAIN` 결과와 함께 로그로 남김
+* 값과 `IN` 목록을 지운 SQL(fingerprint)이 같은 쿼리는 `SLOW_QUERY_LOG_INTERVAL`초에 한 번만 남기고, 그 사이 횟수를 셈
+  * 오래 떠 있는 worker에서도 메모리가 늘지 않도록, 주기가 지난 fingerprint는 지우고
+    최근에 본 `MAX_FINGERPRINTS`개만 기억함 (지운 fingerprint의 건너뛴 횟수는 버림)
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+import traceback
+from collections import OrderedDict
+from contextlib import ExitStack
+from contextvars import ContextVar
+from time import monotonic, perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DatabaseError, connections
+
+from apps.core.profiling import view_name
+
+logger = logging.getLogger("apps.slow_query")
+
+_endpoint = ContextVar("slow_query_endpoint", default=None)
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+MAX_FINGERPRINTS = 1000
+
+
+def normalize(sql):
+    """
+    # 값과 `IN` 목록의 길이만 다른 쿼리가 같아지도록 SQL을 정규화
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+def fingerprint(sql):
+    return hashlib.md5(normalize(sql).encode()).hexdigest()[:12]
+
+
+def caller():
+    """
+    # 쿼리를 실행한 프로젝트 코드(apps/core 제외)의 위치
+    """
+    apps_dir = os.path.join(settings.BASE_DIR, "apps")
+    core_dir = os.path.join(apps_dir, "core")
+    for frame in reversed(traceback.extract_stack()):
+        if frame.filename.startswith(apps_dir) and not frame.filename.startswith(
+            core_dir
+        ):
+            return f"{frame.filename}:{frame.lineno} in {frame.name}"
+    return None
+
+
+class SlowQueryLog:
+    def __init__(self):
+        # 마지막으로 본 순서대로 정렬된 fingerprint별 (로그를 남긴 시각, 건너뛴 횟수)
+        self.last_logged = OrderedDict()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def should_log(self, key):
+        """
+        # fingerprint별로 주기에 한 번만 로그를 남기도록 하고, 건너뛴 횟수를 반환
+        """
+        now = monotonic()
+        with self.lock:
+            logged_at, skipped = self.last_logged.get(key, (None, 0))
+            if (
+                logged_at is not None
+                and now - logged_at < settings.SLOW_QUERY_LOG_INTERVAL
+            ):
+                self.last_logged[key] = (logged_at, skipped + 1)
+                self.last_logged.move_to_end(key)
+                return None
+            self.last_logged[key] = (now, 0)
+            self.last_logged.move_to_end(key)
+            self.prune(now)
+            return skipped
+
+    def prune(self, now):
+        """
+        # 가장 오래전에 본 fingerprint부터, 주기가 지났거나 `MAX_FINGERPRINTS`개를 넘은 만큼 지움
+        """
+        while self.last_logged:
+            logged_at, _ = next(iter(self.last_logged.values()))
+            if (
+                len(self.last_logged) <= MAX_FINGERPRINTS
+                and now - logged_at < settings.SLOW_QUERY_LOG_INTERVAL
+            ):
+                break
+            self.last_logged.popitem(last=False)
+
+    def explain(self, connection, sql, params):
+        if not sql.lstrip().upper().startswith("SELECT"):
+            return None
+        self.local.explaining = True
+        try:
+            with connection.cursor() as cursor:
+                prefix = connection.ops.explain_query_prefix()
+                cursor.execute(f"{prefix} {sql}", params)
+                rows = cursor.fetchall()
+        except DatabaseError as e:
+            return f"EXPLAIN 실패: {e}"
+        finally:
+            self.local.explaining = False
+        return "\n".join(" | ".join(str(column) for column in row) for row in rows)
+
+    def __call__(self, execute, sql, params, many, context):
+        if getattr(self.local, "explaining", False):
+            return execute(sql, params, many, context)
+
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed_ms = (perf_counter() - started) * 1000
+            if elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+                self.record(sql, params, many, context, elapsed_ms)
+
+    def record(self, sql, params, many, context, elapsed_ms):
+        key = fingerprint(sql)
+        skipped = self.should_log(key)
+        if skipped is None:
+            return
+
+        plan = None
+        if settings.SLOW_QUERY_EXPLAIN and not many:
+            plan = self.explain(context["connection"], sql, params)
+
+        logger.warning(
+            "slow query %.1fms [%s] view=%s caller=%s skipped=%d\n%s\nEXPLAIN:\n%s",
+            elapsed_ms,
+            key,
+            _endpoint.get(),
+            caller(),
+            skipped,
+            normalize(sql),
+            plan,
+        )
+
+
+slow_query_log = SlowQueryLog()
+
+
+class SlowQueryMiddleware:
+    """
+    # 요청을 처리하는 동안 모든 DB 연결에 느린 쿼리 로그를 검
+    * `SLOW_QUERY_THRESHOLD_MS`가 0이면 미들웨어 체인에서 빠짐
+    """
+
+    def __init__(self, get_response):
+        if settings.SLOW_QUERY_THRESHOLD_MS <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _endpoint.set(None)
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(slow_query_log))
+                return self.get_response(request)
+        finally:
+            _endpoint.reset(token)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        _endpoint.set(view_name(view_func, request.method))
@@ -1,6 +1,58 @@
-from django.test import TestCase
+import io
+import json
+import time
+import unittest
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from unittest.mock import patch
 
-from apps.core.utils import compose
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from apps.channel.models import Channel, Image, UserChannel
+from apps.channel.rows import channel_rows, managing_channel_rows
+from apps.channel.serializers import ChannelAwaiterSerializer, ChannelSerializer
+from apps.core.db import (
+    PrimaryReplicaRouter,
+    ReplicaRoutingMiddleware,
+    check_connections,
+    mark_connections_idle,
+)
+from apps.core.profiling import store
+from apps.core.renderers import FastJSONParser, FastJSONRenderer
+from apps.core.slow_query import (
+    MAX_FINGERPRINTS,
+    fingerprint,
+    normalize,
+    slow_query_log,
+)
+from apps.core.utils import THEME_COLOR, compose
+from apps.event.models import Event
+from apps.event.rows import event_channel_name_rows, event_rows
+from apps.event.serializers import EventChannelNameSerializer, EventSerializer
+from apps.notice.models import Notice
+from apps.notice.rows import notice_rows
+from apps.notice.serializers import NoticeChannelNameSerializer
+from apps.user.models import User
+from apps.user.rows import user_rows
+from apps.user.serializers import UserSerializer
 
 
 class UtilsTest(TestCase):
@@ -14,3 +66,481 @@ class UtilsTest(TestCase):
         self.assertEqual(compose(f, g)(2), 101)
         self.assertEqual(compose(f, g, f)(2), 151)
         self.assertEqual(compose(f, g, f, g)(2), 5051)
+
+
+@override_settings(DB_HEALTH_CHECK_INTERVAL=30)
+class ConnectionHealthCheckTest(TestCase):
+    def setUp(self):
+        connection.ensure_connection()
+        patcher = patch.object(connection, "in_atomic_block", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_recently_used_connection_is_not_checked(self):
+        mark_connections_idle()
+
+        with patch.object(connection, "is_usable") as is_usable:
+            check_connections()
+        is_usable.assert_not_called()
+
+    def test_idle_broken_connection_is_closed(self):
+        connection.idle_since = time.monotonic() - 60
+
+        with patch.object(connection, "is_usable", return_value=False), patch.object(
+            connection, "close"
+        ) as close:
+            check_connections()
+        close.assert_called_once()
+
+    def test_idle_usable_connection_is_kept(self):
+        connection.idle_since = time.monotonic() - 60
+
+        with patch.object(connection, "is_usable", return_value=True), patch.object(
+            connection, "close"
+        ) as close:
+            check_connections()
+        close.assert_not_called()
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_PIN_SECONDS=5)
+class ReplicaRoutingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="email@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+        self.other = User.objects.create_user(
+            username="testuser2",
+            email="email2@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+        self.router = PrimaryReplicaRouter()
+        self.factory = RequestFactory()
+        self.addCleanup(cache.clear)
+
+        # TestCase의 트랜잭션 밖에서 요청을 처리하는 것처럼 라우팅을 확인함
+        patcher = patch.object(connection, "in_atomic_block", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def route(self, request, user=None):
+        routed = {}
+
+        def view(request):
+            # DRF가 인증 후 request.user를 넣는 것과 같이 동작
+            if user is not None:
+                request.user = user
+            routed["db"] = self.router.db_for_read(User)
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(request)
+        return routed["db"]
+
+    def test_reads_outside_request_use_primary(self):
+        self.assertEqual(self.router.db_for_read(User), "default")
+        self.assertEqual(self.router.db_for_write(User), "default")
+
+    def test_safe_request_reads_from_replica(self):
+        self.assertEqual(self.route(self.factory.get("/")), "replica")
+        self.assertEqual(self.route(self.factory.get("/"), self.user), "replica")
+
+    def test_unsafe_request_reads_from_primary(self):
+        self.assertEqual(self.route(self.factory.post("/"), self.user), "default")
+
+    def test_reads_in_transaction_use_primary(self):
+        with patch.object(connection, "in_atomic_block", True):
+            self.assertEqual(self.route(self.factory.get("/"), self.user), "default")
+
+    def test_user_is_pinned_to_primary_after_write(self):
+        self.route(self.factory.post("/"), self.user)
+
+        self.assertEqual(self.route(self.factory.get("/"), self.user), "default")
+        self.assertEqual(self.route(self.factory.get("/"), self.other), "replica")
+
+        cache.clear()
+        self.assertEqual(self.route(self.factory.get("/"), self.user), "replica")
+
+    def test_replicas_are_not_migrated(self):
+        self.assertTrue(self.router.allow_migrate("default", "user"))
+        self.assertFalse(self.router.allow_migrate("replica", "user"))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_middleware_not_used_without_replicas(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            ReplicaRoutingMiddleware(lambda request: HttpResponse())
+        self.assertEqual(self.router.db_for_read(User), "default")
+
+
+@unittest.skipUnless("replica" in settings.DATABASES, "replica DB가 설정되지 않음")
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_PIN_SECONDS=5)
+class ReplicaQueryTest(TransactionTestCase):
+    """
+    # 실제 요청의 쿼리가 어느 DB 연결에서 실행되는지 확인
+    * TestCase는 요청 전체를 트랜잭션으로 감싸 모든 읽기가 primary로 가므로 TransactionTestCase를 씀
+    """
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="email@email.com",
+            password="password",
+        )
+        self.other = User.objects.create_user(
+            username="testuser2",
+            email="email2@email.com",
+            password="password",
+        )
+        self.channel = Channel.objects.create(name="channel", description="")
+        self.client = APIClient()
+        self.addCleanup(cache.clear)
+
+    def request(self, method, path, user):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(
+            connections["default"]
+        ) as primary, CaptureQueriesContext(connections["replica"]) as replica:
+            getattr(self.client, method)(path)
+        return len(primary), len(replica)
+
+    def test_queries_run_on_routed_database(self):
+        path = f"/api/v1/channels/{self.channel.id}/"
+        primary, replica = self.request("get", path, self.user)
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+        primary, replica = self.request("post", f"{path}subscribe/", self.user)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+        # 방금 쓴 유저의 읽기는 primary로, 다른 유저의 읽기는 replica로
+        primary, replica = self.request("get", path, self.user)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+        primary, replica = self.request("get", path, self.other)
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+    def test_token_versions_are_read_from_primary(self):
+        access = self.client.post(
+            "/api/v1/users/login/",
+            {"username": self.user.username, "password": "password"},
+            format="json",
+        ).data["access"]
+        cache.clear()
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        with CaptureQueriesContext(connections["default"]) as primary:
+            response = self.client.get("/api/v1/users/me/colors/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(any("token_version" in query["sql"] for query in primary))
+
+
+@override_settings(PROFILING_SAMPLE_RATE=1.0)
+class ProfilingTest(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            username="staff",
+            email="staff@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+            is_staff=True,
+        )
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="email@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+        store.clear()
+        self.client = APIClient()
+
+    def test_profile_is_recorded_per_action(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.get("/api/v1/channels/")
+        self.client.get("/api/v1/channels/")
+        self.client.get("/ping/")
+
+        self.client.force_authenticate(user=self.staff)
+        summary = self.client.get("/profiling/")
+        self.assertEqual(summary.status_code, 200)
+
+        data = summary.json()
+        self.assertEqual(data["ChannelViewSet.list"]["count"], 2)
+        self.assertGreater(data["ChannelViewSet.list"]["sql_count"]["p50"], 0)
+        self.assertGreater(data["ChannelViewSet.list"]["serializer_time"]["p99"], 0)
+        self.assertGreater(data["ChannelViewSet.list"]["response_size"]["p50"], 0)
+        self.assertEqual(data["pong.get"]["count"], 1)
+        self.assertEqual(data["pong.get"]["sql_count"]["p99"], 0)
+
+    def test_prometheus_metrics(self):
+        self.client.get("/api/v1/channels/recommend/")
+
+        self.client.force_authenticate(user=self.staff)
+        metrics = self.client.get("/profiling/metrics/")
+        self.assertEqual(metrics.status_code, 200)
+
+        text = metrics.content.decode()
+        self.assertIn("# TYPE snuday_request_duration_seconds summary", text)
+        self.assertIn(
+            'snuday_request_sql_queries_count{endpoint="ChannelViewSet.recommend"} 1',
+            text,
+        )
+
+    def test_only_staff_can_read_profiles(self):
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get("/profiling/").status_code, 403)
+        self.assertEqual(self.client.get("/profiling/metrics/").status_code, 403)
+
+
+@override_settings(SLOW_QUERY_THRESHOLD_MS=0.000001, SLOW_QUERY_LOG_INTERVAL=300)
+class SlowQueryLogTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="email@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+        slow_query_log.last_logged.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_normalize(self):
+        self.assertEqual(
+            normalize("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'a'"),
+            "SELECT * FROM t WHERE id IN (...) AND name = ?",
+        )
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id IN (%s) LIMIT 21"),
+            fingerprint("SELECT  *  FROM t WHERE id IN (%s, %s) LIMIT 5"),
+        )
+
+    def test_slow_query_is_logged_with_view_and_plan(self):
+        with self.assertLogs("apps.slow_query", "WARNING") as logs:
+            self.client.get("/api/v1/channels/search/?type=name&q=waffle")
+
+        output = "\n".join(logs.output)
+        self.assertIn("view=ChannelViewSet.search", output)
+        self.assertIn("apps/channel/views.py", output)
+        self.assertIn("LIKE", output)
+        self.assertNotIn("EXPLAIN:\nNone", output)
+
+    def test_same_fingerprint_is_logged_once(self):
+        with self.assertLogs("apps.slow_query", "WARNING") as logs:
+            self.client.get("/api/v1/channels/search/?type=name&q=waffle")
+        logged = len(logs.output)
+
+        with patch("apps.core.slow_query.logger.warning") as warning:
+            self.client.get("/api/v1/channels/search/?type=name&q=studio")
+        warning.assert_not_called()
+        self.assertEqual(len(slow_query_log.last_logged), logged)
+        self.assertTrue(
+            all(skipped == 1 for _, skipped in slow_query_log.last_logged.values())
+        )
+
+    def test_fingerprints_are_pruned(self):
+        with patch("apps.core.slow_query.monotonic", return_value=0):
+            for i in range(MAX_FINGERPRINTS + 10):
+                slow_query_log.should_log(f"key{i}")
+        self.assertEqual(len(slow_query_log.last_logged), MAX_FINGERPRINTS)
+        self.assertNotIn("key0", slow_query_log.last_logged)
+
+        # 주기가 지난 fingerprint는 새 로그를 남길 때 지움
+        with patch(
+            "apps.core.slow_query.monotonic",
+            return_value=settings.SLOW_QUERY_LOG_INTERVAL,
+        ):
+            slow_query_log.should_log("new")
+        self.assertEqual(list(slow_query_log.last_logged), ["new"])
+
+
+class FastJSONRendererTest(TestCase):
+    def test_same_output_as_json_renderer(self):
+        data = {
+            "datetime": timezone.now(),
+            "local": timezone.localtime(),
+            "naive": datetime(2022, 3, 1, 12, 30),
+            "date": date(2022, 3, 1),
+            "time": dt_time(9, 30, 15),
+            "decimal": Decimal("1.5"),
+            "error": gettext_lazy("This field is required."),
+            "korean": "구독 중이 아닙니다.",
+            "separator": "a\u2028b\u2029c",
+            "ids": {1: "one"},
+            "nested": [{"list": (1, 2.5, None, True)}],
+        }
+
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_fallback(self):
+        # orjson이 다루지 못하는 큰 정수와 들여쓰기 요청은 DRF의 renderer로 처리
+        data = {"big": 2**70}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+        rendered = FastJSONRenderer().render({"a": 1}, "application/json; indent=4", {})
+        self.assertEqual(rendered, b'{\n    "a": 1\n}')
+
+    def test_parse(self):
+        parser = FastJSONParser()
+        data = parser.parse(io.BytesIO('{"name": "와플", "ids": [1, 2]}'.encode()))
+        self.assertEqual(data, {"name": "와플", "ids": [1, 2]})
+
+        with self.assertRaises(ParseError):
+            parser.parse(io.BytesIO(b"{"))
+
+        data = parser.parse(
+            io.BytesIO('{"name": "와플"}'.encode("utf-16")),
+            parser_context={"encoding": "utf-16"},
+        )
+        self.assertEqual(data, {"name": "와플"})
+
+    def test_api_uses_fast_renderer(self):
+        response = APIClient().post(
+            "/api/v1/users/login/",
+            '{"username": "nobody", "password": "password"}',
+            content_type="application/json",
+        )
+
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            response.content, JSONRenderer().render(response.data, "application/json")
+        )
+
+
+class RowSerializerParityTest(TestCase):
+    """
+    # 각 앱의 row 직렬화가 기존 serializer와 같은 결과를 내는지 확인
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+        self.manager = User.objects.create_user(
+            username="manager",
+            email="manager@email.com",
+            password="password",
+            first_name="매니저",
+            last_name="김",
+        )
+        Channel.objects.create(
+            name="manager의 채널",
+            description="개인 채널입니다.",
+            is_private=True,
+            is_personal=True,
+            managers=self.manager,
+        )
+
+        image = Image.objects.create(image="snuday/profile_pic/waffle.png")
+        self.channels = [
+            Channel.objects.create(
+                name="wafflestudio",
+                description="와플스튜디오",
+                is_official=True,
+                image=image,
+                managers=self.manager,
+            ),
+            Channel.objects.create(
+                name="private", description="", is_private=True, managers=self.user
+            ),
+        ]
+        for channel in self.channels:
+            UserChannel.objects.create(
+                channel=channel, user=self.user, color=THEME_COLOR["GREEN"]
+            )
+        UserChannel.objects.create(channel=self.channels[0], user=self.manager)
+
+        for channel in self.channels:
+            Notice.objects.create(
+                title="공지", contents="내용", channel=channel, writer=self.manager
+            )
+            Event.objects.create(
+                title="일정",
+                channel=channel,
+                writer=self.manager,
+                has_time=True,
+                start_date="2022-03-01",
+                due_date="2022-03-02",
+                start_time="09:00",
+                due_time="18:30",
+            )
+            Event.objects.create(
+                title="종일",
+                memo="메모",
+                channel=channel,
+                writer=self.manager,
+                has_time=False,
+                start_date="2022-03-05",
+                due_date="2022-03-05",
+            )
+
+        self.request = Request(RequestFactory().get("/"))
+        self.request.user = self.user
+
+    def assertParity(self, rows, serializer_class, queryset, context=None):
+        context = context or {"request": self.request}
+        expected = serializer_class(queryset, many=True, context=context).data
+        actual = rows(queryset, context)
+        self.assertEqual(
+            json.loads(json.dumps(actual)), json.loads(json.dumps(expected))
+        )
+        self.assertEqual([list(row) for row in actual], [list(row) for row in expected])
+
+    def test_channel(self):
+        self.assertParity(
+            channel_rows, ChannelSerializer, Channel.objects.order_by("id")
+        )
+
+        anonymous = Request(RequestFactory().get("/"))
+        anonymous.user = AnonymousUser()
+        self.assertParity(
+            channel_rows,
+            ChannelSerializer,
+            Channel.objects.order_by("id"),
+            {"request": anonymous},
+        )
+
+    def test_managing_channel(self):
+        self.assertParity(
+            managing_channel_rows[False],
+            ChannelAwaiterSerializer,
+            Channel.objects.filter(managers=self.user).order_by("id"),
+        )
+
+    def test_user(self):
+        self.assertParity(user_rows, UserSerializer, User.objects.order_by("id"))
+
+    def test_notice(self):
+        self.assertParity(
+            notice_rows, NoticeChannelNameSerializer, Notice.objects.order_by("id")
+        )
+
+    def test_event(self):
+        self.assertParity(event_rows, EventSerializer, Event.objects.order_by("id"))
+        self.assertParity(
+            event_channel_name_rows,
+            EventChannelNameSerializer,
+            Event.objects.order_by("id"),
+        )
+
+        with timezone.override("UTC"):
+            self.assertParity(
+                event_channel_name_rows,
+                EventChannelNameSerializer,
+                Event.objects.order_by("id"),
+            )
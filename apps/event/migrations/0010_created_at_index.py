@@ -0,0 +1,17 @@
+# Generated by Django 3.1.14 on 2026-10-19 12:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0009_auto_20210331_1812'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['channel', '-created_at', '-id'], name='event_channel_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.14 on 2026-10-19 13:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0010_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['channel', 'start_date', 'due_date'], name='event_channel_range_idx'),
+        ),
+    ]
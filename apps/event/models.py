@@ -1,10 +1,40 @@
+from datetime import datetime, timedelta
+
+from dateutil.relativedelta import relativedelta
 from django.db import models
+from django.utils import timezone
 
 from apps.user.models import User
 from apps.core.models import TimeStampModel
 from apps.channel.models import Channel
 
 
+class EventQuerySet(models.QuerySet):
+    def in_range(self, start, end):
+        """
+        # `start`부터 `end`까지(양 끝 포함)의 기간과 겹치는 일정
+        * `(channel, start_date, due_date)` index로 채널별 범위 검색
+        """
+        return self.filter(start_date__lte=end, due_date__gte=start)
+
+    def in_month(self, month=None):
+        """
+        # `month`(yyyy-mm)와 겹치는 일정, 없으면 이번 달
+        * 달력 앞뒤에 보이는 날짜까지 포함하도록 앞뒤로 7일씩 넓혀서 고름
+        """
+        if month:
+            month_begin = datetime.strptime(month, "%Y-%m")
+        else:
+            today = datetime.today()
+            month_begin = datetime(today.year, today.month, 1)
+        next_month = month_begin + relativedelta(months=1)
+
+        return self.in_range(
+            timezone.make_aware(month_begin) - timedelta(days=7),
+            timezone.make_aware(next_month) + timedelta(days=7),
+        )
+
+
 class Event(TimeStampModel):
     title = models.CharField(max_length=100)
     memo = models.TextField(null=True)
@@ -27,3 +57,19 @@ class Event(TimeStampModel):
 
     start_time = models.TimeField(null=True)
     due_time = models.TimeField(null=True)
+
+    objects = EventQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 채널별 일정 목록을 created_at, id 순서로 페이지네이션
+            models.Index(
+                fields=["channel", "-created_at", "-id"],
+                name="event_channel_created_idx",
+            ),
+            # 채널별 기간 검색, 시작일이 범위 끝 이전인 일정 중 종료일이 범위 시작 이후인 일정
+            models.Index(
+                fields=["channel", "start_date", "due_date"],
+                name="event_channel_range_idx",
+            ),
+        ]
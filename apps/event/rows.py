@@ -0,0 +1,25 @@
+from apps.core.rows import RowSerializer
+from apps.event.models import Event
+
+EVENT_COLUMNS = {
+    "id": "id",
+    "title": "title",
+    "memo": "memo",
+    "channel": "channel",
+    "writer": "writer",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "has_time": "has_time",
+    "start_date": "start_date",
+    "due_date": "due_date",
+    "start_time": "start_time",
+    "due_time": "due_time",
+}
+
+# `EventSerializer`와 같은 응답
+event_rows = RowSerializer(Event, EVENT_COLUMNS)
+
+# `EventChannelNameSerializer`와 같은 응답
+event_channel_name_rows = RowSerializer(
+    Event, {**EVENT_COLUMNS, "channel_name": "channel__name"}
+)
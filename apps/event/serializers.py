@@ -32,3 +32,46 @@ class EventChannelNameSerializer(EventSerializer):
 
     def get_channel_name(self, event):
         return event.channel.name
+
+
+COMPACT_FIELDS = (
+    "id",
+    "title",
+    "channel",
+    "has_time",
+    "start_date",
+    "due_date",
+    "start_time",
+    "due_time",
+)
+
+
+def to_columns(queryset, fields=COMPACT_FIELDS):
+    """
+    # 일정을 필드별 배열로 직렬화 (달력 화면용)
+    * `.values()`로 필요한 필드만 읽어 모델 인스턴스를 만들지 않음
+    * `{"count": n, "columns": {필드: [값, ...]}, "channels": {채널 id: 채널 이름}}`
+    * 날짜, 시각은 `EventSerializer`와 같은 형식으로 변환
+    """
+    serializer_fields = EventSerializer().fields
+    converters = [
+        serializer_fields[field].to_representation
+        if isinstance(
+            serializer_fields[field],
+            (serializers.DateField, serializers.TimeField, serializers.DateTimeField),
+        )
+        else None
+        for field in fields
+    ]
+
+    columns = {field: [] for field in fields}
+    targets = [columns[field].append for field in fields]
+    channels = {}
+    count = 0
+    for row in queryset.values_list(*fields, "channel_id", "channel__name"):
+        count += 1
+        for value, convert, append in zip(row, converters, targets):
+            append(value if value is None or convert is None else convert(value))
+        channels[row[-2]] = row[-1]
+
+    return {"count": count, "columns": columns, "channels": channels}
@@ -1349,3 +1349,116 @@ class ParticularDateEventTest(TestCase):
         )
         self.assertEqual(no_result.status_code, 200)
         self.assertEqual(len(no_result.json()["results"]), 0)
+
+    def test_range_events(self):
+        self.client.force_authenticate(user=self.b)
+        self.client.post(f"/api/v1/channels/{self.channel_2_id}/subscribe/")
+
+        response = self.client.get(
+            f"/api/v1/channels/{self.channel_id}/events/?from=2021-03-16&to=2021-03-22"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {event["id"] for event in response.json()["results"]},
+            {self.event_1.id, self.event_2.id, self.event_4.id},
+        )
+
+        response = self.client.get(
+            "/api/v1/users/me/events/?from=2021-03-17&to=2021-03-17"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([event["id"] for event in response.json()], [self.event_5.id])
+
+        response = self.client.get(
+            "/api/v1/users/me/events/?from=2021-03-18&to=2021-09-18"
+        )
+        self.assertEqual(response.json(), [])
+
+        for query in (
+            "from=2021-03-18",
+            "from=2021-03-18&to=2021-3",
+            "from=2021-03-18&to=2021-03-17",
+            "from=2021-01-01&to=2021-12-31",
+        ):
+            response = self.client.get(f"/api/v1/users/me/events/?{query}")
+            self.assertEqual(response.status_code, 400)
+
+
+class CompactEventTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+
+        self.channel = Channel.objects.create(
+            name="wafflestudio",
+            description="와플스튜디오 채널입니다.",
+            managers=self.user,
+        )
+        self.channel.subscribers.add(self.user)
+
+        self.event = Event.objects.create(
+            title="event title",
+            memo="event memo",
+            channel=self.channel,
+            writer=self.user,
+            has_time=True,
+            start_date="2022-03-10",
+            due_date="2022-03-11",
+            start_time="09:30",
+            due_time="18:00",
+        )
+        Event.objects.create(
+            title="all day",
+            channel=self.channel,
+            writer=self.user,
+            has_time=False,
+            start_date="2022-03-15",
+            due_date="2022-03-15",
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_compact_view(self):
+        full = self.client.get("/api/v1/users/me/events/?month=2022-03").json()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                "/api/v1/users/me/events/?month=2022-03&view=compact"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(data["channels"], {str(self.channel.id): "wafflestudio"})
+        self.assertNotIn("memo", data["columns"])
+
+        # 같은 필드는 기존 응답과 같은 값
+        for i, event in enumerate(full):
+            for field, values in data["columns"].items():
+                self.assertEqual(values[i], event[field])
+        self.assertEqual(data["columns"]["start_time"], ["09:30:00", None])
+
+    def test_fields(self):
+        response = self.client.get(
+            "/api/v1/users/me/events/?month=2022-03&fields=id,created_at,memo"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        columns = response.json()["columns"]
+        self.assertEqual(list(columns), ["id", "created_at", "memo"])
+        self.assertEqual(columns["memo"], ["event memo", None])
+        self.assertEqual(
+            columns["created_at"][0],
+            self.client.get(
+                f"/api/v1/channels/{self.channel.id}/events/{self.event.id}/"
+            ).json()["created_at"],
+        )
+
+        response = self.client.get("/api/v1/users/me/events/?fields=id,password")
+        self.assertEqual(response.status_code, 400)
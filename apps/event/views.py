@@ -1,21 +1,64 @@
-from rest_framework import viewsets, status, generics
+from django.conf import settings
+from rest_framework import viewsets, status, generics, serializers
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.channel.claims import can_read
 from apps.channel.models import Channel
-from apps.event.serializers import EventSerializer, EventChannelNameSerializer
+from apps.event.serializers import (
+    COMPACT_FIELDS,
+    EventSerializer,
+    EventChannelNameSerializer,
+    to_columns,
+)
+from apps.core.paginator import CreatedAtCursorPagination
 from apps.core.utils import get_object_or_400
 from apps.event.models import Event
+from apps.event.rows import event_channel_name_rows, event_rows
 from apps.event.serializers import EventSerializer
 from apps.notice.permission import IsOwnerOrReadOnly
-from datetime import datetime, timedelta
+from datetime import datetime
 from django.utils import timezone
-from dateutil.relativedelta import relativedelta
 from django.db.models import Q
 
 
+def parse_date(value, name):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise serializers.ValidationError({name: "yyyy-mm-dd 형식으로 입력해야 합니다."})
+
+
+def in_requested_period(queryset, params):
+    """
+    # query parameter로 고른 기간과 겹치는 일정
+    * `from`, `to`(yyyy-mm-dd)가 있으면 그 기간, 최대 `EVENT_RANGE_MAX_DAYS`일
+    * 없으면 `date`(그 날), `month`(그 달, 앞뒤 7일 포함) 순서로 확인하고 모두 없으면 이번 달
+    """
+    if "from" in params or "to" in params:
+        start = parse_date(params.get("from", ""), "from")
+        end = parse_date(params.get("to", ""), "to")
+        if start > end:
+            raise serializers.ValidationError({"to": "from 이후 날짜여야 합니다."})
+        if (end - start).days + 1 > settings.EVENT_RANGE_MAX_DAYS:
+            raise serializers.ValidationError(
+                {"to": f"최대 {settings.EVENT_RANGE_MAX_DAYS}일까지 조회할 수 있습니다."}
+            )
+        return queryset.in_range(start, end)
+
+    # 특정 날짜
+    date = params.get("date", "")
+    if date:
+        target_date = timezone.make_aware(datetime.strptime(date, "%Y-%m-%d"))
+        return queryset.filter(start_date__lte=target_date, due_date__gte=target_date)
+
+    # 특정 달, 따로 parameter가 없는 경우, 기본적으로는 현재 날짜의 달의 일정을 가져오도록
+    return queryset.in_month(params.get("month", ""))
+
+
 class EventViewSet(generics.RetrieveAPIView, viewsets.GenericViewSet):
     queryset = Event.objects.all()
+    pagination_class = CreatedAtCursorPagination
 
     def get_serializer_class(self):
         if self.action == "retrieve":
@@ -48,7 +91,7 @@ class EventViewSet(generics.RetrieveAPIView, viewsets.GenericViewSet):
                 {"error": "Wrong Channel ID."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        if not channel.managers.id == request.user.id:
+        if not channel.managers_id == request.user.id:
             return Response(
                 {"error": "Only managers can create an event."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -97,68 +140,33 @@ class EventViewSet(generics.RetrieveAPIView, viewsets.GenericViewSet):
         * query parameter가 주어지지 않으면 이번 달의 일정을 반환합니다.
         * query parameter로 date = yyyy-mm-dd 형식으로 주어지면 그 날이 포함된 일정을 반환합니다.(하루짜리 일정은 반환하지 않습니다.)
         * query parameter로 month = yyyy-mm 형식으로 주어지면 그 달이 포함된 일정을 반환합니다.
+        * query parameter로 from = yyyy-mm-dd, to = yyyy-mm-dd 형식으로 주어지면 그 기간(양 끝 포함)과 겹치는 일정을 반환합니다.
+          * 최대 `EVENT_RANGE_MAX_DAYS`일(기본 190일)까지 조회할 수 있고, date, month보다 우선합니다.
         """
         channel = get_object_or_400(Channel, id=channel_pk)
 
-        date = self.request.GET.get("date", "")
-        month = self.request.query_params.get("month", "")
-
-        if channel.is_private and not (
-            channel.managers.id == request.user.id
-            or channel.subscribers.filter(id=request.user.id).exists()
-        ):
+        if not can_read(request, channel):
             return Response(
                 {"error": "This channel is private."}, status=status.HTTP_403_FORBIDDEN
             )
 
-        qs = self.get_queryset().filter(channel=channel)
-
-        # 특정 날짜
-        if date:
-            target_date = timezone.make_aware(datetime.strptime(date, "%Y-%m-%d"))
-            qs = qs.filter(start_date__lte=target_date, due_date__gte=target_date)
-
-        # 특정 달
-        elif month:
-            strip_month_begin = datetime.strptime(month, "%Y-%m")
-            month_begin = timezone.make_aware(strip_month_begin) - timedelta(days=7)
-
-            next_month = strip_month_begin + relativedelta(months=1)
-            month_end = timezone.make_aware(next_month) + timedelta(days=7)
-
-            qs = qs.filter(start_date__lte=month_end) & qs.filter(
-                due_date__gte=month_begin
-            )
-
-        # 따로 parameter가 없는 경우, 기본적으로는 현재 날짜의 달의 일정을 가져오도록
-        else:
-            today = datetime.today()
-            strip_month_begin = datetime(today.year, today.month, 1)
-            month_begin = timezone.make_aware(strip_month_begin) - timedelta(days=7)
-
-            next_month = strip_month_begin + relativedelta(months=1)
-            month_end = timezone.make_aware(next_month) + timedelta(days=7)
-
-            qs = qs.filter(start_date__lte=month_end) & qs.filter(
-                due_date__gte=month_begin
-            )
+        qs = in_requested_period(
+            self.get_queryset().filter(channel=channel), request.query_params
+        )
 
-        page = self.paginate_queryset(qs)
+        page = self.paginate_queryset(event_rows.values(qs))
 
         if page is not None:
-            data = self.get_serializer(page, many=True).data
+            data = event_rows.to_representation(page)
             return self.get_paginated_response(data)
 
-        data = self.get_serializer(qs, many=True)
+        data = event_rows(qs)
         return Response(data, status=status.HTTP_200_OK)
 
     def retrieve(self, request, channel_pk, pk):
         channel = get_object_or_400(Channel, id=channel_pk)
 
-        if channel.is_private and not (
-            channel.managers.id == request.user.id
-            or channel.subscribers.filter(id=request.user.id).exists()
-        ):
+        if not can_read(request, channel):
             return Response(
                 {"error": "This channel is private."}, status=status.HTTP_403_FORBIDDEN
             )
@@ -287,6 +295,11 @@ class UserEventViewSet(viewsets.GenericViewSet):
         * query parameter가 주어지지 않으면 이번 달의 일정을 반환합니다.
         * query parameter로 date = yyyy-mm-dd 형식으로 주어지면 그 날이 포함된 일정을 반환합니다.(하루짜리 일정은 반환하지 않습니다.)
         * query parameter로 month = yyyy-mm 형식으로 주어지면 그 달이 포함된 일정을 반환합니다.
+        * query parameter로 from = yyyy-mm-dd, to = yyyy-mm-dd 형식으로 주어지면 그 기간(양 끝 포함)과 겹치는 일정을 반환합니다.
+          * 최대 `EVENT_RANGE_MAX_DAYS`일(기본 190일)까지 조회할 수 있고, date, month보다 우선합니다.
+        * query parameter로 view = compact가 주어지면 달력에 필요한 필드만 필드별 배열로 반환합니다.
+          * `{"count": n, "columns": {"id": [...], "title": [...], ...}, "channels": {채널 id: 채널 이름}}`
+        * query parameter로 fields = id,title,... 가 주어지면 그 필드들만 같은 형식으로 반환합니다.
         """
         if user_pk != "me":
             return Response(
@@ -294,40 +307,24 @@ class UserEventViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        date = self.request.GET.get("date", "")
-        month = self.request.query_params.get("month", "")
-
         channel_list = request.user.subscribing_channels.all().values_list(
             "id", flat=True
         )
 
-        qs = Event.objects.filter(channel__in=list(channel_list))
-        if date:
-            target_date = timezone.make_aware(datetime.strptime(date, "%Y-%m-%d"))
-            qs = qs.filter(start_date__lte=target_date, due_date__gte=target_date)
-        elif month:
-            strip_month_begin = datetime.strptime(month, "%Y-%m")
-            month_begin = timezone.make_aware(strip_month_begin) - timedelta(days=7)
-
-            next_month = strip_month_begin + relativedelta(months=1)
-            month_end = timezone.make_aware(next_month) + timedelta(days=7)
-
-            qs = qs.filter(start_date__lte=month_end) & qs.filter(
-                due_date__gte=month_begin
-            )
-
-        # 따로 parameter가 없는 경우, 기본적으로는 현재 날짜의 달의 일정을 가져오도록
-        else:
-            today = datetime.today()
-            strip_month_begin = datetime(today.year, today.month, 1)
-            month_begin = timezone.make_aware(strip_month_begin) - timedelta(days=7)
-
-            next_month = strip_month_begin + relativedelta(months=1)
-            month_end = timezone.make_aware(next_month) + timedelta(days=7)
+        qs = in_requested_period(
+            Event.objects.filter(channel__in=list(channel_list)).order_by("id"),
+            request.query_params,
+        )
 
-            qs = qs.filter(start_date__lte=month_end) & qs.filter(
-                due_date__gte=month_begin
+        fields = request.query_params.get("fields")
+        if fields or request.query_params.get("view") == "compact":
+            fields = (
+                list(dict.fromkeys(fields.split(","))) if fields else COMPACT_FIELDS
             )
+            if not set(fields) <= set(EventSerializer.Meta.fields):
+                return Response(
+                    {"error": "Wrong fields."}, status=status.HTTP_400_BAD_REQUEST
+                )
+            return Response(to_columns(qs, fields), status=status.HTTP_200_OK)
 
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(event_channel_name_rows(qs), status=status.HTTP_200_OK)
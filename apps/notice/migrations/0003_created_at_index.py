@@ -0,0 +1,17 @@
+# Generated by Django 3.1.14 on 2026-10-19 12:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notice', '0002_auto_20210208_0527'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['channel', '-created_at', '-id'], name='notice_channel_created_idx'),
+        ),
+    ]
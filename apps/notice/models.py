@@ -1,10 +1,50 @@
 from django.db import models
+from django.db.models import F, Window
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import RowNumber
 
 from apps.user.models import User
 from apps.core.models import TimeStampModel
 from apps.channel.models import Image, Channel
 
 
+class NoticeManager(models.Manager):
+    def recent(self, channel_ids, count=3, condition=None):
+        """
+        # 채널마다 최근 공지사항 `count`개씩을 한 번의 쿼리로 가져옴
+        * 채널 안에서 `ROW_NUMBER() OVER (PARTITION BY channel_id ORDER BY created_at DESC, id DESC)`가
+          `count` 이하인 row만 고름
+        * `condition`으로 채널 권한 같은 조건을 안쪽 쿼리에 더할 수 있음
+        * 채널 순서, 채널 안에서는 최신순으로 정렬되고 channel, writer를 함께 불러옴
+        """
+        if isinstance(channel_ids, (list, tuple, set)) and not channel_ids:
+            return self.none()
+
+        ranked = self.filter(channel_id__in=channel_ids)
+        if condition is not None:
+            ranked = ranked.filter(condition)
+        ranked = ranked.annotate(
+            # MySQL에서 rank는 예약어
+            row_num=Window(
+                RowNumber(),
+                partition_by=F("channel_id"),
+                order_by=(F("created_at").desc(), F("id").desc()),
+            )
+        ).values("id", "row_num")
+        sql, params = ranked.query.sql_with_params()
+
+        return (
+            self.select_related("channel", "writer")
+            .filter(
+                id__in=RawSQL(
+                    f"SELECT id FROM ({sql}) ranked WHERE row_num <= %s",
+                    (*params, count),
+                )
+            )
+            .order_by("channel_id", "-created_at", "-id")
+        )
+
+
 class Notice(TimeStampModel):
     title = models.CharField(max_length=100)
     contents = models.TextField()
@@ -22,6 +62,17 @@ class Notice(TimeStampModel):
         db_column="channel_id",
     )
 
+    objects = NoticeManager()
+
+    class Meta:
+        indexes = [
+            # 채널별 공지사항 피드를 created_at, id 순서로 페이지네이션
+            models.Index(
+                fields=["channel", "-created_at", "-id"],
+                name="notice_channel_created_idx",
+            )
+        ]
+
 
 class NoticeImage(Image):
     notice = models.ForeignKey(
@@ -0,0 +1,18 @@
+from apps.core.rows import RowSerializer
+from apps.notice.models import Notice
+
+# `NoticeChannelNameSerializer`와 같은 응답
+notice_rows = RowSerializer(
+    Notice,
+    {
+        "id": "id",
+        "title": "title",
+        "contents": "contents",
+        "channel": "channel",
+        "channel_name": "channel__name",
+        "writer": "writer",
+        "writer_name": "writer__username",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    },
+)
@@ -989,6 +989,49 @@ class NoticeGetTest(TestCase):
         self.assertIn("next", data)
         self.assertIsNone(data["previous"])
 
+    def test_pagination_with_same_created_at(self):
+        # 같은 시각에 작성된 공지사항도 id 순서로 빠짐없이, 겹치지 않게 나뉘어야 함
+        Notice.objects.filter(channel=self.channel).update(
+            created_at=self.notices[0].created_at
+        )
+        self.client.force_authenticate(user=self.manager)
+
+        url = "/api/v1/channels/{}/notices/?page_size=4".format(self.channel_id)
+        titles = []
+        pages = []
+        while url:
+            response = self.client.get(url, format="json")
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertLessEqual(len(data["results"]), 4)
+            titles += [notice["title"] for notice in data["results"]]
+            pages.append(data)
+            url = data["next"]
+
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(titles, ["notice" + str(i) for i in range(11, 0, -1)])
+
+        response = self.client.get(pages[-1]["previous"], format="json")
+        data = response.json()
+        self.assertEqual(
+            [notice["title"] for notice in data["results"]],
+            [notice["title"] for notice in pages[1]["results"]],
+        )
+        self.assertIsNotNone(data["next"])
+        self.assertIsNotNone(data["previous"])
+
+        response = self.client.get(
+            "/api/v1/channels/{}/notices/?page_size=1000".format(self.channel_id),
+            format="json",
+        )
+        self.assertEqual(len(response.json()["results"]), 11)
+
+        response = self.client.get(
+            "/api/v1/channels/{}/notices/?cursor=invalid".format(self.channel_id),
+            format="json",
+        )
+        self.assertEqual(response.status_code, 404)
+
     def test_get_recent_notices(self):
         self.client.force_authenticate(user=self.manager)
 
@@ -1029,6 +1072,59 @@ class NoticeGetTest(TestCase):
 
         self.assertEqual(response.status_code, 403)
 
+    def test_get_recent_notices_of_channels(self):
+        self.client.force_authenticate(user=self.manager)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                "/api/v1/users/me/notices/recent/?channels={},{}&count=2".format(
+                    self.channel_id, self.public_channel.id
+                ),
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(
+            [(notice["channel"], notice["title"]) for notice in data],
+            [
+                (self.channel_id, "notice11"),
+                (self.channel_id, "notice10"),
+                (self.public_channel.id, "notice11"),
+                (self.public_channel.id, "notice10"),
+            ],
+        )
+        self.assertEqual(data[0]["channel_name"], "wafflestudio")
+        self.assertEqual(data[0]["writer_name"], "manager")
+
+        # 비공개 채널의 공지사항은 빠짐
+        self.client.force_authenticate(user=self.watcher)
+        response = self.client.get(
+            "/api/v1/users/me/notices/recent/?channels={},{}".format(
+                self.channel_id, self.public_channel.id
+            ),
+            format="json",
+        )
+        self.assertEqual(
+            [(notice["channel"], notice["title"]) for notice in response.json()],
+            [(self.public_channel.id, "notice" + str(i)) for i in (11, 10, 9)],
+        )
+
+        # channels가 없으면 구독 중인 채널
+        self.channel.subscribers.add(self.watcher)
+        response = self.client.get(
+            "/api/v1/users/me/notices/recent/?count=1", format="json"
+        )
+        self.assertEqual(
+            [(notice["channel"], notice["title"]) for notice in response.json()],
+            [(self.channel_id, "notice11")],
+        )
+
+        response = self.client.get(
+            "/api/v1/users/me/notices/recent/?channels=a,b", format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
     def test_get_public_unlogined(self):
         response = self.client.get(
             "/api/v1/channels/{}/notices/".format(str(self.channel_id)),
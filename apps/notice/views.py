@@ -3,16 +3,20 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from apps.notice.models import Notice, NoticeImage
-from apps.channel.models import Channel
+from apps.channel.claims import can_read, readable
+from apps.channel.models import Channel, UserChannel
 from apps.notice.serializers import NoticeSerializer, NoticeChannelNameSerializer
 from apps.notice.permission import IsOwnerOrReadOnly
+from apps.notice.rows import notice_rows
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Q
+from apps.core.paginator import CreatedAtCursorPagination
 from apps.core.utils import get_object_or_400
 
 
 class NoticeIdViewSet(viewsets.GenericViewSet):
     queryset = Notice.objects.all()
+    pagination_class = CreatedAtCursorPagination
 
     def get_serializer_class(self):
         if self.action in ["retrieve"]:
@@ -34,7 +38,7 @@ class NoticeIdViewSet(viewsets.GenericViewSet):
                 {"error": "Wrong Channel ID."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        if not channel.managers.id == request.user.id:
+        if not channel.managers_id == request.user.id:
             return Response(
                 {"error": "Only managers can write a notice."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -49,24 +53,20 @@ class NoticeIdViewSet(viewsets.GenericViewSet):
     def list(self, request, channel_pk):
         channel = get_object_or_400(Channel, id=channel_pk)
 
-        if (
-            channel.is_private
-            and not channel.managers.id == request.user.id
-            and not channel.subscribers.filter(id=request.user.id).exists()
-        ):
+        if not can_read(request, channel):
             return Response(
                 {"error": "This channel is private."}, status=status.HTTP_403_FORBIDDEN
             )
 
-        qs = self.get_queryset().filter(channel=channel)
+        qs = notice_rows.values(self.get_queryset().filter(channel=channel))
 
         page = self.paginate_queryset(qs)
 
         if page is not None:
-            data = self.get_serializer(page, many=True).data
+            data = notice_rows.to_representation(page)
             return self.get_paginated_response(data)
 
-        data = self.get_serializer(qs, many=True)
+        data = notice_rows.to_representation(qs)
         return Response(data, status=status.HTTP_200_OK)
 
     def retrieve(self, request, channel_pk, pk):
@@ -79,11 +79,7 @@ class NoticeIdViewSet(viewsets.GenericViewSet):
                 {"error": "Wrong Channel ID."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        if (
-            channel.is_private
-            and not channel.managers.id == request.user.id
-            and not channel.subscribers.filter(id=request.user.id).exists()
-        ):
+        if not can_read(request, channel):
             return Response(
                 {"error": "This channel is private."}, status=status.HTTP_403_FORBIDDEN
             )
@@ -187,7 +183,11 @@ class NoticeIdViewSet(viewsets.GenericViewSet):
         return self.get_paginated_response(data)
 
 
-# bring recent 10 notices
+RECENT_NOTICES = 3
+MAX_RECENT_NOTICES = 10
+
+
+# bring recent 3 notices
 class NoticeRecentViewSet(viewsets.GenericViewSet):
     queryset = Notice.objects.all()
     serializer_class = NoticeChannelNameSerializer
@@ -197,18 +197,16 @@ class NoticeRecentViewSet(viewsets.GenericViewSet):
     def recent_notices(self, request, pk=None):
         channel = get_object_or_400(Channel, id=pk)
 
-        if channel.is_private and not channel.managers.id == request.user.id:
+        if channel.is_private and not channel.managers_id == request.user.id:
             return Response(
                 {"error": "This channel is private."}, status=status.HTTP_403_FORBIDDEN
             )
 
-        data = Notice.objects.filter(channel=channel.id).order_by("-created_at")
-
-        RECENT_NOTICES = 3
-        num_items = data.count()
-
-        if num_items > RECENT_NOTICES:
-            data = data[:RECENT_NOTICES]
+        data = (
+            Notice.objects.select_related("channel", "writer")
+            .filter(channel=channel.id)
+            .order_by("-created_at", "-id")[:RECENT_NOTICES]
+        )
 
         serializer = self.get_serializer(data, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -218,6 +216,7 @@ class UserNoticeViewSet(viewsets.GenericViewSet):
     queryset = Notice.objects.all()
     serializer_class = NoticeChannelNameSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
 
     def list(self, request, user_pk):
         if user_pk != "me":
@@ -231,11 +230,47 @@ class UserNoticeViewSet(viewsets.GenericViewSet):
         )
 
         qs = Notice.objects.filter(channel__in=list(channel_list))
-        page = self.paginate_queryset(qs)
-        data = self.get_serializer(page, many=True).data
+        page = self.paginate_queryset(notice_rows.values(qs))
+        data = notice_rows.to_representation(page)
 
         return self.get_paginated_response(data)
 
+    @action(detail=False, methods=["get"])
+    def recent(self, request, user_pk):
+        """
+        # 여러 채널의 최근 공지사항을 한 번에 가져오는 API
+        * params의 'channels'로 채널 id 목록을 `1,2,3` 형식으로 받음, 없으면 구독 중인 채널들
+        * params의 'count'로 채널마다 가져올 개수를 받음 (기본 3, 최대 10)
+        * 볼 수 없는 채널의 공지사항은 빠짐
+        * 채널 id 순서, 채널 안에서는 최신순으로 반환
+        """
+        if user_pk != "me":
+            return Response(
+                {"error": "Cannot read others' notices"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        try:
+            count = int(request.query_params.get("count", RECENT_NOTICES))
+            channels = request.query_params.get("channels")
+            if channels:
+                channel_ids = [int(channel_id) for channel_id in channels.split(",")]
+            else:
+                channel_ids = UserChannel.objects.filter(user=request.user).values(
+                    "channel_id"
+                )
+        except ValueError:
+            return Response(
+                {"error": "Wrong channels or count."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        count = max(1, min(count, MAX_RECENT_NOTICES))
+        qs = Notice.objects.recent(channel_ids, count, condition=readable(request))
+
+        serializer = self.get_serializer(qs, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @action(detail=False, methods=["get"])
     def search(self, request, user_pk):
         """
@@ -1,7 +1,7 @@
-import debug_toolbar
 from django.contrib import admin
 from django.urls import path, include
 
+from apps.core.profiling import profiling_metrics, profiling_summary
 from apps.core.utils import pong
 from settings.document import document_urls
 from django.conf.urls.static import static
@@ -10,14 +10,22 @@ from django.conf import settings
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("ping/", pong),
+    path("profiling/", profiling_summary),
+    path("profiling/metrics/", profiling_metrics),
     path("api/v1/", include("apps.user.urls")),
     path("api/v1/", include("apps.channel.urls")),
     path("api/v1/", include("apps.notice.urls")),
     path("api/v1/", include("apps.event.urls")),
     path("api/v1/", include("apps.feedback.urls")),
-    path("__debug__/", include(debug_toolbar.urls)),
 ]
 
+if "debug_toolbar" in settings.INSTALLED_APPS:
+    import debug_toolbar
+
+    urlpatterns += [
+        path("__debug__/", include(debug_toolbar.urls)),
+    ]
+
 
 urlpatterns += document_urls
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1,5 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class UserConfig(AppConfig):
-    name = "user"
+    name = "apps.user"
+
+    def ready(self):
+        from apps.user import tokens
+        from apps.user.models import User
+
+        post_save.connect(tokens.user_saved, sender=User)
+        post_delete.connect(tokens.user_deleted, sender=User)
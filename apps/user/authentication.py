@@ -0,0 +1,25 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.user.models import User
+from apps.user.tokens import is_revoked
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    # DB 조회 없이 토큰만으로 인증하는 JWT 인증
+    * `request.user`는 토큰 claim으로 만든 `User` 객체이며, 다른 필드에 접근할 때만 DB를 조회함
+    * 폐기된 토큰은 공유 캐시에 있는 denylist와 유저의 토큰 버전으로 거름 (apps/user/tokens.py)
+      * 비밀번호, username을 바꾸거나 비활성화된 유저의 토큰은 토큰 버전이 달라져 거부됨
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if is_revoked(validated_token):
+            raise AuthenticationFailed("폐기된 토큰입니다.", code="token_revoked")
+
+        return User.from_token(validated_token, api_settings.USER_ID_CLAIM)
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.14 on 2026-10-19 13:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0005_token_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='channel_claims_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -2,12 +2,106 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 
 from apps.user.utils import random_string
+from apps.user.versions import VERSION_FIELDS
 
 
 class User(AbstractUser):
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
     email = models.EmailField(max_length=254, verbose_name="email address", unique=True)
+    # 올리면 이전에 발급된 토큰이 모두 폐기됨 (apps/user/versions.py)
+    token_version = models.PositiveIntegerField(default=0)
+    # 올리면 토큰의 구독 채널 claim이 무효화됨 (apps/channel/claims.py)
+    channel_claims_version = models.PositiveIntegerField(default=0)
+
+    # 권한 확인에 쓰는 is_staff 같은 필드는 넣지 않고 DB에서 읽음
+    TOKEN_CLAIMS = ("username",)
+    # DB나 토큰에서 읽은 claim 필드의 값, 바뀐 claim을 찾는 데 씀
+    _loaded_claims = {}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_claims = instance.current_claims()
+        return instance
+
+    @classmethod
+    def from_token(cls, validated_token, user_id_claim="user_id"):
+        """
+        # 토큰의 claim만으로 DB 조회 없이 유저 객체를 만듦
+        * `id`와 `TOKEN_CLAIMS`에 있는 필드만 채워지고, 나머지 필드는 deferred 상태
+        * deferred 필드에 처음 접근할 때 나머지 필드를 한 번의 쿼리로 불러옴
+        """
+        claims = {"id": validated_token[user_id_claim]}
+        for claim in cls.TOKEN_CLAIMS:
+            if claim in validated_token:
+                claims[claim] = validated_token[claim]
+
+        # from_db는 concrete field 순서대로 값을 받음
+        field_names = [
+            f.attname for f in cls._meta.concrete_fields if f.attname in claims
+        ]
+        return cls.from_db(None, field_names, [claims[name] for name in field_names])
+
+    def current_claims(self):
+        # deferred 필드는 DB를 조회하지 않도록 건너뜀
+        return {
+            claim: self.__dict__[claim]
+            for claim in self.TOKEN_CLAIMS
+            if claim in self.__dict__
+        }
+
+    def changed_claims(self):
+        """
+        # 읽어 온 뒤 값을 바꾼 claim 필드들
+        """
+        current = self.current_claims()
+        return {
+            claim
+            for claim, value in self._loaded_claims.items()
+            if claim in current and current[claim] != value
+        }
+
+    def save(self, *args, **kwargs):
+        # 토큰 버전은 versions.bump_versions로만 바꾸므로,
+        # 버전을 올리기 전에 읽은 객체를 저장해도 버전이 되돌아가지 않도록 저장할 필드에서 뺌
+        # claim 필드는 토큰에서 온 이전 값일 수 있으므로 직접 바꾼 경우에만 저장함
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            unchanged = set(self._loaded_claims) - self.changed_claims()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in VERSION_FIELDS
+                and field.name not in unchanged
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+        # post_save signal(apps/user/tokens.py)이 바뀐 claim을 본 뒤에 저장된 값으로 맞춤
+        saved = kwargs.get("update_fields")
+        self._loaded_claims = {
+            **self._loaded_claims,
+            **{
+                claim: value
+                for claim, value in self.current_claims().items()
+                if saved is None or claim in saved
+            },
+        }
+
+    def refresh_from_db(self, using=None, fields=None):
+        # deferred 필드 하나에 접근할 때 남은 deferred 필드도 함께 불러와서 쿼리가 여러 번 나가지 않도록 함
+        if fields is not None:
+            fields = set(fields) | self.get_deferred_fields()
+        super().refresh_from_db(using=using, fields=fields)
+        self._loaded_claims = {
+            **self._loaded_claims,
+            **{
+                claim: value
+                for claim, value in self.current_claims().items()
+                if fields is None or claim in fields
+            },
+        }
 
 
 class EmailInfo(models.Model):
@@ -0,0 +1,28 @@
+from django.db.models import OuterRef, Subquery
+
+from apps.channel.models import Channel
+from apps.core.rows import RowSerializer
+from apps.user.models import User
+
+
+def user_columns(prefix=""):
+    """
+    # `UserSerializer`와 같은 응답을 만드는 컬럼
+    """
+    return {
+        "id": f"{prefix}id",
+        "username": f"{prefix}username",
+        "email": f"{prefix}email",
+        "first_name": f"{prefix}first_name",
+        "last_name": f"{prefix}last_name",
+        "private_channel_id": Subquery(
+            Channel._base_manager.filter(
+                managers=OuterRef(f"{prefix}id"), is_private=True
+            )
+            .order_by("id")
+            .values("id")[:1]
+        ),
+    }
+
+
+user_rows = RowSerializer(User, user_columns())
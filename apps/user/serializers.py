@@ -1,8 +1,17 @@
 from django.db import transaction
 from rest_framework import serializers
-
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.channel.claims import with_channel_claims
 from apps.channel.models import Channel
 from apps.user.models import User
+from apps.user.tokens import add_user_claims, is_revoked
 from apps.user.utils import is_verified_email
 
 
@@ -83,3 +92,37 @@ class UserPasswordSerializer(serializers.Serializer):
         if len(value) < 8:
             raise serializers.ValidationError("비밀번호는 8글자 이상이어야 합니다.")
         return value
+
+
+class UserTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    # 로그인 시 토큰에 유저 claim을 넣음
+    * `StatelessJWTAuthentication`이 DB 조회 없이 유저를 만들 수 있도록 함
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        data["access"] = with_channel_claims(data["access"], self.user.id)
+        return data
+
+
+class UserTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    # 토큰 갱신 시 구독 채널 claim을 새로 만듦
+    * refresh token에서 복사된 claim은 오래되었을 수 있으므로 access token에 다시 넣음
+    """
+
+    def validate(self, attrs):
+        refresh = RefreshToken(attrs["refresh"])
+        if is_revoked(refresh):
+            raise TokenError("폐기된 토큰입니다.")
+
+        data = super().validate(attrs)
+        data["access"] = with_channel_claims(
+            data["access"], refresh[api_settings.USER_ID_CLAIM]
+        )
+        return data
@@ -1,7 +1,11 @@
+from django.core.cache import cache
 from django.test import TestCase
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
 
-from apps.user.models import User
+from apps.user.authentication import StatelessJWTAuthentication
+from apps.user.models import EmailInfo, User
+from apps.user.tokens import is_revoked, revoke_token, revoke_user_tokens
 
 
 class TokenTest(TestCase):
@@ -49,3 +53,193 @@ class TokenTest(TestCase):
         )
 
         self.assertEqual(login.status_code, 200)
+
+
+class StatelessAuthenticationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="email@email.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+            is_active=True,
+        )
+
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+        login = self.client.post(
+            "/api/v1/users/login/",
+            {"username": self.user.username, "password": "password"},
+            format="json",
+        )
+        self.access = login.data["access"]
+        self.refresh = login.data["refresh"]
+
+    def authenticate(self, access):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {access}")
+        return StatelessJWTAuthentication().authenticate(request)
+
+    def test_authenticate_without_query(self):
+        # 유저의 토큰 버전은 처음 한 번만 DB에서 읽고 캐시에 둠
+        with self.assertNumQueries(1):
+            self.authenticate(self.access)
+
+        with self.assertNumQueries(0):
+            user, token = self.authenticate(self.access)
+            self.assertEqual(user.id, self.user.id)
+            self.assertEqual(user.username, self.user.username)
+            self.assertEqual(user, self.user)
+
+        with self.assertNumQueries(1):
+            self.assertFalse(user.is_staff)
+            self.assertEqual(user.email, self.user.email)
+            self.assertEqual(user.first_name, self.user.first_name)
+            self.assertTrue(user.check_password("password"))
+
+    def test_logout(self):
+        logout = self.client.post(
+            "/api/v1/users/logout/",
+            {"refresh": self.refresh},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {self.access}",
+        )
+        self.assertEqual(logout.status_code, 204)
+
+        users_me = self.client.get(
+            "/api/v1/users/me/", HTTP_AUTHORIZATION=f"Bearer {self.access}"
+        )
+        self.assertEqual(users_me.status_code, 401)
+
+        refresh = self.client.post(
+            "/api/v1/users/refresh/", {"refresh": self.refresh}, format="json"
+        )
+        self.assertEqual(refresh.status_code, 401)
+
+    def login(self, password="password"):
+        return self.client.post(
+            "/api/v1/users/login/",
+            {"username": self.user.username, "password": password},
+            format="json",
+        )
+
+    def test_revoke_user_tokens(self):
+        self.authenticate(self.access)
+        revoke_user_tokens(self.user.id)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+        # 캐시가 비워져도 DB의 토큰 버전으로 계속 폐기됨
+        cache.clear()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+
+        refresh = self.client.post(
+            "/api/v1/users/refresh/", {"refresh": self.refresh}, format="json"
+        )
+        self.assertEqual(refresh.status_code, 401)
+
+        user, _ = self.authenticate(self.login().data["access"])
+        self.assertEqual(user.id, self.user.id)
+
+    def test_change_password_revokes_tokens(self):
+        change = self.client.patch(
+            "/api/v1/users/me/change_password/",
+            {"old_password": "password", "new_password": "password2"},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {self.access}",
+        )
+        self.assertEqual(change.status_code, 200)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+        self.authenticate(self.login("password2").data["access"])
+
+    def test_find_password_revokes_tokens(self):
+        self.user.email = "snuday@snu.ac.kr"
+        self.user.save()
+        EmailInfo.of("snuday", True)
+
+        find = self.client.post(
+            "/api/v1/users/find/password/",
+            {
+                "email_prefix": "snuday",
+                "username": self.user.username,
+                "first_name": self.user.first_name,
+                "last_name": self.user.last_name,
+            },
+            format="json",
+        )
+        self.assertEqual(find.status_code, 200)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+
+    def test_deactivated_user_tokens_are_revoked(self):
+        self.authenticate(self.access)
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+
+        # 다시 활성화해도 이전 토큰은 쓸 수 없고, 다시 로그인해야 함
+        self.user.is_active = True
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+        self.authenticate(self.login().data["access"])
+
+    def test_demoted_staff_is_read_from_db(self):
+        User.objects.filter(id=self.user.id).update(is_staff=True)
+        staff = self.login().data["access"]
+        auth = f"Bearer {staff}"
+        self.assertEqual(
+            self.client.get("/profiling/", HTTP_AUTHORIZATION=auth).status_code, 200
+        )
+
+        User.objects.filter(id=self.user.id).update(is_staff=False)
+        self.assertEqual(
+            self.client.get("/profiling/", HTTP_AUTHORIZATION=auth).status_code, 403
+        )
+
+        # 다른 필드를 고쳐도 토큰에서 온 값이 DB에 다시 저장되지 않음
+        User.objects.filter(id=self.user.id).update(username="renamed")
+        update = self.client.patch(
+            "/api/v1/users/me/", {"first_name": "new"}, HTTP_AUTHORIZATION=auth
+        )
+        self.assertEqual(update.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, "new")
+        self.assertEqual(self.user.username, "renamed")
+        self.assertFalse(self.user.is_staff)
+
+    def test_rename_revokes_tokens(self):
+        auth = f"Bearer {self.access}"
+        update = self.client.patch(
+            "/api/v1/users/me/", {"username": "renamed"}, HTTP_AUTHORIZATION=auth
+        )
+        self.assertEqual(update.status_code, 200)
+        self.assertEqual(update.data["username"], "renamed")
+
+        # 이전 username claim을 가진 토큰은 쓸 수 없고, 새 username으로 다시 로그인함
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.access)
+        self.user.refresh_from_db()
+        access = self.login().data["access"]
+        me = self.client.get("/api/v1/users/me/", HTTP_AUTHORIZATION=f"Bearer {access}")
+        self.assertEqual(me.data["username"], "renamed")
+
+        # 이름을 바꾸지 않고 저장하면 토큰을 그대로 쓸 수 있음
+        self.user.first_name = "new"
+        self.user.save()
+        self.user.save(update_fields=["username"])
+        self.authenticate(access)
+
+    def test_revoked_token_is_not_culled(self):
+        token = self.authenticate(self.access)[1]
+        revoke_token(token)
+        for i in range(400):
+            cache.set(f"other-key:{i}", i)
+
+        self.assertTrue(is_revoked(token))
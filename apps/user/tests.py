@@ -1,7 +1,9 @@
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIClient
 
 from apps.channel.models import Channel, UserChannel
+from apps.core.utils import THEME_COLOR
 from apps.user.models import User, EmailInfo
 
 
@@ -210,7 +212,7 @@ class UserCreateDeleteTest(TestCase):
         )
 
         subscribing = self.client.get("/api/v1/users/me/subscribing_channels/")
-        data = subscribing.json()
+        data = subscribing.json()["results"]
 
         self.assertEqual(subscribing.status_code, 200)
         self.assertEqual(len(data), 1)
@@ -218,6 +220,100 @@ class UserCreateDeleteTest(TestCase):
         others = self.client.get(f"/api/v1/users/{self.b.id}/subscribing_channels/")
         self.assertEqual(others.status_code, 403)
 
+    def test_get_users_colors(self):
+        self.client.force_authenticate(user=self.user)
+        channels = [
+            Channel.objects.create(name=f"channel{i}", description="") for i in range(3)
+        ]
+        for channel in channels[:2]:
+            UserChannel.objects.create(
+                user=self.user, channel=channel, color=THEME_COLOR["GREEN"]
+            )
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/v1/users/me/colors/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {str(channel.id): THEME_COLOR["GREEN"] for channel in channels[:2]},
+        )
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                "/api/v1/users/me/colors/", HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+
+        # ETag는 DB의 색 목록으로 만드므로 캐시와 상관없고, 다른 곳에서 바꾼 색도 반영됨
+        cache.clear()
+        response = self.client.get("/api/v1/users/me/colors/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        UserChannel.objects.filter(user=self.user, channel=channels[1]).update(
+            color=THEME_COLOR["ORANGE"]
+        )
+        response = self.client.get("/api/v1/users/me/colors/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        self.client.patch(
+            f"/api/v1/channels/{channels[0].id}/color/",
+            {"color": THEME_COLOR["SKYBLUE"]},
+            format="json",
+        )
+        response = self.client.get("/api/v1/users/me/colors/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[str(channels[0].id)], THEME_COLOR["SKYBLUE"])
+        etag = response["ETag"]
+
+        self.client.post(f"/api/v1/channels/{channels[2].id}/subscribe/")
+        response = self.client.get("/api/v1/users/me/colors/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 3)
+
+        others = self.client.get(f"/api/v1/users/{self.b.id}/colors/")
+        self.assertEqual(others.status_code, 403)
+
+    def test_get_users_subscribing_channels_paginated(self):
+        self.client.force_authenticate(user=self.user)
+        channels = [
+            Channel.objects.create(name=f"channel{i}", description="", managers=self.b)
+            for i in range(12)
+        ]
+        for channel in reversed(channels):
+            UserChannel.objects.create(user=self.user, channel=channel)
+
+        url = "/api/v1/users/me/subscribing_channels/"
+        with self.assertNumQueries(1):
+            first = self.client.get(url, {"page_size": 5}).json()
+        with self.assertNumQueries(1):
+            second = self.client.get(first["next"]).json()
+        third = self.client.get(second["next"]).json()
+        self.assertIsNone(third["next"])
+        names = [c["name"] for page in (first, second, third) for c in page["results"]]
+        self.assertEqual(names, [channel.name for channel in reversed(channels)])
+        self.assertIn("subscribed_at", first["results"][0])
+        self.assertEqual(first["results"][0]["managers"]["id"], self.b.id)
+
+        compact = self.client.get(url, {"view": "compact"}).json()["results"][0]
+        self.assertEqual(
+            list(compact),
+            [
+                "id",
+                "name",
+                "image",
+                "color",
+                "description",
+                "is_private",
+                "is_official",
+                "is_personal",
+                "subscribers_count",
+                "managers_id",
+                "subscribed_at",
+            ],
+        )
+        self.assertEqual(compact["managers_id"], self.b.id)
+
     def test_get_users_managing_channels(self):
         self.client.force_authenticate(user=self.user)
 
@@ -231,7 +327,7 @@ class UserCreateDeleteTest(TestCase):
         )
 
         managing = self.client.get("/api/v1/users/me/managing_channels/")
-        data = managing.json()
+        data = managing.json()["results"]
 
         self.assertEqual(managing.status_code, 200)
         self.assertEqual(len(data), 1)
@@ -252,7 +348,7 @@ class UserCreateDeleteTest(TestCase):
 
         self.client.force_authenticate(user=self.user)
         managing = self.client.get("/api/v1/users/me/managing_channels/")
-        data = managing.json()
+        data = managing.json()["results"]
 
         self.assertEqual(managing.status_code, 200)
         self.assertEqual(len(data), 2)
@@ -280,7 +376,7 @@ class UserCreateDeleteTest(TestCase):
         )
 
         awaiting = self.client.get("/api/v1/users/me/awaiting_channels/")
-        data = awaiting.json()
+        data = awaiting.json()["results"]
         self.assertEqual(awaiting.status_code, 200)
         self.assertEqual(len(data), 2)
         self.assertEqual(data[1]["name"], private_channel_2.name)
@@ -391,3 +487,46 @@ class UserCreateDeleteTest(TestCase):
             format="json",
         )
         self.assertEqual(search.status_code, 400)
+
+    def test_username_prefix_search(self):
+        cache.clear()
+        self.client.force_authenticate(user=self.user)
+        url = "/api/v1/users/search/"
+        User.objects.create_user(
+            username="mytestuser", email="email3@email.com", password="password"
+        )
+
+        with self.assertNumQueries(1):
+            search = self.client.get(
+                url, {"type": "username", "q": "TEST", "mode": "prefix"}
+            )
+        self.assertEqual(search.status_code, 200)
+        self.assertEqual(
+            [user["username"] for user in search.json()], ["testuser", "testuser2"]
+        )
+        self.assertEqual(
+            set(search.json()[0]),
+            {
+                "id",
+                "username",
+                "email",
+                "first_name",
+                "last_name",
+                "private_channel_id",
+            },
+        )
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(
+                url, {"type": "username", "q": "test", "mode": "prefix"}
+            )
+        self.assertEqual(cached.json(), search.json())
+
+        contains = self.client.get(url, {"type": "username", "q": "test"})
+        self.assertEqual(len(contains.json()), 3)
+
+        search = self.client.get(
+            url, {"type": "username", "q": "estu", "mode": "prefix"}
+        )
+        self.assertEqual(search.status_code, 400)
+        self.assertEqual(self.client.get(url, {"q": "test"}).status_code, 400)
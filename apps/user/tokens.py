@@ -0,0 +1,87 @@
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.user import versions
+
+DENYLIST_KEY = "jwt:deny:{}"
+TOKEN_VERSION_CLAIM = "tok_ver"
+
+
+def add_user_claims(token, user):
+    """
+    # 토큰에 유저 claim을 추가
+    * `User.TOKEN_CLAIMS`에 있는 필드와 유저의 토큰 버전을 넣음
+    * refresh token에 넣으면 access token으로 그대로 복사됨
+    """
+    for claim in user.TOKEN_CLAIMS:
+        token[claim] = getattr(user, claim)
+    token[TOKEN_VERSION_CLAIM] = user.token_version
+    return token
+
+
+def _remaining_lifetime(token):
+    return max(int(token["exp"] - time.time()), 1)
+
+
+def revoke_token(token):
+    """
+    # 토큰 하나를 만료 시각까지 denylist에 올림
+    * 모든 worker가 같은 denylist를 보도록 공유 캐시(`REDIS_URL`)에 저장함
+    """
+    cache.set(
+        DENYLIST_KEY.format(token[api_settings.JTI_CLAIM]),
+        1,
+        _remaining_lifetime(token),
+    )
+
+
+def revoke_user_tokens(*user_ids):
+    """
+    # 지금까지 해당 유저들에게 발급된 모든 토큰을 폐기
+    * 비밀번호 변경, 비활성화 등 이전 토큰을 모두 무효화해야 할 때 사용
+    * 유저의 토큰 버전을 올리므로, 이후 로그인해서 받은 토큰은 그대로 쓸 수 있음
+    """
+    versions.bump_versions(versions.TOKEN_VERSION, user_ids)
+
+
+def is_revoked(token):
+    """
+    # 폐기된 토큰인지 확인
+    * 캐시 조회 한 번으로 토큰 단위 폐기(denylist)와 유저 단위 폐기(토큰 버전)를 함께 확인함
+    * 토큰 버전이 캐시에 없을 때만 DB를 조회함
+    * 버전 claim이 없는 이전 토큰은 버전 0으로 봄
+    """
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    deny_key = DENYLIST_KEY.format(token.get(api_settings.JTI_CLAIM))
+    version_key = versions.cache_key(versions.TOKEN_VERSION, user_id)
+    found = cache.get_many([deny_key, version_key])
+
+    if deny_key in found:
+        return True
+    version = found.get(version_key)
+    if version is None:
+        version = versions.load_version(versions.TOKEN_VERSION, user_id)
+    return token.get(TOKEN_VERSION_CLAIM, 0) != version
+
+
+def user_saved(sender, instance, update_fields=None, **kwargs):
+    """
+    # 비활성화되었거나 claim(`User.TOKEN_CLAIMS`)이 바뀐 유저의 토큰을 폐기하고, 활성 유저는 캐시된 버전을 지움
+    * 이전 토큰에 남은 claim 값을 믿지 않도록 다시 로그인하게 함
+    * `QuerySet.update()`로 claim 필드를 바꾸면 signal이 없으므로 `revoke_user_tokens`를 직접 호출해야 함
+    """
+    changed = instance.changed_claims()
+    if update_fields is not None:
+        changed &= set(update_fields)
+        if not changed and "is_active" not in update_fields:
+            return
+    if changed or not instance.is_active:
+        revoke_user_tokens(instance.id)
+    if instance.is_active:
+        versions.forget(instance.id)
+
+
+def user_deleted(sender, instance, **kwargs):
+    versions.forget(instance.id)
@@ -6,6 +6,11 @@ from apps.user.views import (
     verify_email,
     find_username,
     find_password,
+    logout,
+)
+from apps.user.serializers import (
+    UserTokenObtainPairSerializer,
+    UserTokenRefreshSerializer,
 )
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
@@ -15,8 +20,17 @@ user_router = SimpleRouter()
 user_router.register("users", UserViewSet, basename="user")
 
 urlpatterns = [
-    path("users/login/", TokenObtainPairView.as_view(), name="user-login"),
-    path("users/refresh/", TokenRefreshView.as_view(), name="user-refresh"),
+    path(
+        "users/login/",
+        TokenObtainPairView.as_view(serializer_class=UserTokenObtainPairSerializer),
+        name="user-login",
+    ),
+    path(
+        "users/refresh/",
+        TokenRefreshView.as_view(serializer_class=UserTokenRefreshSerializer),
+        name="user-refresh",
+    ),
+    path("users/logout/", logout, name="user-logout"),
     path("users/mail/send/", send_email, name="user-mail-send"),
     path("users/mail/verify/", verify_email, name="user-mail-verify"),
     path("users/find/username/", find_username, name="user-find-username"),
@@ -66,6 +80,10 @@ urlpatterns = [
         "users/<user_pk>/managing_channels/",
         UserViewSet.as_view({"get": "managing_channels"}),
     ),
+    path(
+        "users/<user_pk>/colors/",
+        UserViewSet.as_view({"get": "colors"}),
+    ),
     path(
         "users/<user_pk>/change_password/",
         UserViewSet.as_view(
@@ -0,0 +1,73 @@
+"""
+# 유저별 토큰 버전
+* 토큰에 발급 당시의 버전을 넣고, 요청마다 지금 버전과 비교해 이전에 발급된 토큰을 한꺼번에 무효화함
+* 값은 `User`의 컬럼(`VERSION_FIELDS`)에 저장하고, 요청마다 DB를 조회하지 않도록
+  공유 캐시에 `USER_VERSION_CACHE_TIMEOUT`초 동안 올려 둠
+  * 캐시에서 지워져도 DB에서 다시 읽으므로 버전이 바뀌지 않음
+  * 버전을 올리면 바로, 그리고 commit 후 한 번 더 캐시를 지움
+  * 그 사이 DB를 읽던 요청이 이전 값을 다시 올려 두어도 timeout 뒤에는 바로잡힘
+* 비활성화되었거나 없는 유저의 버전은 `INACTIVE`로, 어떤 토큰의 버전과도 같지 않음
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+TOKEN_VERSION = "token_version"
+CHANNEL_CLAIMS_VERSION = "channel_claims_version"
+VERSION_FIELDS = (TOKEN_VERSION, CHANNEL_CLAIMS_VERSION)
+VERSION_KEY = "user-version:{}:{}"
+INACTIVE = -1
+
+
+def cache_key(field, user_id):
+    return VERSION_KEY.format(field, user_id)
+
+
+def load_version(field, user_id):
+    """
+    # DB에서 버전을 읽어 캐시에 올림
+    """
+    from apps.user.models import User
+
+    # 캐시에 오래 두는 값이므로 replica가 아닌 primary에서 읽음
+    version = (
+        User.objects.using("default")
+        .filter(id=user_id, is_active=True)
+        .values_list(field, flat=True)
+        .first()
+    )
+    if version is None:
+        version = INACTIVE
+    cache.set(cache_key(field, user_id), version, settings.USER_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+def get_version(field, user_id):
+    version = cache.get(cache_key(field, user_id))
+    if version is None:
+        version = load_version(field, user_id)
+    return version
+
+
+def bump_versions(field, user_ids):
+    """
+    # 유저들의 버전을 올려 이전에 발급된 토큰의 버전과 달라지게 함
+    """
+    from apps.user.models import User
+
+    user_ids = list(user_ids)
+    User.objects.filter(id__in=user_ids).update(**{field: F(field) + 1})
+    _delete([cache_key(field, user_id) for user_id in user_ids])
+
+
+def forget(user_id):
+    """
+    # 유저의 캐시된 버전을 모두 지움, 활성 상태가 바뀌었을 때 호출
+    """
+    _delete([cache_key(field, user_id) for field in VERSION_FIELDS])
+
+
+def _delete(keys):
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
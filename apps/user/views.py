@@ -1,16 +1,69 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.core.mail import EmailMessage
-from django.db.models import Q
+from django.utils.cache import get_conditional_response
 from rest_framework import viewsets, status, mixins
-from rest_framework.decorators import action, api_view
+from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
 from string import ascii_letters, digits, punctuation
+import hashlib
 import secrets
 
-from apps.channel.serializers import ChannelSerializer, ChannelAwaiterSerializer
+from apps.channel.colors import colors_etag, user_colors
+from apps.channel.models import AwaiterChannel, Channel, UserChannel
+from apps.channel.rows import (
+    awaiting_channel_rows,
+    managing_channel_rows,
+    subscribing_channel_rows,
+)
 from apps.core.mixins import SerializerChoiceMixin
+from apps.core.paginator import CreatedAtCursorPagination
+from apps.core.utils import random_color
 from apps.user.models import User, EmailInfo
+from apps.user.rows import user_rows
 from apps.user.serializers import UserSerializer, UserPasswordSerializer
+from apps.user.tokens import revoke_token, revoke_user_tokens
+
+
+USER_SEARCH_LIMIT = 5
+USER_SEARCH_CACHE_KEY = "user-search-prefix:{}"
+
+
+def search_username_prefix(keyword):
+    """
+    # username이 `keyword`로 시작하는 유저 (대소문자 구분 없음)
+    * MySQL에서 `istartswith`는 `LIKE 'keyword%'`로, 대소문자를 구분하지 않는 username 컬럼의
+      index를 그대로 사용함 (`startswith`의 `LIKE BINARY`는 index를 쓰지 못함)
+    """
+    keyword = keyword.lower()
+    key = USER_SEARCH_CACHE_KEY.format(hashlib.md5(keyword.encode()).hexdigest())
+    data = cache.get(key)
+    if data is None:
+        qs = User.objects.filter(username__istartswith=keyword).order_by("username")
+        data = user_rows(qs[:USER_SEARCH_LIMIT])
+        if settings.USER_SEARCH_CACHE_TIMEOUT:
+            cache.set(key, data, settings.USER_SEARCH_CACHE_TIMEOUT)
+    return data
+
+
+class SubscriptionCursorPagination(CreatedAtCursorPagination):
+    """
+    # 구독(신청) 순서 페이지네이터
+    * 구독(신청) 시각 순, 같은 시각이면 channel id 순
+    """
+
+    ordering = ("created_at", "channel__id")
+
+
+class ManagingCursorPagination(CreatedAtCursorPagination):
+    """
+    # 채널을 만든 순서 페이지네이터
+    """
+
+    ordering = ("created_at", "id")
 
 
 class UserViewSet(
@@ -19,9 +72,6 @@ class UserViewSet(
     queryset = User.objects.all()
     serializer_classes = {
         "default": UserSerializer,
-        "subscribing_channels": ChannelSerializer,
-        "managing_channels": ChannelAwaiterSerializer,
-        "awaiting_channels": ChannelSerializer,
         "change_password": UserPasswordSerializer,
     }
 
@@ -54,6 +104,7 @@ class UserViewSet(
         """
         # 업데이트하기
         * 다른 이의 정보를 업데이트 할 수 없음
+        * username을 바꾸면 이전 토큰이 모두 폐기되므로 다시 로그인해야 함
         """
         if user_pk != "me":
             return Response(
@@ -71,44 +122,93 @@ class UserViewSet(
         serializer.save()
         return Response(serializer.data)
 
-    @action(detail=True, methods=["GET"])
+    def channel_page(self, queryset, rows, pagination_class):
+        """
+        # 채널 목록 한 페이지
+        * params의 'view'가 'compact'면 `ChannelSummarySerializer`와 같은 요약(매니저는 `managers_id`)
+        * 한 페이지를 `.values()` 쿼리 하나로 읽음
+        """
+        # `users/<user_pk>/...` url은 router를 거치지 않아 action 인자로는 바꿀 수 없음
+        self.pagination_class = pagination_class
+        rows = rows[self.request.query_params.get("view") == "compact"]
+        page = self.paginate_queryset(
+            rows.values(queryset, context={"request": self.request})
+        )
+        return self.get_paginated_response(rows.to_representation(page))
+
+    @action(detail=True, methods=["GET"], pagination_class=SubscriptionCursorPagination)
     def subscribing_channels(self, request, user_pk=None):
         """
         # 구독 중인 채널
+        * 구독한 순서, 각 채널에 구독 시각 `subscribed_at`을 붙임
+        * cursor pagination 적용됨, `page_size`로 한 페이지 크기를 바꿀 수 있음
+        * params의 'view'가 'compact'면 요약
         """
         if user_pk != "me":
             return Response(
                 "다른 이가 구독중인 채널을 볼 수 없습니다.", status=status.HTTP_403_FORBIDDEN
             )
-        qs = request.user.subscribing_channels.filter(is_personal=False)
-        data = self.get_serializer(qs, many=True).data
-        return Response(data)
+        qs = UserChannel.objects.filter(user=request.user, channel__is_personal=False)
+        return self.channel_page(
+            qs, subscribing_channel_rows, SubscriptionCursorPagination
+        )
 
     @action(detail=True, methods=["GET"])
     def managing_channels(self, request, user_pk=None):
         """
         # 관리 중인 채널
+        * 채널을 만든 순서, 각 채널에 대기자 수 `awaiters_count`를 붙임
+        * cursor pagination 적용됨, `page_size`로 한 페이지 크기를 바꿀 수 있음
+        * params의 'view'가 'compact'면 요약
         """
         if user_pk != "me":
             return Response(
                 "다른 이가 관리중인 채널을 볼 수 없습니다.", status=status.HTTP_403_FORBIDDEN
             )
-        qs = request.user.managing_channels.filter(is_personal=False)
-        data = self.get_serializer(qs, many=True).data
-        return Response(data)
+        qs = Channel._base_manager.filter(managers=request.user, is_personal=False)
+        response = self.channel_page(
+            qs, managing_channel_rows, ManagingCursorPagination
+        )
+        # 구독하지 않은 채널의 색은 `ChannelAwaiterSerializer`처럼 테마 색 중 하나
+        for channel in response.data["results"]:
+            if channel["color"] is None:
+                channel["color"] = random_color()
+        return response
 
-    @action(detail=True, methods=["GET"])
+    @action(detail=True, methods=["GET"], pagination_class=SubscriptionCursorPagination)
     def awaiting_channels(self, request, user_pk=None):
         """
         # 구독 신청 후 대기 중인 private 채널
+        * 신청한 순서, 각 채널에 신청 시각 `requested_at`을 붙임
+        * cursor pagination 적용됨, `page_size`로 한 페이지 크기를 바꿀 수 있음
+        * params의 'view'가 'compact'면 요약
         """
         if user_pk != "me":
             return Response(
                 "다른 이가 대기중인 채널을 볼 수 없습니다.", status=status.HTTP_403_FORBIDDEN
             )
-        qs = request.user.awaiting_channels.all()
-        data = self.get_serializer(qs, many=True).data
-        return Response(data)
+        qs = AwaiterChannel.objects.filter(user=request.user)
+        return self.channel_page(
+            qs, awaiting_channel_rows, SubscriptionCursorPagination
+        )
+
+    @action(detail=True, methods=["GET"])
+    def colors(self, request, user_pk=None):
+        """
+        # 구독 중인 채널마다 지정한 색
+        * `{채널 id: 색}`
+        * 응답의 `ETag`를 `If-None-Match`로 보내면 구독, 색이 바뀌지 않았을 때 본문 없이 304
+        """
+        if user_pk != "me":
+            return Response("다른 이가 지정한 색을 볼 수 없습니다.", status=status.HTTP_403_FORBIDDEN)
+        rows = user_colors(request.user.id)
+        etag = colors_etag(rows)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(dict(rows))
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
 
     @action(detail=True, methods=["PATCH"])
     def change_password(self, request, user_pk=None):
@@ -142,6 +242,8 @@ class UserViewSet(
 
             user.set_password(serializer.data.get("new_password"))
             user.save()
+            # 이전 비밀번호로 받은 토큰은 모두 폐기하고, 새 비밀번호로 다시 로그인하게 함
+            revoke_user_tokens(user.id)
 
             response = {
                 "status": "success",
@@ -159,28 +261,36 @@ class UserViewSet(
         """
         # username 검색 API
         * params의 'type'으로 검색 타입 'username'
-        * params의 'q'로 검색어를 받음
+        * params의 'q'로 검색어를 받음, 두 글자 이상
+        * params의 'mode'가 'prefix'면 username이 검색어로 시작하는 유저만 찾음 (자동완성용)
+          * username index를 타고 username 순서로 앞의 몇 명만 읽음
+          * 같은 검색어의 결과는 `USER_SEARCH_CACHE_TIMEOUT`초 동안 캐시
+        * 그 외에는 username에 검색어가 들어간 유저
+        * 최대 5명, 쿼리 하나로 찾음
         """
-        qs = User.objects.all()
-        param = request.query_params
-        search_keyword = self.request.GET.get("q", "")
-        search_type = self.request.GET.get("type", "")
+        search_keyword = request.query_params.get("q", "")
+        search_type = request.query_params.get("type", "")
 
-        if len(param["q"]) < 2:
+        if len(search_keyword) < 2:
             return Response(
                 {"error": "검색어를 두 글자 이상 입력해주세요"}, status=status.HTTP_400_BAD_REQUEST
             )
+        if search_type != "username":
+            return Response(
+                {"error": "지원하지 않는 검색 타입입니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
 
-        if search_keyword:
-            if search_type == "username":
-                qs = qs.filter(Q(username__icontains=search_keyword))[:5]
+        if request.query_params.get("mode") == "prefix":
+            data = search_username_prefix(search_keyword)
+        else:
+            qs = User.objects.filter(username__icontains=search_keyword)
+            data = user_rows(qs[:USER_SEARCH_LIMIT])
 
-            if not qs.exists():
-                return Response(
-                    {"error": "검색 결과가 없습니다."}, status=status.HTTP_400_BAD_REQUEST
-                )
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if not data:
+            return Response(
+                {"error": "검색 결과가 없습니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(data, status=status.HTTP_200_OK)
 
     def create(self, request, *args, **kwargs):
         """
@@ -199,6 +309,25 @@ class UserViewSet(
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def logout(request):
+    """
+    # 로그아웃
+    * 요청에 사용한 access token을 폐기함
+    * request의 `body`로 `refresh`를 주면 refresh token도 함께 폐기함
+    """
+    revoke_token(request.auth)
+
+    if "refresh" in request.data:
+        try:
+            revoke_token(RefreshToken(request.data["refresh"]))
+        except TokenError:
+            return Response("잘못된 refresh token입니다.", status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 @api_view(["POST"])
 def send_email(request):
     """
@@ -280,6 +409,7 @@ def find_password(request):
 
         user.set_password(temp_password)
         user.save()
+        revoke_user_tokens(user.id)
 
         email = EmailMessage(
             "SNUDAY 비밀번호 재발급", temp_password, to=[f"{email_prefix}@snu.ac.kr"]
@@ -0,0 +1,34 @@
+"""
+# 성능 측정 스크립트 모음
+* `python -m benchmarks.<이름>`으로 실행
+* `manage.py`와 같이 `.env`를 읽고, `DJANGO_SETTINGS_MODULE`이 없으면 `settings.dev`를 사용
+"""
+import os
+import timeit
+
+import dotenv
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup():
+    dotenv.read_dotenv(os.path.join(BASE_DIR, ".env"))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings.dev")
+
+    import django
+
+    django.setup()
+
+
+def per_call(func, number=1000, repeat=5):
+    """
+    # `func` 한 번 호출에 걸리는 시간(초), `repeat`번 측정한 것 중 최솟값
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
@@ -0,0 +1,83 @@
+"""
+# 채널 이름 자동완성 비교
+* 테스트 DB에 공개 채널 N개(기본 10만 개)를 만들고, 한 번 검색하는 시간을 비교
+  * `icontains`: `channels/search/?type=name`처럼 DB에서 이름에 검색어가 들어간 채널
+  * `istartswith`: DB에서 이름이 검색어로 시작하는 채널
+  * `index`: `channels/autocomplete/`의 메모리 index (`apps/channel/name_index.py`)
+* index를 만드는 시간과 index가 차지하는 메모리(tracemalloc)도 출력
+
+```bash
+python -m benchmarks.channel_names --channels 100000
+```
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmarks import per_call, setup
+from benchmarks.data import WORDS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--channels", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup()
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from apps.channel.models import Channel
+    from apps.channel.name_index import ChannelNameIndex
+    from benchmarks.data import bulk_create
+
+    rng = random.Random(args.seed)
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        bulk_create(
+            Channel,
+            [
+                Channel(
+                    name=f"{' '.join(rng.sample(WORDS, 2))} {i}",
+                    description="",
+                    is_personal=False,
+                )
+                for i in range(args.channels)
+            ],
+        )
+        index = ChannelNameIndex()
+        tracemalloc.start()
+        started = time.perf_counter()
+        index.refresh()
+        elapsed = time.perf_counter() - started
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(
+            f"{len(index.names)} channels, {len(index.keys)} keys: "
+            f"build {elapsed * 1e3:.0f}ms, {memory / 1024:.0f}KiB"
+        )
+
+        for keyword in (WORDS[0][:1], WORDS[0], f"{WORDS[0]} {WORDS[1][:1]}", "zz"):
+            public = Channel.objects.filter(is_personal=False, is_private=False)
+            names = public.values_list("id", "name")
+            cases = {
+                "icontains": lambda: list(names.filter(name__icontains=keyword)[:10]),
+                "istartswith": lambda: list(
+                    names.filter(name__istartswith=keyword)[:10]
+                ),
+                "index": lambda: index.search(keyword),
+            }
+            print(f"keyword {keyword!r}")
+            for name, func in cases.items():
+                number = 10000 if name == "index" else 20
+                print(f"  {name:>12}: {per_call(func, number=number) * 1e6:10.1f}us")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
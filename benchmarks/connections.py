@@ -0,0 +1,58 @@
+"""
+# DB 연결 재사용 효과 측정
+* 설정된 DB(`default`)에 대해 연결 한 번을 맺는 시간과,
+  `CONN_MAX_AGE`가 0일 때와 양수일 때 요청당 시간을 WSGI handler로 비교
+* 요청 시작/끝의 signal이 실제 서버와 같이 동작하도록 test client 대신 handler를 직접 호출
+* MySQL에서 실행해야 TCP 연결, 인증, `SET NAMES`에 드는 시간이 드러남
+"""
+
+from benchmarks import per_call, setup
+
+setup()
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connection
+from django.test import RequestFactory, override_settings
+
+ENDPOINT = "/api/v1/channels/recommend/"
+
+
+def connect_time():
+    def connect():
+        connection.connect()
+        connection.close()
+
+    connection.close()
+    return per_call(connect, number=50)
+
+
+def request_time(conn_max_age):
+    connection.close()
+    connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+
+    with override_settings(ALLOWED_HOSTS=["*"]):
+        handler = WSGIHandler()
+        environ = RequestFactory().get(ENDPOINT).environ
+
+        def request():
+            response = handler(dict(environ), lambda status, headers: None)
+            response.close()
+
+        return per_call(request, number=200)
+
+
+def main():
+    conn_max_age = connection.settings_dict["CONN_MAX_AGE"]
+    print(f"{connection.vendor} connect: {connect_time() * 1e3:.3f}ms")
+
+    fresh = request_time(0)
+    persistent = request_time(conn_max_age or 60)
+    print(f"CONN_MAX_AGE=0      : {fresh * 1e3:.3f}ms/request ({ENDPOINT})")
+    print(f"CONN_MAX_AGE={conn_max_age or 60:<6} : {persistent * 1e3:.3f}ms/request")
+    print(f"saved               : {(fresh - persistent) * 1e3:.3f}ms/request")
+
+    connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+# 벤치마크용 가짜 데이터 생성
+* 유저, 채널, 구독(`UserChannel`), 공지사항, 일정을 실제 사용 패턴처럼 치우치게 만듦
+  * 채널 인기도는 Zipf 분포를 따라 소수의 채널에 구독, 공지사항, 일정이 몰림
+  * 유저마다 구독하는 채널 수는 로그정규분포를 따라 대부분은 몇 개, 일부는 수십 개
+  * 일정은 오늘을 중심으로 앞뒤 반년에 퍼지고 대부분은 하루짜리, 일부는 며칠짜리
+* 같은 `seed`면 같은 데이터가 만들어지므로 커밋 사이의 비교에 사용할 수 있음
+* 만든 유저는 모두 `bench_user<번호>` / `PASSWORD`로 로그인할 수 있음
+
+```bash
+python -m benchmarks.data --users 2000 --channels 300 --notices 20000 --events 20000
+```
+"""
+import argparse
+import random
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+
+from benchmarks import setup
+
+USERNAME_PREFIX = "bench_user"
+PASSWORD = "password"
+BATCH_SIZE = 1000
+
+WORDS = (
+    "와플",
+    "스튜디오",
+    "동아리",
+    "학생회",
+    "세미나",
+    "스터디",
+    "밴드",
+    "축제",
+    "공연",
+    "학과",
+    "연구실",
+    "리그",
+    "봉사",
+    "취업",
+    "장학",
+)
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    # `created_at`, `updated_at`을 직접 넣을 수 있도록 auto_now, auto_now_add를 잠시 끔
+    """
+    fields = [
+        (field, field.auto_now, field.auto_now_add)
+        for model in models
+        for field in model._meta.concrete_fields
+        if field.name in ("created_at", "updated_at")
+    ]
+    for field, _, _ in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def zipf_weights(n, s=1.1):
+    return [1 / (rank + 1) ** s for rank in range(n)]
+
+
+def bulk_create(model, objs):
+    """
+    # 새로 만든 row의 id를 만든 순서대로 반환
+    * MySQL에서는 `bulk_create`가 pk를 채워주지 않으므로 생성 전 최대 id 이후의 row를 다시 읽음
+    """
+    from django.db.models import Max
+
+    last_id = model.objects.aggregate(last=Max("id"))["last"] or 0
+    model.objects.bulk_create(objs, batch_size=BATCH_SIZE)
+    return list(
+        model.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)
+    )
+
+
+def reset():
+    from apps.user.models import User
+
+    # 개인 채널, 관리하는 채널, 구독, 공지사항, 일정은 cascade로 함께 지워짐
+    return User.objects.filter(username__startswith=USERNAME_PREFIX).delete()[0]
+
+
+def generate(users=1000, channels=200, notices=10000, events=10000, seed=0):
+    """
+    # 데이터를 만들고 만든 개수를 반환
+    """
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+    from django.utils import timezone
+
+    from apps.channel.models import Channel, UserChannel
+    from apps.core.utils import THEME_COLOR
+    from apps.event.models import Event
+    from apps.notice.models import Notice
+    from apps.user.models import User
+
+    rng = random.Random(seed)
+    colors = list(THEME_COLOR.values())
+    now = timezone.now()
+    today = date.today()
+
+    def past(days):
+        return now - timedelta(days=rng.uniform(0, days), seconds=rng.random())
+
+    with transaction.atomic(), explicit_timestamps(Channel, Notice, Event):
+        # 해싱은 느리므로 한 번만 하고 모든 유저가 같은 비밀번호를 씀
+        password = make_password(PASSWORD)
+        user_ids = bulk_create(
+            User,
+            [
+                User(
+                    username=f"{USERNAME_PREFIX}{i}",
+                    email=f"{USERNAME_PREFIX}{i}@snu.ac.kr",
+                    password=password,
+                    first_name=f"유저{i}",
+                    last_name=rng.choice("김이박최정강조윤장임"),
+                )
+                for i in range(users)
+            ],
+        )
+
+        personal_ids = bulk_create(
+            Channel,
+            [
+                Channel(
+                    name=f"{USERNAME_PREFIX}{i}의 채널",
+                    description="개인 채널입니다.",
+                    is_private=True,
+                    is_personal=True,
+                    managers_id=user_id,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for i, user_id in enumerate(user_ids)
+            ],
+        )
+
+        # 관리자도 치우치게 해서 일부 유저가 여러 채널을 관리하도록 함
+        manager_weights = zipf_weights(len(user_ids), s=0.8)
+        managers = rng.choices(user_ids, manager_weights, k=channels)
+        created = [past(365 * 2) for _ in range(channels)]
+        channel_ids = bulk_create(
+            Channel,
+            [
+                Channel(
+                    name=f"{' '.join(rng.sample(WORDS, 2))} {i}",
+                    description=f"{rng.choice(WORDS)} 채널입니다. " * rng.randint(1, 5),
+                    is_private=rng.random() < 0.1,
+                    is_official=rng.random() < 0.05,
+                    managers_id=manager,
+                    created_at=created[i],
+                    updated_at=created[i],
+                )
+                for i, manager in enumerate(managers)
+            ],
+        )
+
+        channel_weights = zipf_weights(len(channel_ids))
+        subscriptions = [
+            UserChannel(
+                user_id=user_id, channel_id=channel_id, color=rng.choice(colors)
+            )
+            for user_id, channel_id in zip(user_ids, personal_ids)
+        ]
+        for user_id in user_ids:
+            count = min(len(channel_ids), int(rng.lognormvariate(1.5, 0.8)) + 1)
+            for channel_id in set(rng.choices(channel_ids, channel_weights, k=count)):
+                subscriptions.append(
+                    UserChannel(
+                        user_id=user_id, channel_id=channel_id, color=rng.choice(colors)
+                    )
+                )
+        UserChannel.objects.bulk_create(subscriptions, batch_size=BATCH_SIZE)
+
+        channel_managers = dict(zip(channel_ids, managers))
+        notice_channels = rng.choices(channel_ids, channel_weights, k=notices)
+        notice_times = sorted(past(365) for _ in range(notices))
+        Notice.objects.bulk_create(
+            [
+                Notice(
+                    title=f"{rng.choice(WORDS)} 공지 {i}",
+                    contents=f"{rng.choice(WORDS)} 관련 공지사항입니다. " * rng.randint(1, 20),
+                    writer_id=channel_managers[channel_id],
+                    channel_id=channel_id,
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+                for i, (channel_id, created_at) in enumerate(
+                    zip(notice_channels, notice_times)
+                )
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+        event_channels = rng.choices(channel_ids, channel_weights, k=events)
+        event_list = []
+        for i, channel_id in enumerate(event_channels):
+            start_date = today + timedelta(days=rng.randint(-180, 180))
+            days = 0 if rng.random() < 0.7 else int(rng.expovariate(1 / 5))
+            has_time = rng.random() < 0.5
+            start_time = time(rng.randint(8, 20)) if has_time else None
+            created_at = min(now, past(30) - timedelta(days=(today - start_date).days))
+            event_list.append(
+                Event(
+                    title=f"{rng.choice(WORDS)} 일정 {i}",
+                    memo=f"{rng.choice(WORDS)} 일정입니다." if rng.random() < 0.5 else None,
+                    writer_id=channel_managers[channel_id],
+                    channel_id=channel_id,
+                    has_time=has_time,
+                    start_date=start_date,
+                    due_date=start_date + timedelta(days=days),
+                    start_time=start_time,
+                    due_time=(
+                        (
+                            datetime.combine(today, start_time) + timedelta(hours=2)
+                        ).time()
+                        if has_time
+                        else None
+                    ),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        Event.objects.bulk_create(event_list, batch_size=BATCH_SIZE)
+
+    return {
+        "users": len(user_ids),
+        "channels": len(channel_ids) + len(personal_ids),
+        "subscriptions": len(subscriptions),
+        "notices": notices,
+        "events": events,
+        "seed": seed,
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--channels", type=int, default=200)
+    parser.add_argument("--notices", type=int, default=10000)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_arguments(parser)
+    parser.add_argument("--reset", action="store_true", help="이전에 만든 벤치마크 데이터를 먼저 지움")
+    args = parser.parse_args()
+
+    setup()
+    if args.reset:
+        print(f"deleted {reset()} rows")
+    counts = generate(args.users, args.channels, args.notices, args.events, args.seed)
+    print(", ".join(f"{key} {value}" for key, value in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
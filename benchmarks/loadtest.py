@@ -0,0 +1,131 @@
+"""
+# 실행 중인 서버에 대한 부하 테스트
+* 주요 API를 여러 스레드로 동시에 호출해 endpoint별 처리량(req/s)과 응답 시간을 측정
+* 서버 구성(runserver, gunicorn wsgi, gunicorn asgi 등)을 바꿔 가며 같은 조건으로 실행해 비교
+
+```bash
+python -m benchmarks.loadtest --base-url http://localhost:8000 \
+    --username testuser --password password --concurrency 16 --duration 30
+```
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+
+import requests
+
+from benchmarks import percentile
+
+ENDPOINTS = (
+    "/ping/",
+    "/api/v1/channels/",
+    "/api/v1/channels/recommend/",
+    "/api/v1/channels/search/?type=all&q=와플",
+    "/api/v1/users/me/",
+    "/api/v1/users/me/notices/",
+    f"/api/v1/users/me/events/?month={date.today():%Y-%m}",
+)
+
+
+def login(base_url, username, password):
+    response = requests.post(
+        f"{base_url}/api/v1/users/login/",
+        json={"username": username, "password": password},
+    )
+    response.raise_for_status()
+    return response.json()["access"]
+
+
+def worker(base_url, endpoints, headers, deadline, results, errors):
+    session = requests.Session()
+    session.headers.update(headers)
+    i = 0
+    while time.perf_counter() < deadline:
+        endpoint = endpoints[i % len(endpoints)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            response = session.get(base_url + endpoint)
+            ok = response.status_code < 500
+        except requests.RequestException:
+            ok = False
+        elapsed = time.perf_counter() - started
+        if ok:
+            results[endpoint].append(elapsed)
+        else:
+            errors[endpoint] += 1
+
+
+def run(base_url, endpoints, headers, concurrency, duration):
+    results = defaultdict(list)
+    errors = defaultdict(int)
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(
+            target=worker,
+            args=(base_url, endpoints, headers, deadline, results, errors),
+        )
+        for _ in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = {}
+    for endpoint in endpoints:
+        latencies = results[endpoint]
+        report[endpoint] = {
+            "requests": len(latencies),
+            "errors": errors[endpoint],
+            "rps": len(latencies) / duration,
+            "mean_ms": statistics.mean(latencies) * 1000 if latencies else None,
+            "p50_ms": (percentile(latencies, 0.5) or 0) * 1000,
+            "p95_ms": (percentile(latencies, 0.95) or 0) * 1000,
+            "p99_ms": (percentile(latencies, 0.99) or 0) * 1000,
+        }
+    total = sum(len(latencies) for latencies in results.values())
+    report["total"] = {"requests": total, "rps": total / duration}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--endpoint", action="append", dest="endpoints")
+    parser.add_argument("--output", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    headers = {}
+    if args.username:
+        access = login(args.base_url, args.username, args.password)
+        headers["Authorization"] = f"Bearer {access}"
+
+    endpoints = args.endpoints or ENDPOINTS
+    report = run(args.base_url, endpoints, headers, args.concurrency, args.duration)
+
+    for endpoint, row in report.items():
+        if endpoint == "total":
+            continue
+        print(
+            f"{row['rps']:8.1f} req/s  p50 {row['p50_ms']:7.1f}ms  "
+            f"p95 {row['p95_ms']:7.1f}ms  p99 {row['p99_ms']:7.1f}ms  "
+            f"errors {row['errors']:4d}  {endpoint}"
+        )
+    print(f"{report['total']['rps']:8.1f} req/s  total")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
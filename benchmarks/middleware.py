@@ -0,0 +1,57 @@
+"""
+# 미들웨어 체인의 요청당 오버헤드 측정
+* DB를 쓰지 않는 `/ping/`을 WSGI handler로 직접 호출해, 미들웨어 구성별 요청당 시간을 비교
+* `production`은 현재 `settings.base`의 구성, `with debug toolbar`는 debug toolbar를 base에 두던 이전 구성
+"""
+from benchmarks import per_call, setup
+
+setup()
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import RequestFactory, override_settings
+
+from settings import base
+
+CHAINS = {
+    "no middleware": [],
+    "production": base.MIDDLEWARE,
+    "with debug toolbar": base.MIDDLEWARE[:-1]
+    + ["debug_toolbar.middleware.DebugToolbarMiddleware"]
+    + base.MIDDLEWARE[-1:],
+}
+
+
+def measure(middleware):
+    installed_apps = settings.INSTALLED_APPS
+    if "debug_toolbar" not in installed_apps:
+        installed_apps = installed_apps + ["debug_toolbar"]
+
+    with override_settings(
+        MIDDLEWARE=middleware,
+        INSTALLED_APPS=installed_apps,
+        ALLOWED_HOSTS=["*"],
+        DEBUG=False,
+    ):
+        handler = WSGIHandler()
+        environ = RequestFactory().get("/ping/").environ
+
+        def request():
+            response = handler(dict(environ), lambda status, headers: None)
+            response.close()
+
+        return per_call(request, number=500)
+
+
+def main():
+    baseline = measure(CHAINS["no middleware"])
+    for name, middleware in CHAINS.items():
+        elapsed = measure(middleware)
+        print(
+            f"{name:>20}: {elapsed * 1e6:8.1f}us/request "
+            f"(middleware {(elapsed - baseline) * 1e6:7.1f}us, {len(middleware)} classes)"
+        )
+
+
+if __name__ == "__main__":
+    main()
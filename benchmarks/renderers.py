@@ -0,0 +1,108 @@
+"""
+# JSON renderer, parser 비교
+* 큰 `users/me/events` 응답(일정 N개)과 채널 목록 응답을 DRF의 `JSONRenderer`와
+  `FastJSONRenderer`(orjson)로 각각 직렬화, 파싱하는 데 걸리는 시간을 비교
+* 응답 데이터는 serializer로 만들되 DB를 쓰지 않도록 저장하지 않은 모델 인스턴스를 사용
+
+```bash
+python -m benchmarks.renderers --events 2000 --channels 500
+```
+"""
+import argparse
+import io
+import random
+from datetime import date, time, timedelta
+
+from benchmarks import per_call, setup
+
+
+def event_payload(count):
+    from django.utils import timezone
+
+    from apps.channel.models import Channel
+    from apps.event.models import Event
+    from apps.event.serializers import EventChannelNameSerializer
+
+    channels = [Channel(id=i, name=f"와플스튜디오 채널 {i}") for i in range(1, 51)]
+    now = timezone.now()
+    events = []
+    for i in range(count):
+        start_date = date.today() + timedelta(days=random.randint(-15, 15))
+        has_time = random.random() < 0.5
+        events.append(
+            Event(
+                id=i,
+                title=f"정기 세미나 {i}",
+                memo="장소는 301동 417호입니다." if i % 2 else None,
+                channel=random.choice(channels),
+                writer_id=1,
+                has_time=has_time,
+                start_date=start_date,
+                due_date=start_date + timedelta(days=random.randint(0, 3)),
+                start_time=time(10) if has_time else None,
+                due_time=time(12) if has_time else None,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return EventChannelNameSerializer(events, many=True).data
+
+
+def channel_payload(count):
+    from django.utils import timezone
+
+    from apps.channel.models import Channel
+    from apps.channel.serializers import ChannelSummarySerializer
+
+    now = timezone.now()
+    channels = []
+    for i in range(count):
+        channel = Channel(
+            id=i,
+            name=f"와플스튜디오 채널 {i}",
+            description="맛있는 서비스가 탄생하는 곳, 서울대학교 컴퓨터공학부 웹/앱 개발 동아리 와플스튜디오입니다!",
+            managers_id=1,
+            created_at=now,
+            updated_at=now,
+        )
+        channel.subscribers_count = random.randint(0, 1000)
+        channels.append(channel)
+    return ChannelSummarySerializer(
+        channels, many=True, context={"colors": {i: "#e8914f" for i in range(count)}}
+    ).data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--channels", type=int, default=500)
+    args = parser.parse_args()
+
+    setup()
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.core.renderers import FastJSONParser, FastJSONRenderer
+
+    payloads = {
+        f"{args.events} events": event_payload(args.events),
+        f"{args.channels} channels": channel_payload(args.channels),
+    }
+    pairs = {
+        "json": (JSONRenderer(), JSONParser()),
+        "orjson": (FastJSONRenderer(), FastJSONParser()),
+    }
+
+    for name, data in payloads.items():
+        body = JSONRenderer().render(data)
+        print(f"{name} ({len(body) / 1024:.1f}KiB)")
+        for label, (renderer, json_parser) in pairs.items():
+            render = per_call(lambda: renderer.render(data), number=20)
+            parse = per_call(lambda: json_parser.parse(io.BytesIO(body)), number=20)
+            print(
+                f"  {label:>6}: render {render * 1e3:7.2f}ms  parse {parse * 1e3:7.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
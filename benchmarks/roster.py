@@ -0,0 +1,92 @@
+"""
+# 구독자 명단 CSV의 메모리 사용량
+* 테스트 DB에 구독자 수가 다른 채널을 만들고, CSV를 끝까지 내려받는 동안의 최대 메모리(tracemalloc)를 비교
+* 나눠 읽는 `subscriber_csv_lines`와 한 번에 읽어 만드는 방식을 함께 측정
+
+```bash
+python -m benchmarks.roster --subscribers 1000 10000 50000
+```
+"""
+import argparse
+import csv
+import io
+import tracemalloc
+
+from benchmarks import setup
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--subscribers", type=int, nargs="+", default=[1000, 10000, 50000]
+    )
+    args = parser.parse_args()
+
+    setup()
+    from django.contrib.auth.hashers import make_password
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from apps.channel.exports import SUBSCRIBER_COLUMNS, subscriber_csv_lines
+    from apps.channel.models import Channel, UserChannel
+    from apps.user.models import User
+    from benchmarks.data import bulk_create
+
+    def stream(channel):
+        for _ in subscriber_csv_lines(channel):
+            pass
+
+    def at_once(channel):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([name for name, _ in SUBSCRIBER_COLUMNS])
+        writer.writerows(
+            UserChannel.objects.filter(channel=channel).values_list(
+                *[lookup for _, lookup in SUBSCRIBER_COLUMNS]
+            )
+        )
+        buffer.getvalue()
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        password = make_password("password")
+        user_ids = bulk_create(
+            User,
+            [
+                User(
+                    username=f"roster_user{i}",
+                    email=f"roster_user{i}@snu.ac.kr",
+                    password=password,
+                    first_name="와플",
+                    last_name="김",
+                )
+                for i in range(max(args.subscribers))
+            ],
+        )
+        for count in args.subscribers:
+            channel = Channel.objects.create(name=f"구독자 {count}명", description="")
+            UserChannel.objects.bulk_create(
+                [UserChannel(channel=channel, user_id=i) for i in user_ids[:count]],
+                batch_size=1000,
+            )
+            print(
+                f"{count:>7} subscribers: stream {peak_memory(lambda: stream(channel)) / 1024:8.0f}KiB  "
+                f"at once {peak_memory(lambda: at_once(channel)) / 1024:8.0f}KiB"
+            )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
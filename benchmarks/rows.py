@@ -0,0 +1,88 @@
+"""
+# ModelSerializer와 row 직렬화(`apps/*/rows.py`)의 처리량 비교
+* 테스트 DB에 `benchmarks.data`로 데이터를 만들고, 같은 queryset을 두 방식으로 직렬화해 초당 객체 수를 비교
+* 쿼리 시간도 포함한 값이며, 채널 목록은 기존 serializer가 채널마다 쿼리를 보내는 차이도 함께 드러남
+
+```bash
+python -m benchmarks.rows --limit 500
+```
+"""
+import argparse
+
+from benchmarks import per_call, setup
+from benchmarks.data import add_arguments
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=500, help="한 번에 직렬화할 객체 수")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    setup()
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from apps.channel.models import Channel
+    from apps.channel.rows import channel_rows
+    from apps.channel.serializers import ChannelSerializer
+    from apps.event.models import Event
+    from apps.event.rows import event_channel_name_rows
+    from apps.event.serializers import EventChannelNameSerializer
+    from apps.notice.models import Notice
+    from apps.notice.rows import notice_rows
+    from apps.notice.serializers import NoticeChannelNameSerializer
+    from apps.user.models import User
+    from benchmarks.data import USERNAME_PREFIX, generate
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        generate(args.users, args.channels, args.notices, args.events, args.seed)
+        request = Request(APIRequestFactory().get("/"))
+        request.user = User.objects.get(username=f"{USERNAME_PREFIX}0")
+        context = {"request": request}
+        limit = args.limit
+
+        cases = {
+            "channel": (
+                Channel.objects.order_by("-id")[:limit],
+                ChannelSerializer,
+                channel_rows,
+            ),
+            "notice": (
+                Notice.objects.select_related("channel", "writer").order_by("-id")[
+                    :limit
+                ],
+                NoticeChannelNameSerializer,
+                notice_rows,
+            ),
+            "event": (
+                Event.objects.select_related("channel").order_by("-id")[:limit],
+                EventChannelNameSerializer,
+                event_channel_name_rows,
+            ),
+        }
+
+        for name, (queryset, serializer_class, rows) in cases.items():
+            count = queryset.count()
+            serializer = count / per_call(
+                lambda: serializer_class(
+                    queryset.all(), many=True, context=context
+                ).data,
+                number=1,
+            )
+            row = count / per_call(lambda: rows(queryset.all(), context), number=1)
+            print(
+                f"{name:>12}: serializer {serializer:9.0f}/s  rows {row:9.0f}/s  "
+                f"x{row / serializer:.1f}"
+            )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+# 앱 사용 흐름을 따라 하는 시나리오 벤치마크
+* 로그인, 홈 화면 추천 채널, 월별 일정, 공지사항 피드, 최근 공지사항, 홈 화면 묶음, 채널 검색을 `benchmarks.data`로 만든 유저들로 반복 호출
+* 시나리오별 처리량(req/s), 응답 시간 백분위, 요청당 쿼리 수, 응답 크기를 JSON으로 저장해 커밋 사이에 비교
+* `inprocess`: 테스트 DB를 만들고 데이터를 생성한 뒤 Django test client로 호출, 쿼리 수도 셈
+* `live`: 실행 중인 서버를 여러 스레드로 호출, 서버 DB에 미리 `python -m benchmarks.data`로 데이터를 넣어야 함
+
+```bash
+python -m benchmarks.scenarios inprocess --output before.json
+python -m benchmarks.scenarios inprocess --output after.json --compare before.json
+python -m benchmarks.scenarios live --base-url http://localhost:8000 --concurrency 16
+```
+"""
+import argparse
+import json
+import random
+import statistics
+import subprocess
+import threading
+import time
+from datetime import date, datetime
+
+from benchmarks import BASE_DIR, percentile, setup
+from benchmarks.data import PASSWORD, USERNAME_PREFIX, WORDS, add_arguments
+
+
+def login(ctx):
+    return (
+        "post",
+        "/api/v1/users/login/",
+        {
+            "username": ctx["username"],
+            "password": PASSWORD,
+        },
+    )
+
+
+def recommend(ctx):
+    return "get", "/api/v1/channels/recommend/", None
+
+
+def month_events(ctx):
+    return "get", f"/api/v1/users/me/events/?month={date.today():%Y-%m}", None
+
+
+def month_events_compact(ctx):
+    return (
+        "get",
+        f"/api/v1/users/me/events/?month={date.today():%Y-%m}&view=compact",
+        None,
+    )
+
+
+def notices(ctx):
+    return "get", "/api/v1/users/me/notices/", None
+
+
+def recent_notices(ctx):
+    return "get", "/api/v1/users/me/notices/recent/", None
+
+
+def home(ctx):
+    return "get", f"/api/v1/channels/home/?month={date.today():%Y-%m}", None
+
+
+def search(ctx):
+    return "get", f"/api/v1/channels/search/?type=all&q={ctx['keyword']}", None
+
+
+SCENARIOS = {
+    "login": login,
+    "recommend": recommend,
+    "month_events": month_events,
+    "month_events_compact": month_events_compact,
+    "notices": notices,
+    "recent_notices": recent_notices,
+    "home": home,
+    "search": search,
+}
+
+
+class InProcessClient:
+    """
+    # Django test client로 요청하고, 모든 DB alias에서 실행된 쿼리 수를 함께 반환
+    """
+
+    def __init__(self):
+        from django.test import Client
+
+        self.client = Client()
+
+    def login(self, username):
+        response = self.client.post(
+            "/api/v1/users/login/",
+            {"username": username, "password": PASSWORD},
+            content_type="application/json",
+        )
+        return response.json()["access"]
+
+    def request(self, method, path, data, token):
+        from django.db import connections
+        from django.test.utils import CaptureQueriesContext
+
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+        contexts = []
+        for conn in connections.all():
+            # 로그가 `queries_log`의 최대 길이를 넘으면 쿼리 수를 셀 수 없으므로 매번 비움
+            conn.queries_log.clear()
+            contexts.append(CaptureQueriesContext(conn))
+            contexts[-1].__enter__()
+        started = time.perf_counter()
+        try:
+            response = getattr(self.client, method)(
+                path, data, content_type="application/json", **headers
+            )
+        finally:
+            elapsed = time.perf_counter() - started
+            for context in contexts:
+                context.__exit__(None, None, None)
+        queries = sum(len(c) for c in contexts)
+        return response.status_code, elapsed, queries, len(response.content)
+
+
+class LiveClient:
+    """
+    # 실행 중인 서버에 requests로 요청, 쿼리 수는 알 수 없으므로 `None`
+    """
+
+    def __init__(self, base_url):
+        import requests
+
+        self.base_url = base_url
+        self.local = threading.local()
+        self.requests = requests
+
+    @property
+    def session(self):
+        if not hasattr(self.local, "session"):
+            self.local.session = self.requests.Session()
+        return self.local.session
+
+    def login(self, username):
+        response = self.session.post(
+            f"{self.base_url}/api/v1/users/login/",
+            json={"username": username, "password": PASSWORD},
+        )
+        response.raise_for_status()
+        return response.json()["access"]
+
+    def request(self, method, path, data, token):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        started = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, self.base_url + path, json=data, headers=headers
+            )
+            status_code, size = response.status_code, len(response.content)
+        except self.requests.RequestException:
+            status_code, size = None, 0
+        return status_code, time.perf_counter() - started, None, size
+
+
+def run_scenario(client, scenario, users, iterations, concurrency, seed):
+    """
+    # 시나리오 하나를 `iterations`번 호출하고 결과를 요약
+    * 매 호출마다 로그인해 둔 유저 중 하나와 검색어를 무작위로 고름
+    """
+    rng = random.Random(seed)
+    calls = [
+        {"user": rng.choice(users), "keyword": rng.choice(WORDS)}
+        for _ in range(iterations)
+    ]
+    latencies, queries, sizes, errors = [], [], [], 0
+    lock = threading.Lock()
+
+    def call(ctx):
+        nonlocal errors
+        username, token = ctx["user"]
+        method, path, data = scenario(dict(ctx, username=username))
+        status_code, elapsed, query_count, size = client.request(
+            method, path, data, token
+        )
+        with lock:
+            if status_code is None or status_code >= 400:
+                errors += 1
+            else:
+                latencies.append(elapsed)
+                sizes.append(size)
+                if query_count is not None:
+                    queries.append(query_count)
+
+    def work(chunk):
+        for ctx in chunk:
+            call(ctx)
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=work, args=(calls[i::concurrency],))
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / duration,
+        "mean_ms": statistics.mean(latencies) * 1000 if latencies else None,
+        "p50_ms": (percentile(latencies, 0.5) or 0) * 1000,
+        "p95_ms": (percentile(latencies, 0.95) or 0) * 1000,
+        "p99_ms": (percentile(latencies, 0.99) or 0) * 1000,
+        "queries_mean": statistics.mean(queries) if queries else None,
+        "queries_max": max(queries) if queries else None,
+        "bytes_mean": statistics.mean(sizes) if sizes else None,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(client, names, args):
+    rng = random.Random(args.seed)
+    usernames = [
+        f"{USERNAME_PREFIX}{i}" for i in rng.sample(range(args.users), args.sample)
+    ]
+    users = [(username, client.login(username)) for username in usernames]
+
+    scenarios = {}
+    for name in names:
+        # 첫 호출의 import, 캐시 준비 비용이 결과에 섞이지 않도록 몇 번 먼저 호출
+        run_scenario(client, SCENARIOS[name], users, 5, 1, args.seed)
+        scenarios[name] = run_scenario(
+            client,
+            SCENARIOS[name],
+            users,
+            args.iterations,
+            args.concurrency,
+            args.seed,
+        )
+    return scenarios
+
+
+def print_report(report, baseline=None):
+    for name, row in report["scenarios"].items():
+        queries = "" if row["queries_mean"] is None else f"{row['queries_mean']:5.1f}q"
+        line = (
+            f"{name:>20}: {row['rps']:8.1f} req/s  p50 {row['p50_ms']:7.1f}ms  "
+            f"p95 {row['p95_ms']:7.1f}ms  p99 {row['p99_ms']:7.1f}ms  "
+            f"errors {row['errors']:4d}  {queries}"
+        )
+        if row.get("bytes_mean") is not None:
+            line += f" {row['bytes_mean'] / 1024:7.1f}KiB"
+        before = (baseline or {}).get("scenarios", {}).get(name)
+        if before and before["p50_ms"]:
+            line += f"  p50 {row['p50_ms'] / before['p50_ms'] - 1:+.0%}"
+            if before["queries_mean"] is not None and row["queries_mean"] is not None:
+                line += f", queries {row['queries_mean'] - before['queries_mean']:+.1f}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("mode", choices=("inprocess", "live"))
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--sample", type=int, default=50, help="로그인해 쓸 유저 수")
+    parser.add_argument("--output", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    add_arguments(parser)
+    args = parser.parse_args()
+    args.sample = min(args.sample, args.users)
+    names = args.scenario or list(SCENARIOS)
+
+    setup()
+    from django.conf import settings
+
+    report = {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "mode": args.mode,
+        "settings": settings.SETTINGS_MODULE,
+        "data": None,
+        "iterations": args.iterations,
+        "concurrency": args.concurrency,
+    }
+
+    if args.mode == "inprocess":
+        from django.db import connection
+        from django.test.utils import setup_test_environment
+
+        from benchmarks.data import generate
+
+        # test client는 스레드 사이에 DB 연결을 공유하지 않으므로 순서대로 호출
+        args.concurrency = report["concurrency"] = 1
+        setup_test_environment()
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0)
+        try:
+            report["data"] = generate(
+                args.users, args.channels, args.notices, args.events, args.seed
+            )
+            report["scenarios"] = run(InProcessClient(), names, args)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+    else:
+        report["scenarios"] = run(LiveClient(args.base_url), names, args)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
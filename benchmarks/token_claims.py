@@ -0,0 +1,53 @@
+"""
+# 구독 채널 claim 인코딩/디코딩 비용 측정
+* 채널 수에 따른 claim 크기, 인코딩/디코딩 시간, access token 크기와 검증 시간을 출력
+* access token에는 로그인할 때 발급하는 것과 같은 claim(유저 claim, 토큰 버전, 구독 채널 claim과 그 버전)을 넣음
+"""
+import random
+
+from benchmarks import per_call, setup
+
+setup()
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.channel.claims import (
+    SUBSCRIBED_CLAIM,
+    VERSION_CLAIM,
+    decode_ids,
+    encode_ids,
+)
+from apps.user.tokens import TOKEN_VERSION_CLAIM
+
+SIZES = (0, 10, 50, 100, 500)
+
+
+def main():
+    print(
+        f"{'ids':>5} {'claim(B)':>9} {'encode(us)':>11} {'decode(us)':>11} "
+        f"{'token(B)':>9} {'verify(us)':>11}"
+    )
+    for size in SIZES:
+        ids = random.sample(range(1, 50000), size)
+        claim = encode_ids(ids)
+
+        token = AccessToken()
+        token["user_id"] = 1
+        token["username"] = "waffle"
+        token[TOKEN_VERSION_CLAIM] = 0
+        token[SUBSCRIBED_CLAIM] = claim
+        # 구독 claim 버전은 `User.channel_claims_version`의 정수 값
+        token[VERSION_CLAIM] = 0
+        encoded = str(token)
+
+        print(
+            f"{size:>5} {len(claim):>9} "
+            f"{per_call(lambda: encode_ids(ids)) * 1e6:>11.2f} "
+            f"{per_call(lambda: decode_ids(claim)) * 1e6:>11.2f} "
+            f"{len(encoded):>9} "
+            f"{per_call(lambda: AccessToken(encoded)) * 1e6:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+# username 검색 비교
+* 테스트 DB에 유저 N명(기본 10만 명)을 만들고 `users/search/`의 검색 방식별로 한 번 검색하는 시간을 비교
+  * `icontains+exists`: 이전 방식, `exists()`와 결과를 따로 읽고 유저마다 개인 채널을 찾음
+  * `icontains`: 기본 검색, 쿼리 하나
+  * `prefix`: 자동완성, username index를 타는 앞부분 검색 (캐시 없이)
+  * `prefix cached`: 같은 검색어를 다시 검색
+* 결과가 많은 검색어, 한 명만 나오는 검색어, 결과가 없는 검색어로 각각 측정하고 실행 계획도 출력
+* SQLite는 `LIKE`로 index 범위를 찾지 못해(`NOCASE` collation이 아님) index 전체를 훑으므로,
+  index 범위 검색은 MySQL에서 확인해야 함
+
+```bash
+python -m benchmarks.user_search --users 100000
+```
+"""
+import argparse
+import random
+
+from benchmarks import per_call, setup
+from benchmarks.data import WORDS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup()
+    from django.contrib.auth.hashers import make_password
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from apps.user.models import User
+    from apps.user.rows import user_rows
+    from apps.user.serializers import UserSerializer
+    from apps.user.views import USER_SEARCH_LIMIT, search_username_prefix
+    from benchmarks.data import bulk_create
+
+    def old_search(keyword):
+        qs = User.objects.filter(username__icontains=keyword)[:USER_SEARCH_LIMIT]
+        if qs.exists():
+            return UserSerializer(qs, many=True).data
+
+    def contains_search(keyword):
+        qs = User.objects.filter(username__icontains=keyword)
+        return user_rows(qs[:USER_SEARCH_LIMIT])
+
+    def prefix_search(keyword):
+        cache.clear()
+        return search_username_prefix(keyword)
+
+    def explain(queryset):
+        sql, params = queryset.query.sql_with_params()
+        prefix = connection.ops.explain_query_prefix()
+        with connection.cursor() as cursor:
+            cursor.execute(f"{prefix} {sql}", params)
+            return "\n".join(f"    {row}" for row in cursor.fetchall())
+
+    rng = random.Random(args.seed)
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        password = make_password("password")
+        bulk_create(
+            User,
+            [
+                User(
+                    username=f"{rng.choice(WORDS)}{i}",
+                    email=f"search_user{i}@snu.ac.kr",
+                    password=password,
+                )
+                for i in range(args.users)
+            ],
+        )
+        username = User.objects.order_by("?").values_list("username", flat=True)[0]
+        keywords = {"common": username[:3], "rare": username, "missing": "zz"}
+        print(f"{args.users} users")
+
+        for label, keyword in keywords.items():
+            contains = User.objects.filter(username__icontains=keyword)
+            prefix = User.objects.filter(username__istartswith=keyword).order_by(
+                "username"
+            )
+            print(f"{label} keyword {keyword!r}")
+            print(f"  icontains plan:\n{explain(contains[:USER_SEARCH_LIMIT])}")
+            print(f"  prefix plan:\n{explain(prefix[:USER_SEARCH_LIMIT])}")
+
+            cases = {
+                "icontains+exists": lambda: old_search(keyword),
+                "icontains": lambda: contains_search(keyword),
+                "prefix": lambda: prefix_search(keyword),
+                "prefix cached": lambda: search_username_prefix(keyword),
+            }
+            for name, func in cases.items():
+                print(f"  {name:>16}: {per_call(func, number=20) * 1e3:8.3f}ms")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
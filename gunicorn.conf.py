@@ -0,0 +1,64 @@
+"""
+# gunicorn 설정
+* `gunicorn -c gunicorn.conf.py`로 실행
+* `SERVER_MODE=wsgi`(기본값)이면 `apps/core/wsgi.py`를 gthread(또는 sync) worker로,
+  `SERVER_MODE=asgi`면 `apps/core/asgi.py`를 uvicorn worker로 띄움
+* worker 수는 `WEB_CONCURRENCY`로 정할 수 있고, 없으면 CPU 수로 정함
+* 토큰 denylist, 토큰 버전, replica pin 등은 캐시에 있으므로 worker끼리 같은 값을 보려면
+  공유 캐시(`REDIS_URL`)가 필요함. 없으면 프로세스 안의 캐시를 쓰므로 worker를 하나만 띄움
+* 프로세스 메모리에 두는 채널 이름 자동완성 index(apps/channel/name_index.py)는 worker마다 따로 가짐
+  * fork 전에는 만들지 않고 worker에서 처음 검색할 때 만듦
+  * 다른 worker에서 바뀐 채널은 `CHANNEL_NAME_INDEX_REFRESH`초 안에 반영됨
+"""
+import gc
+import multiprocessing
+import os
+
+server_mode = os.environ.get("SERVER_MODE", "wsgi")
+cpu_count = multiprocessing.cpu_count()
+shared_cache = bool(os.environ.get("REDIS_URL"))
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+
+if server_mode == "asgi":
+    wsgi_app = "apps.core.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+    # 이 앱의 view는 모두 동기 함수이고, Django 3.1은 ASGI에서도 동기 view를 프로세스마다
+    # 한 thread에서 하나씩 실행함. 동시에 처리하는 요청 수가 worker 수와 같으므로 sync worker만큼 띄움
+    workers = int(os.environ.get("WEB_CONCURRENCY", cpu_count * 2 + 1))
+else:
+    wsgi_app = "apps.core.wsgi:application"
+    worker_class = os.environ.get("WORKER_CLASS", "gthread")
+    threads = int(os.environ.get("THREADS", 4))
+    workers = int(os.environ.get("WEB_CONCURRENCY", cpu_count * 2 + 1))
+
+requested_workers = workers
+if not shared_cache:
+    workers = 1
+
+# master에서 Django를 미리 불러온 뒤 fork해서, worker들이 copy-on-write로 메모리를 공유함
+preload_app = True
+
+timeout = int(os.environ.get("TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", 30))
+keepalive = 5
+
+# 메모리 누수에 대비해 일정 요청 수마다 worker를 교체함
+max_requests = int(os.environ.get("MAX_REQUESTS", 1000))
+max_requests_jitter = max_requests // 10
+
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    if workers < requested_workers:
+        server.log.warning(
+            "REDIS_URL이 없어 프로세스 안의 캐시를 쓰므로 worker를 %d개 대신 1개만 띄웁니다.",
+            requested_workers,
+        )
+
+
+def when_ready(server):
+    # fork 전에 불러온 객체들을 GC 대상에서 빼서, GC가 페이지를 건드려 복사되는 것을 막음
+    gc.freeze()
@@ -22,7 +22,7 @@ INSTALLED_APPS = [
     "rest_framework",
     "drf_yasg",
     "storages",
-    "debug_toolbar",
+    "apps.core",
     "apps.user",
     "apps.channel",
     "apps.notice",
@@ -32,6 +32,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "apps.core.profiling.ProfilingMiddleware",
+    "apps.core.slow_query.SlowQueryMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -39,21 +41,51 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
     "corsheaders.middleware.CorsMiddleware",
-]
-
-INTERNAL_IPS = [
-    "127.0.0.1",
+    "apps.core.db.ReplicaRoutingMiddleware",
 ]
 
 ROOT_URLCONF = "apps.urls"
 
+# 요청 프로파일링 (apps/core/profiling.py). 0이면 끔
+PROFILING_SAMPLE_RATE = float(os.environ.get("PROFILING_SAMPLE_RATE", 0))
+PROFILING_MAX_SAMPLES = 1000
+
+# 느린 쿼리 로그 (apps/core/slow_query.py). 0이면 끔
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", 0))
+SLOW_QUERY_EXPLAIN = True
+SLOW_QUERY_LOG_INTERVAL = 300
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "apps.slow_query": {
+            "handlers": ["console"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+    },
+}
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.user.authentication.StatelessJWTAuthentication",
     ),
     "DEFAULT_PAGINATION_CLASS": "apps.core.paginator.IDCursorPagination",
+    # orjson으로 JSON을 처리함 (apps/core/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "apps.core.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 SIMPLE_JWT = {
@@ -69,6 +101,44 @@ SIMPLE_JWT = {
     "JTI_CLAIM": "jti",
 }
 
+# 캐시
+# * 토큰 denylist, replica pin, 구독 claim 버전 등 모든 worker가 같은 값을 봐야 하는 상태가 들어가므로,
+#   운영에서는 REDIS_URL(redis://host:6379/0)로 공유 캐시를 씀
+#   * denylist가 지워지지 않도록 Redis의 maxmemory-policy는 기본값(noeviction)으로 둠
+# * REDIS_URL이 없으면 프로세스 안의 메모리 캐시를 쓰며, 이때는 worker를 하나만 띄워야 함 (gunicorn.conf.py)
+#   * 기본 300개에서 지워지기 시작하면 denylist가 빠지므로 MAX_ENTRIES를 넉넉히 둠
+REDIS_URL = os.environ.get("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "OPTIONS": {"MAX_ENTRIES": 100000},
+        }
+    }
+
+# 유저별 토큰 버전(apps/user/versions.py)을 캐시에 두는 시간(초)
+USER_VERSION_CACHE_TIMEOUT = 300
+
+# access token에 구독 채널 id를 넣어 권한 확인 시 DB 조회를 줄임 (apps/channel/claims.py)
+CHANNEL_CLAIMS_ENABLED = True
+CHANNEL_CLAIMS_MAX_IDS = 500
+
+# 공개 채널 이름 자동완성 index를 DB에서 다시 만드는 주기(초) (apps/channel/name_index.py)
+CHANNEL_NAME_INDEX_REFRESH = 300
+
+# 일정 목록의 from, to로 한 번에 조회할 수 있는 최대 기간(일), 달력 여러 달을 한 번에 볼 수 있도록
+EVENT_RANGE_MAX_DAYS = 190
+
+# 유저 username 앞부분 검색(자동완성) 결과를 캐시하는 시간(초), 0이면 캐시하지 않음
+USER_SEARCH_CACHE_TIMEOUT = 30
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -87,17 +157,60 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "apps.core.wsgi.application"
 
-DATABASES = {
-    "default": {
+# DB 연결 재사용
+# * DB_CONN_MAX_AGE: 연결을 유지하는 시간(초). 0이면 요청마다 새로 연결
+# * DB_HEALTH_CHECK_INTERVAL: 이 시간(초) 이상 쉰 연결은 요청 시작 시 ping으로 확인 (apps/core/db.py)
+# * DB_POOL_HOST, DB_POOL_PORT: 외부 커넥션 풀(ProxySQL 등)을 쓰면 그쪽으로 연결하고, 연결 유지는 풀에 맡김
+# * DB_REPLICA_HOSTS: 쉼표로 구분한 읽기 전용 replica host 목록. GET 요청의 읽기를 replica로 보냄
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", 60))
+DB_HEALTH_CHECK_INTERVAL = int(os.environ.get("DB_HEALTH_CHECK_INTERVAL", 30))
+DB_POOL_HOST = os.environ.get("DB_POOL_HOST")
+DB_POOL_PORT = os.environ.get("DB_POOL_PORT")
+DB_REPLICA_HOSTS = [
+    host for host in os.environ.get("DB_REPLICA_HOSTS", "").split(",") if host
+]
+
+
+def mysql_database(name, host=None):
+    if host:
+        port = os.environ.get("DB_PORT")
+        conn_max_age = DB_CONN_MAX_AGE
+    elif DB_POOL_HOST:
+        host, port, conn_max_age = DB_POOL_HOST, DB_POOL_PORT, 0
+    else:
+        host = os.environ.get("DB_HOST", "localhost")
+        port = os.environ.get("DB_PORT")
+        conn_max_age = DB_CONN_MAX_AGE
+
+    return {
         "ENGINE": "django.db.backends.mysql",
-        "HOST": os.environ.get("DB_HOST", "localhost"),
-        "PORT": os.environ.get("DB_PORT"),
-        "NAME": os.environ.get("DB_NAME"),
+        "HOST": host,
+        "PORT": port,
+        "NAME": name,
         "USER": os.environ.get("DB_USERNAME"),
         "PASSWORD": os.environ.get("DB_PASSWORD"),
         "OPTIONS": {"charset": "utf8mb4"},
-    },
-}
+        "CONN_MAX_AGE": conn_max_age,
+    }
+
+
+def mysql_databases(name):
+    databases = {"default": mysql_database(name)}
+    for alias, host in zip(DATABASE_REPLICAS, DB_REPLICA_HOSTS):
+        databases[alias] = {
+            **mysql_database(name, host),
+            "TEST": {"MIRROR": "default"},
+        }
+    return databases
+
+
+# 읽기 전용 replica로의 라우팅 (apps/core/db.py)
+# * 쓰기 요청을 보낸 유저의 읽기는 REPLICA_PIN_SECONDS초 동안 primary로 보내 방금 쓴 내용을 바로 읽을 수 있게 함
+DATABASE_REPLICAS = [f"replica{i}" for i in range(1, len(DB_REPLICA_HOSTS) + 1)]
+DATABASE_ROUTERS = ["apps.core.db.PrimaryReplicaRouter"]
+REPLICA_PIN_SECONDS = 5
+
+DATABASES = mysql_databases(os.environ.get("DB_NAME"))
 
 AUTH_PASSWORD_VALIDATORS = [
     {
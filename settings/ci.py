@@ -10,3 +10,10 @@ DATABASES = {
         "PORT": "3306",
     },
 }
+
+# replica 라우팅 테스트에서 쿼리가 실제로 어느 DB로 가는지 확인하기 위한 DB (apps/core/tests.py)
+# DATABASE_REPLICAS는 비어 있으므로, 테스트가 직접 지정하기 전에는 이 DB로 라우팅되지 않음
+DATABASES["replica"] = {
+    "ENGINE": "django.db.backends.sqlite3",
+    "NAME": ":memory:",
+}
@@ -2,14 +2,17 @@ from settings.base import *
 
 DEBUG = True
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.mysql",
-        "HOST": os.environ.get("DB_HOST", "localhost"),
-        "PORT": os.environ.get("DB_PORT"),
-        "NAME": os.environ.get("DB_NAME") + "_dev",
-        "USER": os.environ.get("DB_USERNAME"),
-        "PASSWORD": os.environ.get("DB_PASSWORD"),
-        "OPTIONS": {"charset": "utf8mb4"},
-    },
-}
+# 개발 환경에서만 쓰는 앱과 미들웨어는 여기에 추가하고, base에는 넣지 않음
+INSTALLED_APPS = INSTALLED_APPS + [
+    "debug_toolbar",
+]
+
+MIDDLEWARE = MIDDLEWARE + [
+    "debug_toolbar.middleware.DebugToolbarMiddleware",
+]
+
+INTERNAL_IPS = [
+    "127.0.0.1",
+]
+
+DATABASES = mysql_databases(os.environ.get("DB_NAME") + "_dev")
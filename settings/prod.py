@@ -4,14 +4,4 @@ DEBUG = False
 
 ALLOWED_HOSTS = ["*"]
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.mysql",
-        "HOST": os.environ.get("DB_HOST", "localhost"),
-        "PORT": os.environ.get("DB_PORT"),
-        "NAME": os.environ.get("DB_NAME") + "_prod",
-        "USER": os.environ.get("DB_USERNAME"),
-        "PASSWORD": os.environ.get("DB_PASSWORD"),
-        "OPTIONS": {"charset": "utf8mb4"},
-    },
-}
+DATABASES = mysql_databases(os.environ.get("DB_NAME") + "_prod")